@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+"""Benchmark the vibe generation hot paths.
+
+Each benchmark reports its median and best throughput in operations per second over several rounds. Results are
+written as JSON and compared against a stored baseline by median; a benchmark that looks slower than the baseline by
+more than the allowed threshold is measured again, and reported if it is still slower. Throughput on a shared machine
+varies too much to fail on, so regressions only fail the run with --strict. A one-shot vibe that imports too much
+always fails it.
+"""
+
+import argparse
+import datetime
+import functools
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+import main
+from bsidespgh25.banner import BANNER_FONT
+from bsidespgh25.catalog import VibeCatalog, build_catalog
+from bsidespgh25.output import format_encoded_vibe, format_vibe
+from bsidespgh25.records import RECORD_FORMATS, RecordEncoder
+from bsidespgh25.vibe_generator import VibeGenerator
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+DEFAULT_THRESHOLD = 0.25
+CLI_VIBES = 20_000
+# Removed when the runner exits
+CATALOG_DIRECTORY = tempfile.TemporaryDirectory()
+MAIN = str(PROJECT_ROOT / "src" / "main.py")
+BANNER_TEXT = "SHELLCODE ROOTKIT SANDBOX FORENSIC AUDIT!"[:40]
+# Subprocesses may cache bytecode, as an installed package would, so CLI timings
+# measure start-up rather than compiling the sources on every run
+CLI_ENV = {
+    name: value
+    for name, value in os.environ.items()
+    if name != "PYTHONDONTWRITEBYTECODE"
+}
+
+# Cumulative import time allowed for a one-shot `main.py --vibe`, in microseconds
+STARTUP_IMPORT_BUDGET_US = 30_000
+# Runs of `-X importtime`; the fastest is checked against the budget
+STARTUP_IMPORT_RUNS = 5
+# Modules a one-shot vibe must never pay for
+STARTUP_FORBIDDEN_IMPORTS = (
+    "argparse",
+    "asyncio",
+    "concurrent.futures",
+    "json",
+    "logging",
+    "typing",
+)
+
+# Each benchmark runs its operation once and returns how many operations that was
+BENCHMARKS: dict[str, Callable[[VibeGenerator], int]] = {}
+
+
+def benchmark(name: str) -> Callable:
+    """Register a benchmark under a name."""
+
+    def register(
+        func: Callable[[VibeGenerator], int],
+    ) -> Callable[[VibeGenerator], int]:
+        BENCHMARKS[name] = func
+        return func
+
+    return register
+
+
+for _width, _height in [(40, 10), (120, 40), (300, 80)]:
+
+    def _matrix(
+        vibe_gen: VibeGenerator, width: int = _width, height: int = _height
+    ) -> int:
+        vibe_gen.generate_cyber_matrix(width, height)
+        return 1
+
+    benchmark(f"generate_cyber_matrix_{_width}x{_height}")(_matrix)
+
+
+@benchmark("generate_cyber_matrix_batch_100x40x10")
+def _matrix_batch(vibe_gen: VibeGenerator) -> int:
+    vibe_gen.generate_cyber_matrix_batch(100, 40, 10)
+    return 100
+
+
+@benchmark("generate_word_art")
+def _word_art(vibe_gen: VibeGenerator) -> int:
+    vibe_gen.generate_word_art()
+    return 1
+
+
+@benchmark("generate_banner")
+def _banner(vibe_gen: VibeGenerator) -> int:
+    vibe_gen.generate_banner()
+    return 1
+
+
+@benchmark("render_banner_40_chars_uncached")
+def _banner_uncached(vibe_gen: VibeGenerator) -> int:
+    BANNER_FONT.render.__wrapped__(BANNER_TEXT)
+    return 1
+
+
+@benchmark("generate_full_vibe")
+def _full_vibe(vibe_gen: VibeGenerator) -> int:
+    vibe_gen.generate_full_vibe()
+    return 1
+
+
+for _vibe_type in ["pattern", "matrix", "word", "random"]:
+
+    def _dispatch(vibe_gen: VibeGenerator, vibe_type: str = _vibe_type) -> int:
+        main.generate_vibe(vibe_gen, vibe_type)
+        return 1
+
+    benchmark(f"generate_vibe_{_vibe_type}")(_dispatch)
+
+
+@functools.cache
+def catalog() -> VibeCatalog:
+    """Build a default-sized catalog the first time it is needed."""
+    path = Path(CATALOG_DIRECTORY.name) / "benchmark.catalog"
+    build_catalog(path)
+    return VibeCatalog(path)
+
+
+@benchmark("iter_frames_1000")
+def _iter_frames(vibe_gen: VibeGenerator) -> int:
+    vibe_gen.catalog = catalog()
+    for _ in vibe_gen.iter_frames(1000):
+        pass
+    return 1000
+
+
+@benchmark("iter_vibes_1000")
+def _iter_vibes(vibe_gen: VibeGenerator) -> int:
+    for _ in vibe_gen.iter_vibes(1000):
+        pass
+    return 1000
+
+
+# The bulk and continuous output paths, formatting and encoding text per vibe
+# next to writing vibes generated already encoded
+@benchmark("write_bulk_1000_str")
+def _bulk_str(vibe_gen: VibeGenerator) -> int:
+    for art, message in vibe_gen.iter_vibes(1000):
+        format_vibe(art, message).encode("utf-8")
+    return 1000
+
+
+@benchmark("write_bulk_1000_encoded")
+def _bulk_encoded(vibe_gen: VibeGenerator) -> int:
+    for art, message in vibe_gen.iter_encoded_vibes(1000):
+        format_encoded_vibe(art, message)
+    return 1000
+
+
+@benchmark("write_continuous_str")
+def _continuous_str(vibe_gen: VibeGenerator) -> int:
+    art, message = main.generate_vibe(vibe_gen, "random")
+    format_vibe(art, message).encode("utf-8")
+    return 1
+
+
+@benchmark("write_continuous_encoded")
+def _continuous_encoded(vibe_gen: VibeGenerator) -> int:
+    format_encoded_vibe(*vibe_gen.generate_encoded_vibe())
+    return 1
+
+
+for _record_format in RECORD_FORMATS:
+
+    def _records(vibe_gen: VibeGenerator, record_format: str = _record_format) -> int:
+        encoder = RecordEncoder(record_format)
+        for vibe in vibe_gen.iter_typed_vibes(1000):
+            encoder.encode_vibe(*vibe)
+        return 1000
+
+    benchmark(f"encode_records_1000_{_record_format}")(_records)
+
+
+@benchmark(f"cli_count_{CLI_VIBES}")
+def _cli(vibe_gen: VibeGenerator) -> int:
+    subprocess.run(
+        [sys.executable, MAIN, "--vibe", "--count", str(CLI_VIBES)],
+        check=True,
+        stdout=subprocess.DEVNULL,
+        env=CLI_ENV,
+    )
+    return CLI_VIBES
+
+
+@benchmark("cli_startup")
+def _cli_startup(vibe_gen: VibeGenerator) -> int:
+    subprocess.run(
+        [sys.executable, MAIN, "--vibe"],
+        check=True,
+        stdout=subprocess.DEVNULL,
+        env=CLI_ENV,
+    )
+    return 1
+
+
+def import_times(argv: list[str]) -> list[tuple[str, int, int]]:
+    """Measure what a command line imports with ``-X importtime``.
+
+    Args:
+        argv: Arguments to main.py.
+
+    Returns:
+        Tuples of (module, nesting depth, cumulative import time in microseconds).
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", MAIN, *argv],
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        env=CLI_ENV,
+    )
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.removeprefix("import time:").split("|")
+        name = module.lstrip()
+        # Each level of nesting is indented by two more spaces
+        depth = (len(module) - len(name) - 1) // 2
+        times.append((name.strip(), depth, int(cumulative)))
+    return times
+
+
+def check_startup(budget: int, runs: int = STARTUP_IMPORT_RUNS) -> list[str]:
+    """Check the imports of a one-shot vibe against the startup budget.
+
+    Interpreter start-up (site and encodings) is excluded since no change here can
+    affect it. Import times vary from run to run, so the fastest of several runs
+    is checked.
+
+    Args:
+        budget: Allowed cumulative import time in microseconds.
+        runs: Number of one-shot invocations to time.
+
+    Returns:
+        A description of each violation.
+    """
+    imported = set()
+    first_party = None
+    for _ in range(runs):
+        times = import_times(["--vibe"])
+        imported.update(module for module, _, _ in times)
+        # A top-level import's cumulative time includes everything it imported
+        total = sum(
+            cumulative
+            for module, depth, cumulative in times
+            if depth == 0 and module.startswith("bsidespgh25")
+        )
+        first_party = total if first_party is None else min(first_party, total)
+    violations = [
+        f"startup imports {module}"
+        for module in STARTUP_FORBIDDEN_IMPORTS
+        if module in imported
+    ]
+    print(f"startup_imports: {first_party:,} us", file=sys.stderr)
+    if first_party > budget:
+        violations.append(
+            f"startup imports took {first_party:,} us, over the budget of {budget:,} us"
+        )
+    return violations
+
+
+def measure(func: Callable[[VibeGenerator], int], min_time: float, repeat: int) -> dict:
+    """Measure the throughput of a benchmark over several rounds.
+
+    Args:
+        func: The benchmark to run.
+        min_time: Minimum duration of each round in seconds.
+        repeat: Number of rounds.
+
+    Returns:
+        Dictionary with the median and best operations per second across rounds,
+        and the operations in the last round.
+    """
+    vibe_gen = VibeGenerator(seed=0)
+    rates = []
+    operations = 0
+    for _ in range(repeat):
+        operations = 0
+        start = time.perf_counter()
+        elapsed = 0.0
+        while elapsed < min_time:
+            operations += func(vibe_gen)
+            elapsed = time.perf_counter() - start
+        rates.append(operations / elapsed)
+
+    return {
+        "ops_per_second": round(statistics.median(rates), 2),
+        "best_ops_per_second": round(max(rates), 2),
+        "operations": operations,
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> dict[str, str]:
+    """Find benchmarks that regressed against the baseline.
+
+    Args:
+        results: Benchmark results keyed by name.
+        baseline: Baseline results keyed by name.
+        threshold: Allowed fractional drop in throughput.
+
+    Returns:
+        A description of each regression, keyed by benchmark name.
+    """
+    regressions = {}
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        expected = baseline[name]["ops_per_second"]
+        actual = result["ops_per_second"]
+        if actual < expected * (1 - threshold):
+            regressions[name] = (
+                f"{name}: {actual:,.2f} ops/s is {1 - actual / expected:.0%} below the baseline of {expected:,.2f} ops/s"
+            )
+    return regressions
+
+
+def main_cli() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the vibe generation hot paths"
+    )
+    parser.add_argument(
+        "--filter",
+        default="",
+        help="Only run benchmarks whose name contains this string",
+    )
+    parser.add_argument(
+        "--output", type=Path, help="Write the JSON results to this file"
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=DEFAULT_BASELINE,
+        help="Baseline results to compare against",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Allowed fractional throughput drop before failing (default: {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Fail when a benchmark regresses, not just report it",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store these results as the new baseline",
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.2,
+        help="Minimum seconds per round (default: 0.2)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Rounds per benchmark (default: 5)"
+    )
+    parser.add_argument(
+        "--startup-budget",
+        type=int,
+        default=STARTUP_IMPORT_BUDGET_US,
+        help="Allowed import time of a one-shot vibe in microseconds "
+        f"(default: {STARTUP_IMPORT_BUDGET_US})",
+    )
+    args = parser.parse_args()
+
+    results = {}
+    for name, func in BENCHMARKS.items():
+        if args.filter not in name:
+            continue
+        results[name] = measure(func, args.min_time, args.repeat)
+        print(f"{name}: {results[name]['ops_per_second']:,.2f} ops/s", file=sys.stderr)
+
+    report = {
+        "timestamp": datetime.datetime.now(datetime.UTC).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    else:
+        print(output)
+
+    if args.update_baseline:
+        args.baseline.write_text(output + "\n")
+        print(f"Updated the baseline in {args.baseline}", file=sys.stderr)
+        return 0
+
+    if not args.baseline.exists():
+        print(
+            f"No baseline found at {args.baseline}; skipping the comparison",
+            file=sys.stderr,
+        )
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())["results"]
+    suspects = compare(results, baseline, args.threshold)
+    # Measure apparent regressions again so one noisy run isn't reported
+    retried = {}
+    for name in suspects:
+        print(f"{name}: measuring again", file=sys.stderr)
+        retried[name] = measure(BENCHMARKS[name], args.min_time, args.repeat)
+    regressions = list(compare(retried, baseline, args.threshold).values())
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    violations = (
+        check_startup(args.startup_budget) if args.filter in "cli_startup" else []
+    )
+    for violation in violations:
+        print(f"STARTUP {violation}", file=sys.stderr)
+    return 1 if violations or (args.strict and regressions) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_cli())
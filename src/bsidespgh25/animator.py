@@ -0,0 +1,179 @@
+"""
+Incremental matrix animation for continuous mode.
+"""
+
+import random
+
+from bsidespgh25.frame import Frame, GlyphTable
+from bsidespgh25.vibe_generator import VibeGenerator
+
+CLEAR_SCREEN = "\x1b[2J"
+HIDE_CURSOR = "\x1b[?25l"
+SHOW_CURSOR = "\x1b[?25h"
+
+# Approximate size of a cursor positioning escape, used to decide when
+# rewriting a whole row is cheaper than positioning on individual runs
+_ESCAPE_COST = 8
+
+
+def move_cursor(row: int, column: int) -> str:
+    """Build an ANSI cursor positioning escape.
+
+    Args:
+        row: Zero-based terminal row.
+        column: Zero-based terminal column.
+
+    Returns:
+        The escape sequence moving the cursor to the given cell.
+    """
+    return f"\x1b[{row + 1};{column + 1}H"
+
+
+class MatrixAnimator:
+    """Animate a matrix frame by redrawing only the cells that change.
+
+    The cells are kept as glyph indices, each tick is captured as a
+    ``Frame``, and only the runs ``Frame.diff()`` finds against the previous
+    tick are redrawn.
+    """
+
+    MODES = ("mutate", "rain")
+
+    def __init__(
+        self,
+        width: int = 40,
+        height: int = 10,
+        mutation_rate: float = 0.1,
+        mode: str = "mutate",
+        chars: str = VibeGenerator.MATRIX_CHARS,
+        rng: random.Random | None = None,
+        top: int = 0,
+    ):
+        """Initialize the animator with a random starting frame.
+
+        Args:
+            width: Width of the matrix.
+            height: Height of the matrix.
+            mutation_rate: Fraction of cells (mutate) or columns (rain) changed per tick.
+            mode: Either "mutate" to change random cells or "rain" to scroll random columns down.
+            chars: Glyphs to draw from.
+            rng: Random number generator to use.
+            top: Terminal row where the matrix is drawn.
+
+        Raises:
+            ValueError: If an argument is out of range.
+        """
+        if width <= 0 or height <= 0:
+            raise ValueError("width and height must be positive")
+        if not 0.0 <= mutation_rate <= 1.0:
+            raise ValueError("mutation_rate must be between 0.0 and 1.0")
+        if mode not in self.MODES:
+            raise ValueError(f"mode must be one of {', '.join(self.MODES)}")
+
+        self.width = width
+        self.height = height
+        self.mutation_rate = mutation_rate
+        self.mode = mode
+        self.chars = chars
+        self.top = top
+        self.ticks = 0
+        self._rng = rng if rng is not None else random.Random()
+        self.table = GlyphTable(chars)
+        # Glyph indices laid out as a frame, changed in place every tick
+        glyph_count = len(chars)
+        self._cells = bytearray(self._rng.choices(range(glyph_count), k=width * height))
+        newline = bytes([self.table.newline])
+        stride = width + 1
+        for row in range(1, height):
+            self._cells[row * stride - 1 : row * stride - 1] = newline
+        self._frame = self._snapshot()
+
+    @property
+    def frame(self) -> str:
+        """The current frame as plain text."""
+        return str(self._frame)
+
+    def render_full(self) -> str:
+        """Render the whole frame, clearing the screen first.
+
+        Returns:
+            Escape sequences and glyphs that draw the full frame.
+        """
+        parts = [CLEAR_SCREEN, HIDE_CURSOR]
+        for index, row in enumerate(str(self._frame).split("\n")):
+            parts.append(move_cursor(self.top + index, 0))
+            parts.append(row)
+        return "".join(parts)
+
+    def tick(self) -> str:
+        """Advance the animation by one step.
+
+        Returns:
+            Escape sequences and glyphs that redraw only the changed cells.
+        """
+        self.ticks += 1
+        if self.mode == "rain":
+            self._rain()
+        else:
+            self._mutate()
+        previous, self._frame = self._frame, self._snapshot()
+        return self._render_runs(self._frame.diff(previous))
+
+    def park_cursor(self) -> str:
+        """Move the cursor below the matrix and show it again.
+
+        Returns:
+            Escape sequences restoring the cursor.
+        """
+        return move_cursor(self.top + self.height, 0) + SHOW_CURSOR
+
+    def _snapshot(self) -> Frame:
+        """Capture the cells as a frame."""
+        return Frame(bytes(self._cells), self.width, self.height, self.table)
+
+    def _mutate(self) -> None:
+        """Replace a random fraction of cells with new glyphs."""
+        cells = self.width * self.height
+        count = round(cells * self.mutation_rate)
+        if count == 0:
+            return
+
+        positions = self._rng.sample(range(cells), count)
+        glyphs = self._rng.choices(range(len(self.chars)), k=count)
+        width = self.width
+        for position, glyph in zip(positions, glyphs):
+            # Each row is followed by a newline cell
+            self._cells[position + position // width] = glyph
+
+    def _rain(self) -> None:
+        """Scroll a random fraction of columns down by one cell."""
+        count = round(self.width * self.mutation_rate)
+        if count == 0:
+            return
+
+        columns = self._rng.sample(range(self.width), count)
+        glyphs = self._rng.choices(range(len(self.chars)), k=count)
+        cells = self._cells
+        stride = self.width + 1
+        for column, glyph in zip(columns, glyphs):
+            cells[column::stride] = bytes([glyph]) + cells[column::stride][:-1]
+
+    def _render_runs(self, runs: list[tuple[int, int, str]]) -> str:
+        """Render changed runs, rewriting whole rows where that is shorter."""
+        by_row: dict[int, list[tuple[int, str]]] = {}
+        for row, column, text in runs:
+            by_row.setdefault(row, []).append((column, text))
+
+        parts = []
+        rows = None
+        for row, row_runs in by_row.items():
+            cost = sum(_ESCAPE_COST + len(text) for _, text in row_runs)
+            if cost >= _ESCAPE_COST + self.width:
+                if rows is None:
+                    rows = str(self._frame).split("\n")
+                row_runs = [(0, rows[row])]
+
+            for column, text in row_runs:
+                parts.append(move_cursor(self.top + row, column))
+                parts.append(text)
+        return "".join(parts)
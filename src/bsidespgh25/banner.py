@@ -0,0 +1,146 @@
+"""
+Big-letter banners rendered from a glyph atlas.
+"""
+
+from collections.abc import Mapping
+from functools import lru_cache
+
+BANNER_CACHE_SIZE = 256
+# Characters without a glyph are drawn as this one
+FALLBACK = "?"
+
+# Each glyph is a row per "|", with "#" for filled cells and "." for empty ones
+GLYPHS = {
+    "A": ".###.|#...#|#####|#...#|#...#",
+    "B": "####.|#...#|####.|#...#|####.",
+    "C": ".####|#....|#....|#....|.####",
+    "D": "####.|#...#|#...#|#...#|####.",
+    "E": "#####|#....|####.|#....|#####",
+    "F": "#####|#....|####.|#....|#....",
+    "G": ".####|#....|#..##|#...#|.####",
+    "H": "#...#|#...#|#####|#...#|#...#",
+    "I": "###|.#.|.#.|.#.|###",
+    "J": "..###|...#.|...#.|#..#.|.##..",
+    "K": "#...#|#..#.|###..|#..#.|#...#",
+    "L": "#....|#....|#....|#....|#####",
+    "M": "#...#|##.##|#.#.#|#...#|#...#",
+    "N": "#...#|##..#|#.#.#|#..##|#...#",
+    "O": ".###.|#...#|#...#|#...#|.###.",
+    "P": "####.|#...#|####.|#....|#....",
+    "Q": ".###.|#...#|#.#.#|#..#.|.##.#",
+    "R": "####.|#...#|####.|#..#.|#...#",
+    "S": ".####|#....|.###.|....#|####.",
+    "T": "#####|..#..|..#..|..#..|..#..",
+    "U": "#...#|#...#|#...#|#...#|.###.",
+    "V": "#...#|#...#|#...#|.#.#.|..#..",
+    "W": "#...#|#...#|#.#.#|##.##|#...#",
+    "X": "#...#|.#.#.|..#..|.#.#.|#...#",
+    "Y": "#...#|.#.#.|..#..|..#..|..#..",
+    "Z": "#####|...#.|..#..|.#...|#####",
+    "0": ".###.|#..##|#.#.#|##..#|.###.",
+    "1": ".#.|##.|.#.|.#.|###",
+    "2": "####.|....#|.###.|#....|#####",
+    "3": "####.|....#|.###.|....#|####.",
+    "4": "#...#|#...#|#####|....#|....#",
+    "5": "#####|#....|####.|....#|####.",
+    "6": ".###.|#....|####.|#...#|.###.",
+    "7": "#####|....#|...#.|..#..|..#..",
+    "8": ".###.|#...#|.###.|#...#|.###.",
+    "9": ".###.|#...#|.####|....#|.###.",
+    " ": "...|...|...|...|...",
+    "!": "#|#|#|.|#",
+    "?": "###.|...#|.##.|....|.#..",
+    ".": ".|.|.|.|#",
+    ",": "..|..|..|.#|#.",
+    ":": ".|#|.|#|.",
+    "'": "#|#|.|.|.",
+    "-": "...|...|###|...|...",
+    "_": "....|....|....|....|####",
+    "/": "....#|...#.|..#..|.#...|#....",
+    "#": ".#.#.|#####|.#.#.|#####|.#.#.",
+    "@": ".###.|#.###|#.#.#|#.###|.###.",
+}
+
+
+class BannerFont:
+    """Render text as big letters from a glyph atlas.
+
+    The atlas is compiled once into a translation table per row, mapping
+    each character to its slice of that row. Rendering a banner is then a
+    ``str.translate()`` per row, which joins the slices in C, and rendered
+    banners are kept in an LRU cache.
+    """
+
+    def __init__(
+        self,
+        glyphs: Mapping[str, str] = GLYPHS,
+        fill: str = "█",
+        spacing: int = 1,
+        indent: int = 4,
+        cache_size: int = BANNER_CACHE_SIZE,
+    ):
+        """Compile the glyph atlas.
+
+        Args:
+            glyphs: Glyphs by character, as rows separated by "|" with "#" for
+                filled cells and "." for empty ones.
+            fill: Character drawn for filled cells.
+            spacing: Empty columns between glyphs.
+            indent: Spaces before each row.
+            cache_size: Number of rendered banners to keep.
+
+        Raises:
+            ValueError: If glyphs have different heights or there is no fallback glyph.
+        """
+        if FALLBACK not in glyphs:
+            raise ValueError(f"The glyphs need a {FALLBACK!r} fallback")
+        atlas = {char: source.split("|") for char, source in glyphs.items()}
+        heights = {len(rows) for rows in atlas.values()}
+        if len(heights) != 1:
+            raise ValueError("Every glyph must have the same number of rows")
+        self.height = heights.pop()
+        self.indent = " " * indent
+        self._known = frozenset(atlas)
+
+        gap = " " * spacing
+        self._rows: list[dict[int, str]] = [{} for _ in range(self.height)]
+        for char, rows in atlas.items():
+            width = max(map(len, rows))
+            for table, row in zip(self._rows, rows, strict=True):
+                cells = row.ljust(width, ".").replace("#", fill).replace(".", " ")
+                table[ord(char)] = cells + gap
+        self.render = lru_cache(maxsize=cache_size)(self._render)
+
+    def normalize(self, text: str) -> str:
+        """Map text onto the characters the atlas has.
+
+        Args:
+            text: The text to render.
+
+        Returns:
+            The text in upper case, with other whitespace as spaces and
+            characters without a glyph as the fallback.
+        """
+        text = " ".join(text.upper().split())
+        known = self._known
+        if all(char in known for char in text):
+            return text
+        return "".join(char if char in known else FALLBACK for char in text)
+
+    def _render(self, text: str) -> str:
+        """Render text as a banner; ``render()`` is this behind an LRU cache.
+
+        Args:
+            text: The text to render.
+
+        Returns:
+            The banner, with a blank line before it like the other art.
+        """
+        text = self.normalize(text)
+        indent = self.indent
+        return "\n" + "".join(
+            f"{indent}{text.translate(table).rstrip()}\n" for table in self._rows
+        )
+
+
+BANNER_FONT = BannerFont()
@@ -0,0 +1,235 @@
+"""
+Pre-rendered vibe catalogs served straight from a memory map.
+
+A catalog is a single file with a header, a table of art types, an index of
+entry offsets and the UTF-8 encoded frames themselves:
+
+    header   magic, version, entry count, type count
+    types    name, first entry, entry count (one per art type)
+    index    offset, art length, message length (one per entry)
+    frames   art, blank line, message, blank line, separator line
+
+Every entry is stored fully formatted, so serving a vibe is a single slice of
+the memory map. Processes serving the same catalog share its pages through the
+page cache instead of each holding a copy.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from collections.abc import Iterator
+
+from bsidespgh25.output import SEPARATOR_LINE, VIBE_GAP
+from bsidespgh25.vibe_generator import VibeGenerator
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Self
+
+    from bsidespgh25.content import ContentPack
+
+MAGIC = b"VIBECAT\x00"
+VERSION = 1
+HEADER = struct.Struct("<8sIII")
+TYPE_NAME_SIZE = 32
+TYPE = struct.Struct(f"<{TYPE_NAME_SIZE}sII")
+ENTRY = struct.Struct("<QII")
+
+# Matrix frames are rendered from a fixed seed so builds are reproducible
+DEFAULT_SEED = 0
+DEFAULT_SIZE = 1000
+
+# Bytes between the end of the art and the start of the message, and after the message
+_FRAME_OVERHEAD = len(VIBE_GAP) * 2
+
+
+def build_catalog(
+    path: str | os.PathLike,
+    size: int = DEFAULT_SIZE,
+    seed: int = DEFAULT_SEED,
+    art_types: tuple[str, ...] | None = None,
+    content: ContentPack | None = None,
+) -> int:
+    """Pre-render vibes into a catalog file.
+
+    The file is written next to the destination and moved into place, so
+    processes that already mapped an older catalog keep a consistent view.
+
+    Args:
+        path: Where to write the catalog.
+        size: Number of vibes to render per art type.
+        seed: Seed for the generator that renders the vibes.
+        art_types: Art types to render; defaults to every type random vibes are
+            drawn from.
+        content: Content pack to render vibes from; defaults to the built-in content.
+
+    Returns:
+        The number of entries written.
+
+    Raises:
+        ValueError: If the size is negative or an art type name is too long.
+    """
+    if size < 0:
+        raise ValueError("size must not be negative")
+
+    vibe_gen = VibeGenerator(seed=seed, content=content)
+    if art_types is None:
+        registry = vibe_gen.registry
+        art_types = tuple(name for name in registry.names if registry.weight(name) > 0)
+    types = []
+    index = []
+    frames = []
+    data_size = 0
+    for art_type in art_types:
+        name = art_type.encode("utf-8")
+        if len(name) > TYPE_NAME_SIZE:
+            raise ValueError(f"Art type name is too long: {art_type}")
+        types.append(TYPE.pack(name, len(index), size))
+        for art_bytes, message_bytes in vibe_gen.iter_encoded_vibes(size, art_type):
+            frames += [art_bytes, VIBE_GAP, message_bytes, VIBE_GAP, SEPARATOR_LINE]
+            index.append((data_size, len(art_bytes), len(message_bytes)))
+            data_size += len(art_bytes) + len(message_bytes)
+            data_size += _FRAME_OVERHEAD + len(SEPARATOR_LINE)
+
+    data_start = HEADER.size + TYPE.size * len(types) + ENTRY.size * len(index)
+    temporary = f"{os.fspath(path)}.tmp"
+    with open(temporary, "wb") as catalog:
+        catalog.write(HEADER.pack(MAGIC, VERSION, len(index), len(types)))
+        catalog.writelines(types)
+        catalog.writelines(
+            ENTRY.pack(data_start + offset, art_length, message_length)
+            for offset, art_length, message_length in index
+        )
+        catalog.writelines(frames)
+    os.replace(temporary, path)
+    return len(index)
+
+
+class VibeCatalog:
+    """A read-only, memory-mapped catalog of pre-rendered vibes."""
+
+    def __init__(self, path: str | os.PathLike):
+        """Map a catalog file.
+
+        Args:
+            path: The catalog to open.
+
+        Raises:
+            ValueError: If the file is not a catalog this version can read, or
+                is truncated or corrupt.
+        """
+        self.path = path
+        with open(path, "rb") as catalog:
+            try:
+                self._map = mmap.mmap(catalog.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as error:
+                raise ValueError(f"Not a vibe catalog: {path}") from error
+
+        if len(self._map) < HEADER.size:
+            self.close()
+            raise ValueError(f"Not a vibe catalog: {path}")
+        magic, version, self._count, type_count = HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"Not a vibe catalog: {path}")
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"Unsupported catalog version {version}: {path}")
+
+        self._index_start = HEADER.size + TYPE.size * type_count
+        if self._index_start + ENTRY.size * self._count > len(self._map):
+            self.close()
+            raise ValueError(f"Truncated vibe catalog: {path}")
+
+        self.ranges: dict[str, tuple[int, int]] = {}
+        for position in range(type_count):
+            name, first, count = TYPE.unpack_from(
+                self._map, HEADER.size + TYPE.size * position
+            )
+            if first + count > self._count:
+                self.close()
+                raise ValueError(f"Corrupt vibe catalog: {path}")
+            try:
+                art_type = name.rstrip(b"\x00").decode("utf-8")
+            except UnicodeDecodeError as error:
+                self.close()
+                raise ValueError(f"Corrupt vibe catalog: {path}") from error
+            if count:
+                self.ranges[art_type] = (first, count)
+        self.types = tuple(self.ranges)
+
+        # Frames are written in order, so the last one ends the file
+        if self._count:
+            offset, art_length, message_length = ENTRY.unpack_from(
+                self._map, self._index_start + ENTRY.size * (self._count - 1)
+            )
+            end = offset + art_length + message_length + _FRAME_OVERHEAD
+            if end + len(SEPARATOR_LINE) > len(self._map):
+                self.close()
+                raise ValueError(f"Truncated vibe catalog: {path}")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Unmap the catalog."""
+        self._map.close()
+
+    def frame(self, index: int, separator: bool = True) -> bytes:
+        """Get an encoded, formatted vibe.
+
+        Args:
+            index: The entry to get.
+            separator: Whether to include the trailing separator line.
+
+        Returns:
+            The vibe exactly as ``format_vibe()`` would format it, encoded as UTF-8.
+
+        Raises:
+            IndexError: If there is no such entry.
+        """
+        if not 0 <= index < self._count:
+            raise IndexError(f"Catalog entry out of range: {index}")
+        offset, art_length, message_length = ENTRY.unpack_from(
+            self._map, self._index_start + ENTRY.size * index
+        )
+        end = offset + art_length + message_length + _FRAME_OVERHEAD
+        if separator:
+            end += len(SEPARATOR_LINE)
+        return self._map[offset:end]
+
+    def vibe(self, index: int) -> tuple[str, str]:
+        """Get a vibe's art and message.
+
+        Args:
+            index: The entry to get.
+
+        Returns:
+            Tuple of (ascii_art, vibe_message).
+
+        Raises:
+            IndexError: If there is no such entry.
+        """
+        if not 0 <= index < self._count:
+            raise IndexError(f"Catalog entry out of range: {index}")
+        offset, art_length, message_length = ENTRY.unpack_from(
+            self._map, self._index_start + ENTRY.size * index
+        )
+        art_end = offset + art_length
+        message_start = art_end + len(VIBE_GAP)
+        return (
+            self._map[offset:art_end].decode("utf-8"),
+            self._map[message_start : message_start + message_length].decode("utf-8"),
+        )
+
+    def __iter__(self) -> Iterator[tuple[str, str]]:
+        for index in range(self._count):
+            yield self.vibe(index)
@@ -0,0 +1,217 @@
+"""
+ANSI color for vibe art, with an escape sequence per run of same-colored cells.
+"""
+
+import os
+import re
+from collections.abc import Iterable, Iterator, Mapping
+from functools import lru_cache
+
+from bsidespgh25.stats import VibeStats
+
+COLOR_DEPTHS = ("16", "256", "truecolor")
+RESET = "\x1b[0m"
+# Counter for the bytes of escape sequences added to art
+COLOR_BYTES = "color_bytes"
+
+RGB = tuple[int, int, int]
+
+# Foreground codes of the basic ANSI colors and their usual RGB values
+ANSI_16: tuple[tuple[int, RGB], ...] = (
+    (30, (0, 0, 0)),
+    (31, (205, 0, 0)),
+    (32, (0, 205, 0)),
+    (33, (205, 205, 0)),
+    (34, (0, 0, 238)),
+    (35, (205, 0, 205)),
+    (36, (0, 205, 205)),
+    (37, (229, 229, 229)),
+    (90, (127, 127, 127)),
+    (91, (255, 0, 0)),
+    (92, (0, 255, 0)),
+    (93, (255, 255, 0)),
+    (94, (92, 92, 255)),
+    (95, (255, 0, 255)),
+    (96, (0, 255, 255)),
+    (97, (255, 255, 255)),
+)
+# Channel levels of the 6x6x6 color cube in the 256-color palette
+CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+
+# Rows fade from dark green at the top to bright green at the bottom
+MATRIX_GRADIENT: tuple[RGB, ...] = (
+    (0, 120, 0),
+    (0, 160, 0),
+    (0, 200, 0),
+    (0, 240, 0),
+)
+# Digits stand out from the rest of the art
+MATRIX_GLYPH_COLORS: dict[str, RGB] = {"0": (180, 255, 180), "1": (180, 255, 180)}
+
+
+def _distance(color: RGB, other: RGB) -> int:
+    """Squared distance between two colors."""
+    return sum((a - b) ** 2 for a, b in zip(color, other, strict=True))
+
+
+@lru_cache(maxsize=256)
+def escape(color: RGB, depth: str) -> str:
+    """Get the escape sequence that sets a foreground color.
+
+    Args:
+        color: The (red, green, blue) color.
+        depth: One of ``COLOR_DEPTHS``; colors are mapped to the nearest one available.
+
+    Returns:
+        The escape sequence.
+
+    Raises:
+        ValueError: If the color depth is unknown.
+    """
+    if depth == "truecolor":
+        return "\x1b[38;2;{};{};{}m".format(*color)
+    if depth == "256":
+        red, green, blue = (
+            min(range(6), key=lambda level: abs(CUBE_LEVELS[level] - channel))
+            for channel in color
+        )
+        return f"\x1b[38;5;{16 + 36 * red + 6 * green + blue}m"
+    if depth == "16":
+        code = min(ANSI_16, key=lambda entry: _distance(entry[1], color))[0]
+        return f"\x1b[{code}m"
+    raise ValueError(f"Unknown color depth: {depth}")
+
+
+def detect_color_depth(environ: Mapping[str, str] | None = None) -> str:
+    """Work out the color depth the terminal supports from its environment.
+
+    Args:
+        environ: Environment variables; defaults to ``os.environ``.
+
+    Returns:
+        One of ``COLOR_DEPTHS``.
+    """
+    environ = os.environ if environ is None else environ
+    if environ.get("COLORTERM", "").lower() in ("truecolor", "24bit"):
+        return "truecolor"
+    if "256" in environ.get("TERM", ""):
+        return "256"
+    return "16"
+
+
+def color_depth(
+    requested: str | None, environ: Mapping[str, str] | None = None
+) -> str | None:
+    """Resolve a requested color depth.
+
+    Args:
+        requested: One of ``COLOR_DEPTHS``, "auto" to detect it, or None for no color.
+        environ: Environment variables; defaults to ``os.environ``.
+
+    Returns:
+        The color depth to use, or None when color is off or ``$NO_COLOR`` is set.
+    """
+    environ = os.environ if environ is None else environ
+    if requested is None or environ.get("NO_COLOR"):
+        return None
+    if requested == "auto":
+        return detect_color_depth(environ)
+    return requested
+
+
+class ColorRenderer:
+    """Color art with a vertical gradient and per-glyph colors.
+
+    Each line takes its color from the gradient, and glyphs with a color of
+    their own override it. A single escape sequence starts each run of
+    cells with the same color, with spaces joining whatever run they follow,
+    so the overhead grows with the number of color changes instead of the
+    number of cells.
+    """
+
+    def __init__(
+        self,
+        depth: str = "truecolor",
+        gradient: Iterable[RGB] = MATRIX_GRADIENT,
+        glyph_colors: Mapping[str, RGB] = MATRIX_GLYPH_COLORS,
+        stats: VibeStats | None = None,
+    ):
+        """Initialize the renderer.
+
+        Args:
+            depth: One of ``COLOR_DEPTHS``.
+            gradient: Colors of the lines, from top to bottom, spread over the art's height.
+            glyph_colors: Colors of individual glyphs.
+            stats: Statistics to record the bytes of escape sequences added in.
+
+        Raises:
+            ValueError: If the depth is unknown or the gradient is empty.
+        """
+        if depth not in COLOR_DEPTHS:
+            raise ValueError(f"Unknown color depth: {depth}")
+        self.depth = depth
+        self.stats = stats
+        self._gradient = [escape(color, depth) for color in gradient]
+        if not self._gradient:
+            raise ValueError("gradient must not be empty")
+
+        # Glyphs with the same escape sequence share a run
+        runs: dict[str, str] = {}
+        for glyph, color in glyph_colors.items():
+            if glyph in "\n ":
+                raise ValueError("Newlines and spaces can't have a color")
+            code = escape(color, depth)
+            runs[code] = runs.get(code, "") + glyph
+        glyphs = re.escape("".join(runs.values()))
+        patterns = [f"([^{glyphs}\\n]+)" if glyphs else "([^\\n]+)"]
+        patterns.extend(
+            f"([{re.escape(chars)}][{re.escape(chars)} ]*)" for chars in runs.values()
+        )
+        self._pattern = re.compile("|".join(patterns))
+        # Escape sequences by group, the first being the line's gradient color
+        self._escapes = [None, None, *runs]
+
+    def colorize(self, art: str) -> str:
+        """Color a piece of art.
+
+        Args:
+            art: The art to color.
+
+        Returns:
+            The art with escape sequences, ending with a reset.
+        """
+        if not art:
+            return art
+
+        escapes = list(self._escapes)
+        gradient = self._gradient
+        lines = art.split("\n")
+        height = len(lines)
+        sub = self._pattern.sub
+
+        def start_run(match: re.Match) -> str:
+            return escapes[match.lastindex] + match[0]
+
+        for row, line in enumerate(lines):
+            escapes[1] = gradient[row * len(gradient) // height]
+            lines[row] = sub(start_run, line)
+        colored = "\n".join(lines) + RESET
+
+        if self.stats is not None:
+            # Escape sequences are ASCII, so characters added are bytes added
+            self.stats.increment(COLOR_BYTES, len(colored) - len(art))
+        return colored
+
+    def colorize_vibes(
+        self, vibes: Iterable[tuple[str, str]]
+    ) -> Iterator[tuple[str, str]]:
+        """Color the art of a stream of vibes.
+
+        Args:
+            vibes: Tuples of (ascii_art, message).
+
+        Yields:
+            Tuples of (colored_art, message).
+        """
+        for art, message in vibes:
+            yield self.colorize(art), message
@@ -2,8 +2,15 @@
 Configuration management for bsidespgh25
 """
 
+import copy
+import json
 import logging
+import time
+import tomllib
 from argparse import ArgumentParser
+from json.encoder import encode_basestring
+from logging.handlers import QueueHandler
+from pathlib import Path
 
 from bsidespgh25 import (
     __project_name__,
@@ -13,6 +20,14 @@ from bsidespgh25 import (
 
 LOG = logging.getLogger(__name__)
 
+# Sections of a weights file and whether each may list weights by position
+WEIGHT_SECTIONS = {
+    "art_types": False,
+    "patterns": True,
+    "words": True,
+    "messages": True,
+}
+
 
 def create_arg_parser() -> ArgumentParser:
     """Create an argument parser"""
@@ -37,6 +52,12 @@ def create_arg_parser() -> ArgumentParser:
     )
     parser.set_defaults(loglevel=logging.WARNING)
 
+    parser.add_argument(
+        "--log-queue",
+        action="store_true",
+        help="write log messages from a background thread so logging never blocks",
+    )
+
     return parser
 
 
@@ -46,16 +67,192 @@ def get_args_config() -> dict:
     return vars(parser.parse_args())
 
 
-def setup_logging(loglevel: int = logging.WARNING) -> logging.Logger:
+class JsonFormatter(logging.Formatter):
+    """Format log records as JSON lines.
+
+    Each line is an object with the record's timestamp, namespace, log level
+    and message, plus the exception and stack when there are any. Strings
+    are escaped by the C JSON encoder straight into the line, without
+    building a dict per record, and the date and time are formatted once
+    per second and reused until the next one.
+
+    Loggers drop records below their level before a record is even created,
+    so disabled levels cost no formatting at all.
+    """
+
+    def __init__(self, datefmt: str = constants.LOG_TIME_FORMAT):
+        """Initialize the formatter.
+
+        Args:
+            datefmt: strftime() format of the timestamp, before its milliseconds.
+        """
+        super().__init__(datefmt=datefmt)
+        # The last second formatted and its text, swapped together for threads
+        self._second: tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        """Format a record's creation time, reusing the text of the same second.
+
+        Args:
+            record: The log record.
+            datefmt: strftime() format to use instead of the formatter's, uncached.
+
+        Returns:
+            The date and time, with milliseconds unless ``datefmt`` is given.
+        """
+        if datefmt is not None:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, text = self._second
+        if second != cached_second:
+            text = time.strftime(self.datefmt, self.converter(second))
+            self._second = (second, text)
+        return f"{text},{int(record.msecs):03d}"
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record as a line of JSON.
+
+        Args:
+            record: The log record.
+
+        Returns:
+            The JSON object, without a trailing newline.
+        """
+        line = (
+            f'{{"timestamp":"{self.formatTime(record)}",'
+            f'"namespace":{encode_basestring(record.name)},'
+            f'"loglevel":{encode_basestring(record.levelname)},'
+            f'"message":{encode_basestring(record.getMessage())}'
+        )
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            line += f',"exception":{encode_basestring(record.exc_text)}'
+        if record.stack_info:
+            line += f',"stack":{encode_basestring(self.formatStack(record.stack_info))}'
+        return line + "}"
+
+
+class JsonQueueHandler(QueueHandler):
+    """Queue log records for a ``JsonFormatter`` on a listener thread.
+
+    The stock ``QueueHandler`` formats each record and folds its traceback
+    into the message, so the listener's ``JsonFormatter`` would never write
+    a separate ``"exception"``. This one only resolves the message and the
+    traceback text, keeping them apart, so queued lines have the same shape
+    as direct ones.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Resolve a record's message and traceback before it is queued.
+
+        Args:
+            record: The log record.
+
+        Returns:
+            A copy of the record with its arguments merged into the message
+            and its traceback, if any, formatted into ``exc_text``.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatter.formatException(record.exc_info)
+            # The traceback keeps its frames alive, and its text is all that's written
+            record.exc_info = None
+        return record
+
+
+def setup_logging(
+    loglevel: int = logging.WARNING, queue: bool = False
+) -> logging.Logger:
     """Setup logging
 
+    Log records are written to stderr as JSON lines by ``JsonFormatter``.
+    Logging that is already configured, e.g. by a test runner, is kept.
+
     Args:
         loglevel: Logging level to use
+        queue: Whether to hand records to a ``QueueListener`` thread to write,
+            so logging calls never wait on I/O
 
     Returns:
         Configured logger
     """
-    logging.basicConfig(level="WARNING", format=constants.LOG_FORMAT)
-    log = logging.getLogger(__project_name__)
-    logging.getLogger().setLevel(loglevel)
-    return log
+    root = logging.getLogger()
+    if not root.handlers:
+        handler: logging.Handler = logging.StreamHandler()
+        handler.setFormatter(JsonFormatter())
+        if queue:
+            import atexit
+            import queue as queues
+            from logging.handlers import QueueListener
+
+            records: queues.SimpleQueue = queues.SimpleQueue()
+            listener = QueueListener(records, handler)
+            listener.start()
+            # Write whatever is still queued on the way out
+            atexit.register(listener.stop)
+            handler = JsonQueueHandler(records)
+            handler.setFormatter(JsonFormatter())
+        root.addHandler(handler)
+    root.setLevel(loglevel)
+    return logging.getLogger(__project_name__)
+
+
+def _is_weight(value: object) -> bool:
+    """Check whether a value is a valid weight."""
+    return isinstance(value, int | float) and not isinstance(value, bool) and value >= 0
+
+
+def load_weights(path: str | Path) -> dict:
+    """Load selection weights from a JSON or TOML file.
+
+    The file may contain these keys:
+
+    - ``art_types``: a mapping of vibe types to weights.
+    - ``patterns``, ``words``, ``messages``: a list with a weight per item, or
+      a mapping of items to weights where unlisted items weigh 1.
+    - ``no_repeat``: the number of draws a pattern, word or message is
+      excluded from after being drawn.
+
+    Args:
+        path: The weights file; ``.toml`` files are read as TOML, anything else as JSON.
+
+    Returns:
+        The weights, as accepted by ``VibeGenerator``.
+
+    Raises:
+        TypeError: If the file doesn't hold a table of weights.
+        ValueError: If the file can't be read or its structure is invalid.
+    """
+    path = Path(path)
+    try:
+        if path.suffix == ".toml":
+            with path.open("rb") as weights_file:
+                weights = tomllib.load(weights_file)
+        else:
+            weights = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as error:
+        raise ValueError(f"Can't load weights from {path}: {error}") from error
+
+    if not isinstance(weights, dict):
+        raise TypeError(f"{path}: expected a table of weights")
+    for key, value in weights.items():
+        if key == "no_repeat":
+            if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+                raise ValueError(f"{path}: no_repeat must be a non-negative integer")
+        elif key not in WEIGHT_SECTIONS:
+            raise ValueError(f"{path}: unknown section {key!r}")
+        elif isinstance(value, list) and WEIGHT_SECTIONS[key]:
+            if not all(_is_weight(weight) for weight in value):
+                raise ValueError(f"{path}: {key} weights must be non-negative numbers")
+        elif isinstance(value, dict):
+            if not all(_is_weight(weight) for weight in value.values()):
+                raise ValueError(f"{path}: {key} weights must be non-negative numbers")
+        else:
+            raise ValueError(f"{path}: {key} must be a mapping of weights")
+
+    LOG.debug("Loaded weights from %s", path)
+    return weights
@@ -2,13 +2,5 @@
 bsidespgh25 constants
 """
 
-import json
-
-LOG_FORMAT = json.dumps(
-    {
-        "timestamp": "%(asctime)s",
-        "namespace": "%(name)s",
-        "loglevel": "%(levelname)s",
-        "message": "%(message)s",
-    }
-)
+# strftime() format of log timestamps, which get milliseconds appended
+LOG_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
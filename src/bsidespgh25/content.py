@@ -0,0 +1,383 @@
+"""
+Content packs of art patterns, words and messages loaded from files.
+
+A pack is either a single JSON or TOML file::
+
+    {"patterns": ["...art..."], "words": ["HACK"], "messages": ["✨ vibes ✨"]}
+
+or a directory laid out as::
+
+    patterns/*.txt   one art pattern per file, in file name order
+    words.txt        one word per line
+    messages.txt     one message per line
+
+Blank lines and lines starting with ``#`` in words.txt and messages.txt are
+ignored. Every section is optional; a missing section keeps the built-in
+content.
+
+Parsed packs are compiled into an index cache. Later loads map the cache,
+which only has to check the pack's files are unchanged, and decode each
+string as it is drawn.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import zlib
+from collections.abc import Sequence
+from pathlib import Path
+
+SECTIONS = ("patterns", "words", "messages")
+PATTERN_SUFFIX = ".txt"
+
+CACHE_MAGIC = b"VIBEPACK"
+CACHE_VERSION = 1
+# magic, version, fingerprint length, item count per section
+CACHE_HEADER = struct.Struct(f"<8sII{len(SECTIONS)}I")
+CACHE_ENTRY = struct.Struct("<QI")
+
+
+class ContentPackError(ValueError):
+    """A content pack is missing or malformed."""
+
+
+class PackStrings(Sequence):
+    """Strings stored in a mapped cache and decoded on access."""
+
+    __slots__ = ("_count", "_index", "_map")
+
+    def __init__(self, cache_map: mmap.mmap, index: int, count: int):
+        """Initialize the view.
+
+        Args:
+            cache_map: The mapped cache.
+            index: Offset of the section's first index entry.
+            count: Number of strings in the section.
+        """
+        self._map = cache_map
+        self._index = index
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[item] for item in range(*position.indices(self._count))]
+        if position < 0:
+            position += self._count
+        if not 0 <= position < self._count:
+            raise IndexError("PackStrings index out of range")
+        offset, length = CACHE_ENTRY.unpack_from(
+            self._map, self._index + CACHE_ENTRY.size * position
+        )
+        return self._map[offset : offset + length].decode("utf-8")
+
+
+class ContentPack:
+    """Art patterns, words and messages to generate vibes from."""
+
+    def __init__(
+        self,
+        source: str | os.PathLike | None = None,
+        patterns: Sequence[str] | None = None,
+        words: Sequence[str] | None = None,
+        messages: Sequence[str] | None = None,
+    ):
+        """Initialize the pack.
+
+        Args:
+            source: Where the pack was loaded from, if anywhere.
+            patterns: ASCII art patterns, or None for the built-in ones.
+            words: Words for word art, or None for the built-in ones.
+            messages: Vibe messages, or None for the built-in ones.
+        """
+        self.source = source
+        self.patterns = patterns
+        self.words = words
+        self.messages = messages
+
+    def __reduce__(self):
+        # Worker processes reload the pack, which is quick with a warm cache
+        if self.source is None:
+            return (
+                ContentPack,
+                (None, *(_materialize(section) for section in self.sections())),
+            )
+        return (load_content_pack, (self.source,))
+
+    def sections(self) -> tuple[Sequence[str] | None, ...]:
+        """Get the sections in ``SECTIONS`` order.
+
+        Returns:
+            Tuple of (patterns, words, messages).
+        """
+        return self.patterns, self.words, self.messages
+
+
+def _materialize(section: Sequence[str] | None) -> list[str] | None:
+    """Decode a section into a list."""
+    return None if section is None else list(section)
+
+
+def validate_content(data: object, source: str | os.PathLike) -> dict[str, list[str]]:
+    """Check the structure of parsed pack content.
+
+    Args:
+        data: The parsed content.
+        source: Where the content came from, for error messages.
+
+    Returns:
+        The sections that are present.
+
+    Raises:
+        ContentPackError: If the content is invalid.
+    """
+    if not isinstance(data, dict):
+        raise ContentPackError(f"{source}: expected a table of sections")
+    unknown = set(data) - set(SECTIONS)
+    if unknown:
+        raise ContentPackError(f"{source}: unknown sections {sorted(unknown)}")
+    if not data:
+        raise ContentPackError(f"{source}: no {', '.join(SECTIONS)} found")
+
+    for section, items in data.items():
+        if not isinstance(items, list) or not items:
+            raise ContentPackError(f"{source}: {section} must be a non-empty list")
+        for position, item in enumerate(items):
+            if not isinstance(item, str) or not item.strip():
+                raise ContentPackError(
+                    f"{source}: {section}[{position}] must be a non-empty string"
+                )
+            if section != "patterns" and "\n" in item:
+                raise ContentPackError(
+                    f"{source}: {section}[{position}] must be a single line"
+                )
+    return data
+
+
+def _read_lines(path: Path) -> list[str]:
+    """Read the non-blank, non-comment lines of a text file."""
+    lines = path.read_text(encoding="utf-8").splitlines()
+    return [line.strip() for line in lines if line.strip() and not line.startswith("#")]
+
+
+def _source_files(path: Path) -> list[Path]:
+    """List the files a pack is read from."""
+    if not path.is_dir():
+        return [path]
+    files = [path / "words.txt", path / "messages.txt"]
+    patterns = path / "patterns"
+    if patterns.is_dir():
+        files += sorted(patterns.glob(f"*{PATTERN_SUFFIX}"))
+    return [file for file in files if file.is_file()]
+
+
+def pack_fingerprint(path: str | os.PathLike) -> bytes:
+    """Identify the current state of a pack's files.
+
+    Args:
+        path: The pack.
+
+    Returns:
+        Bytes that change whenever one of the pack's files does.
+
+    Raises:
+        OSError: If the pack's files can't be read.
+    """
+    path = Path(path)
+    parts = [os.fspath(path.resolve())]
+    if path.is_dir():
+        # Adding or removing a pattern changes the directory's mtime
+        patterns = path / "patterns"
+        if patterns.is_dir():
+            parts.append(f"patterns:{patterns.stat().st_mtime_ns}")
+    for file in _source_files(path):
+        stat = file.stat()
+        parts.append(f"{file.name}:{stat.st_size}:{stat.st_mtime_ns}")
+    return "\n".join(parts).encode("utf-8")
+
+
+def parse_content_pack(path: str | os.PathLike) -> dict[str, list[str]]:
+    """Read and validate a pack's files.
+
+    Args:
+        path: A pack directory, or a ``.json`` or ``.toml`` file.
+
+    Returns:
+        The sections that are present.
+
+    Raises:
+        ContentPackError: If the pack can't be read or is invalid.
+    """
+    path = Path(path)
+    try:
+        if path.is_dir():
+            data = {}
+            patterns = sorted((path / "patterns").glob(f"*{PATTERN_SUFFIX}"))
+            if patterns:
+                data["patterns"] = [
+                    pattern.read_text(encoding="utf-8") for pattern in patterns
+                ]
+            for section in ("words", "messages"):
+                lines = path / f"{section}.txt"
+                if lines.is_file():
+                    data[section] = _read_lines(lines)
+        elif path.suffix == ".toml":
+            import tomllib
+
+            with path.open("rb") as pack:
+                data = tomllib.load(pack)
+        elif path.suffix == ".json":
+            import json
+
+            data = json.loads(path.read_text(encoding="utf-8"))
+        else:
+            raise ContentPackError(
+                f"{path}: expected a directory, .json or .toml content pack"
+            )
+    except ContentPackError:
+        raise
+    except (OSError, ValueError) as error:
+        raise ContentPackError(f"Can't read content pack {path}: {error}") from error
+    return validate_content(data, path)
+
+
+def default_cache_dir() -> Path:
+    """Get the directory compiled packs are cached in.
+
+    Returns:
+        ``$BSIDESPGH25_CACHE_DIR``, else ``$XDG_CACHE_HOME/bsidespgh25``, else
+        ``~/.cache/bsidespgh25``.
+    """
+    if "BSIDESPGH25_CACHE_DIR" in os.environ:
+        return Path(os.environ["BSIDESPGH25_CACHE_DIR"])
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "bsidespgh25"
+
+
+def cache_path(path: str | os.PathLike, cache_dir: str | os.PathLike) -> Path:
+    """Get where a pack's compiled index is cached.
+
+    Args:
+        path: The pack.
+        cache_dir: The cache directory.
+
+    Returns:
+        The cache file path.
+    """
+    resolved = Path(path).resolve()
+    checksum = zlib.crc32(os.fsencode(resolved))
+    return Path(cache_dir) / f"{resolved.stem}-{checksum:08x}.pack"
+
+
+def compile_content(
+    sections: dict[str, list[str]], fingerprint: bytes, destination: Path
+) -> None:
+    """Write a compiled index of a pack.
+
+    Args:
+        sections: The pack's sections.
+        fingerprint: Identifies the files the sections were read from.
+        destination: The cache file to write.
+    """
+    counts = [len(sections.get(section, ())) for section in SECTIONS]
+    encoded = [
+        item.encode("utf-8")
+        for section in SECTIONS
+        for item in sections.get(section, ())
+    ]
+    offset = CACHE_HEADER.size + len(fingerprint) + CACHE_ENTRY.size * len(encoded)
+    index = []
+    for item in encoded:
+        index.append(CACHE_ENTRY.pack(offset, len(item)))
+        offset += len(item)
+
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    temporary = destination.with_name(f"{destination.name}.{os.getpid()}.tmp")
+    with temporary.open("wb") as cache:
+        cache.write(
+            CACHE_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, len(fingerprint), *counts)
+        )
+        cache.write(fingerprint)
+        cache.writelines(index)
+        cache.writelines(encoded)
+    os.replace(temporary, destination)
+
+
+def _open_cache(path: Path, fingerprint: bytes) -> ContentPack | None:
+    """Map a compiled index if it is current.
+
+    Returns:
+        The pack's sections as ``PackStrings``, or None if there's no current cache.
+    """
+    try:
+        with path.open("rb") as cache:
+            cache_map = mmap.mmap(cache.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    if len(cache_map) < CACHE_HEADER.size:
+        cache_map.close()
+        return None
+    magic, version, fingerprint_size, *counts = CACHE_HEADER.unpack_from(cache_map)
+    start = CACHE_HEADER.size
+    if (
+        magic != CACHE_MAGIC
+        or version != CACHE_VERSION
+        or cache_map[start : start + fingerprint_size] != fingerprint
+    ):
+        cache_map.close()
+        return None
+
+    index = start + fingerprint_size
+    sections = []
+    for count in counts:
+        sections.append(PackStrings(cache_map, index, count) if count else None)
+        index += CACHE_ENTRY.size * count
+    return ContentPack(None, *sections)
+
+
+def load_content_pack(
+    path: str | os.PathLike, cache_dir: str | os.PathLike | None = None
+) -> ContentPack:
+    """Load a content pack, compiling it into the cache if needed.
+
+    A cache that can't be written is not an error; the pack is then served
+    from memory.
+
+    Args:
+        path: A pack directory, or a ``.json`` or ``.toml`` file.
+        cache_dir: Where to cache compiled packs; defaults to ``default_cache_dir()``.
+
+    Returns:
+        The loaded pack.
+
+    Raises:
+        ContentPackError: If the pack can't be read or is invalid.
+    """
+    source = Path(path)
+    if not source.exists():
+        raise ContentPackError(f"Content pack not found: {source}")
+    cache_dir = default_cache_dir() if cache_dir is None else Path(cache_dir)
+    try:
+        fingerprint = pack_fingerprint(source)
+    except OSError as error:
+        raise ContentPackError(f"Can't read content pack {source}: {error}") from error
+    cached = cache_path(source, cache_dir)
+
+    pack = _open_cache(cached, fingerprint)
+    if pack is None:
+        sections = parse_content_pack(source)
+        try:
+            compile_content(sections, fingerprint, cached)
+        except OSError:
+            return ContentPack(path, *(sections.get(section) for section in SECTIONS))
+        pack = _open_cache(cached, fingerprint)
+        if pack is None:
+            return ContentPack(path, *(sections.get(section) for section in SECTIONS))
+
+    pack.source = path
+    return pack
@@ -0,0 +1,149 @@
+"""
+Multi-process vibe generation.
+"""
+
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+
+from bsidespgh25.content import ContentPack
+from bsidespgh25.frame import Frame
+from bsidespgh25.matrix import DEFAULT_SIZE
+from bsidespgh25.registry import ArtRegistry
+from bsidespgh25.vibe_generator import VibeGenerator
+
+Chunk = tuple[list[tuple[str | Frame, str]], dict[str, int]]
+
+
+def generate_chunk(
+    seed: int,
+    count: int,
+    vibe_type: str,
+    registry: ArtRegistry | None = None,
+    weights: dict | None = None,
+    no_repeat: int = 0,
+    content: ContentPack | None = None,
+    matrix_size: tuple[int, int] = DEFAULT_SIZE,
+    banner_text: str | None = None,
+) -> Chunk:
+    """Generate a chunk of vibes in a worker process.
+
+    Matrices come back as frames, which pickle to a byte per cell instead of
+    their UTF-8 text, and are only turned into text by the parent.
+
+    Args:
+        seed: Seed for the worker's generator.
+        count: Number of vibes to generate.
+        vibe_type: Type of vibe to generate.
+        registry: Art sources to draw from, so plugins loaded by the parent are available.
+        weights: Selection weights for the worker's generator.
+        no_repeat: Repeat window for the worker's generator.
+        content: Content pack for the worker's generator, reloaded from its cache.
+        matrix_size: Default matrix size for the worker's generator.
+        banner_text: Banner text for the worker's generator.
+
+    Returns:
+        Tuple of (vibes, counts) where counts are the worker generator's raw counters.
+    """
+    vibe_gen = VibeGenerator(
+        seed=seed,
+        registry=registry,
+        weights=weights,
+        no_repeat=no_repeat,
+        content=content,
+        matrix_size=matrix_size,
+        banner_text=banner_text,
+    )
+    vibes = list(vibe_gen.iter_vibes(count, vibe_type, frames=True))
+    return vibes, vibe_gen.stats.counts()
+
+
+class VibeFarm:
+    """Fan vibe generation out over a pool of worker processes."""
+
+    def __init__(
+        self,
+        vibe_gen: VibeGenerator,
+        workers: int,
+        chunk_size: int = 1000,
+        ordered: bool = True,
+    ):
+        """Initialize the farm.
+
+        Args:
+            vibe_gen: Parent generator; seeds the workers and aggregates their statistics.
+            workers: Number of worker processes.
+            chunk_size: Number of vibes each worker generates per task.
+            ordered: Whether to yield chunks in submission order, making output
+                deterministic for a seeded parent generator.
+
+        Raises:
+            ValueError: If workers or chunk_size is not positive.
+        """
+        if workers <= 0:
+            raise ValueError("workers must be positive")
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        self.vibe_gen = vibe_gen
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.ordered = ordered
+
+    def iter_vibes(
+        self, count: int, vibe_type: str = "random"
+    ) -> Iterator[tuple[str, str]]:
+        """Generate vibes across the worker pool.
+
+        At most two chunks per worker are in flight at a time, so memory stays
+        bounded no matter how many vibes are requested.
+
+        Args:
+            count: Number of vibes to generate.
+            vibe_type: Type of vibe to generate.
+
+        Yields:
+            Tuples of (ascii_art, vibe_message).
+        """
+        sizes = [
+            min(self.chunk_size, count - start)
+            for start in range(0, count, self.chunk_size)
+        ]
+        tasks = iter(zip(self.vibe_gen.spawn_seeds(len(sizes)), sizes))
+        in_flight: deque[Future[Chunk]] = deque()
+
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+
+            def submit() -> None:
+                for seed, size in tasks:
+                    in_flight.append(
+                        pool.submit(
+                            generate_chunk,
+                            seed,
+                            size,
+                            vibe_type,
+                            self.vibe_gen.registry,
+                            self.vibe_gen.weights,
+                            self.vibe_gen.no_repeat,
+                            self.vibe_gen.content,
+                            self.vibe_gen.matrix_size,
+                            self.vibe_gen.banner_text,
+                        )
+                    )
+                    if len(in_flight) >= 2 * self.workers:
+                        return
+
+            submit()
+            while in_flight:
+                if self.ordered:
+                    future = in_flight.popleft()
+                else:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    future = done.pop()
+                    in_flight.remove(future)
+
+                vibes, counts = future.result()
+                self.vibe_gen.stats.merge(counts)
+                submit()
+                for art, message in vibes:
+                    yield str(art), message
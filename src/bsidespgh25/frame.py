@@ -0,0 +1,169 @@
+"""
+Compact frames of glyph indices, materialized as text or bytes on demand.
+"""
+
+from __future__ import annotations
+
+import codecs
+
+
+class GlyphTable:
+    """The glyphs frames index into, plus a newline after them."""
+
+    __slots__ = ("decoding_table", "encoding_table", "glyphs", "newline")
+
+    def __init__(self, glyphs: str):
+        """Initialize the table.
+
+        Args:
+            glyphs: Glyphs to index, one character each.
+
+        Raises:
+            ValueError: If there are no glyphs or too many to index with a byte.
+        """
+        if not 0 < len(glyphs) < 256:
+            raise ValueError("Need between 1 and 255 glyphs")
+        self.glyphs = glyphs
+        # Index of the newline that ends each row but the last
+        self.newline = len(glyphs)
+        self.decoding_table = glyphs + "\n"
+        # ASCII glyphs encode a byte per cell, so indices translate straight to UTF-8
+        self.encoding_table: bytes | None = None
+        if self.decoding_table.isascii():
+            self.encoding_table = self.decoding_table.encode("ascii").ljust(256, b"?")
+
+    def __reduce__(self) -> tuple:
+        # The lookup tables are rebuilt from the glyphs rather than pickled
+        return type(self), (self.glyphs,)
+
+    def decode(self, indices: bytes | bytearray) -> str:
+        """Look up the glyphs of an index array.
+
+        Args:
+            indices: Glyph indices, with ``newline`` between rows.
+
+        Returns:
+            The text the indices stand for.
+        """
+        return codecs.charmap_decode(indices, "strict", self.decoding_table)[0]
+
+    def encode(self, indices: bytes | bytearray) -> bytes:
+        """Look up the UTF-8 encoding of an index array.
+
+        Args:
+            indices: Glyph indices, with ``newline`` between rows.
+
+        Returns:
+            The UTF-8 encoding of the text the indices stand for.
+        """
+        if self.encoding_table is not None:
+            return bytes(indices).translate(self.encoding_table)
+        # Multi-byte glyphs can't be expanded by bytes.translate(), and decoding
+        # then encoding is two C passes where gluing pre-encoded glyphs is one
+        # Python-level lookup per cell
+        return self.decode(indices).encode("utf-8")
+
+
+class Frame:
+    """A matrix frame stored as one glyph index byte per cell.
+
+    A frame takes a byte per cell where the same art as ``str`` takes two
+    and as UTF-8 three. The text and UTF-8 bytes are only built when first
+    asked for, then cached. Frames of the same size diff by comparing their
+    indices, without building text for unchanged cells.
+    """
+
+    __slots__ = ("_encoded", "_text", "height", "indices", "table", "width")
+
+    def __init__(self, indices: bytes, width: int, height: int, table: GlyphTable):
+        """Initialize the frame.
+
+        Args:
+            indices: Glyph indices row by row, with ``table.newline`` between rows.
+            width: Width of the frame.
+            height: Height of the frame.
+            table: The glyphs the indices refer to.
+
+        Raises:
+            ValueError: If the indices don't match the size.
+        """
+        if len(indices) != max(0, height * (width + 1) - 1):
+            raise ValueError(
+                f"{len(indices)} indices don't make a {width}x{height} frame"
+            )
+        self.indices = indices
+        self.width = width
+        self.height = height
+        self.table = table
+        self._text: str | None = None
+        self._encoded: bytes | None = None
+
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = self.table.decode(self.indices)
+        return self._text
+
+    def __bytes__(self) -> bytes:
+        if self._encoded is None:
+            if self._text is None:
+                self._encoded = self.table.encode(self.indices)
+            else:
+                self._encoded = self._text.encode("utf-8")
+        return self._encoded
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Frame):
+            return NotImplemented
+        return (
+            self.indices == other.indices
+            and self.width == other.width
+            and self.table.glyphs == other.table.glyphs
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.indices, self.width))
+
+    def __repr__(self) -> str:
+        return f"<Frame {self.width}x{self.height}>"
+
+    def __reduce__(self) -> tuple:
+        # Pickle the indices alone, not the text or bytes cached from them
+        return type(self), (self.indices, self.width, self.height, self.table)
+
+    def diff(self, previous: Frame | None) -> list[tuple[int, int, str]]:
+        """Find the runs of cells that changed since another frame.
+
+        Args:
+            previous: The frame shown before this one, if any.
+
+        Returns:
+            Tuples of (row, column, text) for each run of changed cells on a
+            row; every row when there is no comparable previous frame. Only
+            the changed runs are decoded.
+        """
+        if (
+            previous is None
+            or (previous.width, previous.height) != (self.width, self.height)
+            or previous.table.glyphs != self.table.glyphs
+        ):
+            return [(row, 0, line) for row, line in enumerate(str(self).split("\n"))]
+        if previous.indices == self.indices:
+            return []
+
+        import re
+
+        # Cells that match XOR to zero, and rows end in the same newline in both
+        size = len(self.indices)
+        changed = (
+            int.from_bytes(self.indices, "big")
+            ^ int.from_bytes(previous.indices, "big")
+        ).to_bytes(size, "big")
+        stride = self.width + 1
+        decode = self.table.decode
+        indices = self.indices
+        runs = []
+        for match in re.finditer(rb"[^\x00]+", changed):
+            start, end = match.span()
+            row, column = divmod(start, stride)
+            runs.append((row, column, decode(indices[start:end])))
+        return runs
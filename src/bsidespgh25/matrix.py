@@ -0,0 +1,165 @@
+"""
+Matrix frames rendered into a reusable buffer.
+"""
+
+from bsidespgh25.frame import Frame, GlyphTable
+
+DEFAULT_SIZE = (40, 10)
+# Lines a vibe needs besides its art: blank, message, blank and separator
+VIBE_CHROME_LINES = 4
+
+
+class MatrixBuffer:
+    """Render random glyph matrices into a preallocated buffer.
+
+    The buffer holds one byte per cell, already laid out in rows. Each frame
+    draws random bytes, drops the values that would bias the draw towards
+    some glyphs, copies them into the rows and decodes the whole buffer
+    through a charmap of the glyphs, so rendering a frame takes a handful of
+    C calls however large it is.
+    """
+
+    __slots__ = (
+        "_buffer",
+        "_index_table",
+        "_rejected",
+        "height",
+        "table",
+        "width",
+    )
+
+    def __init__(self, width: int, height: int, glyphs: str):
+        """Initialize the buffer.
+
+        Args:
+            width: Width of the matrix.
+            height: Height of the matrix.
+            glyphs: Glyphs to draw from.
+
+        Raises:
+            ValueError: If a size is negative or there are no glyphs or too many.
+        """
+        self.table = GlyphTable(glyphs)
+        # Byte values at or above the largest multiple of the glyph count are rejected
+        limit = 256 - 256 % len(glyphs)
+        self._index_table = bytes(value % len(glyphs) for value in range(256))
+        self._rejected = bytes(range(limit, 256))
+        self.width = self.height = -1
+        self.resize(width, height)
+
+    def resize(self, width: int, height: int) -> None:
+        """Reallocate the buffer for a new size; the same size is a no-op.
+
+        Args:
+            width: Width of the matrix.
+            height: Height of the matrix.
+
+        Raises:
+            ValueError: If a size is negative.
+        """
+        if (width, height) == (self.width, self.height):
+            return
+        if width < 0 or height < 0:
+            raise ValueError("width and height must not be negative")
+        self.width = width
+        self.height = height
+        self._buffer = bytearray(max(0, height * (width + 1) - 1))
+        newline = self.table.newline
+        for row in range(1, height):
+            self._buffer[row * (width + 1) - 1] = newline
+
+    @property
+    def glyphs(self) -> str:
+        """The glyphs frames are drawn from."""
+        return self.table.glyphs
+
+    def render(self, rng) -> str:
+        """Render a frame of random glyphs.
+
+        Args:
+            rng: The ``random.Random`` stream to draw from.
+
+        Returns:
+            The frame, with its rows separated by newlines.
+        """
+        return self.table.decode(self._fill(rng))
+
+    def render_bytes(self, rng) -> bytes:
+        """Render a frame of random glyphs as UTF-8.
+
+        Args:
+            rng: The ``random.Random`` stream to draw from.
+
+        Returns:
+            The UTF-8 encoded frame, with its rows separated by newlines.
+        """
+        return self.table.encode(self._fill(rng))
+
+    def render_frame(self, rng) -> Frame:
+        """Render a frame of random glyphs without building its text.
+
+        Args:
+            rng: The ``random.Random`` stream to draw from.
+
+        Returns:
+            The frame.
+        """
+        return Frame(bytes(self._fill(rng)), self.width, self.height, self.table)
+
+    def _fill(self, rng) -> bytearray:
+        """Fill the buffer with random glyph indices.
+
+        Args:
+            rng: The ``random.Random`` stream to draw from.
+
+        Returns:
+            The buffer, which the next call overwrites.
+        """
+        buffer = self._buffer
+        width = self.width
+        cells = width * self.height
+        if not cells:
+            return buffer
+
+        index_table = self._index_table
+        rejected = self._rejected
+        # Draw a little extra so rejected bytes rarely need a second draw
+        indices = rng.randbytes(cells + cells // 16 + 16).translate(
+            index_table, rejected
+        )
+        while len(indices) < cells:
+            indices += rng.randbytes(cells).translate(index_table, rejected)
+
+        stride = width + 1
+        for row in range(self.height):
+            start = row * stride
+            buffer[start : start + width] = indices[row * width : (row + 1) * width]
+        return buffer
+
+
+def terminal_size() -> tuple[int, int]:
+    """Get the size of the terminal.
+
+    Returns:
+        Tuple of (columns, lines), honoring ``$COLUMNS`` and ``$LINES`` and
+        falling back to 80x24 when stdout isn't a terminal.
+    """
+    import shutil
+
+    return tuple(shutil.get_terminal_size())
+
+
+def fit_matrix(
+    columns: int, lines: int, reserved_lines: int = VIBE_CHROME_LINES
+) -> tuple[int, int]:
+    """Size a matrix to fill a terminal.
+
+    Args:
+        columns: Terminal width.
+        lines: Terminal height.
+        reserved_lines: Lines needed for anything printed with the matrix.
+
+    Returns:
+        Tuple of (width, height), at least 1x1.
+    """
+    return max(1, columns), max(1, lines - reserved_lines)
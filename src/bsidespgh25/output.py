@@ -0,0 +1,245 @@
+"""
+Buffered output for generated vibes.
+"""
+
+from __future__ import annotations
+
+import codecs
+import sys
+
+from bsidespgh25.stats import VibeStats
+
+# typing is only needed by type checkers; skipping it keeps the CLI start fast
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Self, TextIO
+
+SEPARATOR = "─" * 60
+# Pre-encoded pieces of a formatted vibe
+VIBE_GAP = b"\n\n"
+SEPARATOR_LINE = f"{SEPARATOR}\n".encode()
+
+FLUSH_POLICIES = ("auto", "frame", "batch", "size")
+
+
+def format_vibe(art: str, message: str, separator: bool = True) -> str:
+    """Format a vibe for display.
+
+    Args:
+        art: The ASCII art.
+        message: The vibe message.
+        separator: Whether to end the vibe with a separator line.
+
+    Returns:
+        The art, message and optional separator as a single string.
+    """
+    if separator:
+        return f"{art}\n\n{message}\n\n{SEPARATOR}\n"
+    return f"{art}\n\n{message}\n\n"
+
+
+def format_encoded_vibe(art: bytes, message: bytes, separator: bool = True) -> bytes:
+    """Format a vibe whose art and message are already UTF-8 encoded.
+
+    Args:
+        art: The encoded ASCII art.
+        message: The encoded vibe message.
+        separator: Whether to end the vibe with a separator line.
+
+    Returns:
+        The same bytes as encoding ``format_vibe()``'s result.
+    """
+    if separator:
+        return b"".join((art, VIBE_GAP, message, VIBE_GAP, SEPARATOR_LINE))
+    return b"".join((art, VIBE_GAP, message, VIBE_GAP))
+
+
+class VibeWriter:
+    """Assemble vibes into a buffer and write them to a stream in as few calls as possible.
+
+    The flush policy decides when buffered output is written:
+
+    - ``frame``: after every vibe, for interactive terminals.
+    - ``batch``: after every ``batch_size`` vibes.
+    - ``size``: once ``size_threshold`` bytes are buffered.
+    - ``auto``: ``frame`` when the stream is a TTY, otherwise ``size``.
+    """
+
+    BATCH_SIZE = 1024
+    SIZE_THRESHOLD = 64 * 1024
+
+    def __init__(
+        self,
+        stream: TextIO | None = None,
+        flush_policy: str = "auto",
+        batch_size: int = BATCH_SIZE,
+        size_threshold: int = SIZE_THRESHOLD,
+        stats: VibeStats | None = None,
+        binary: bool = False,
+    ):
+        """Initialize the writer.
+
+        Args:
+            stream: Text stream to write to; defaults to ``sys.stdout``.
+            flush_policy: One of ``FLUSH_POLICIES``.
+            batch_size: Vibes to buffer per write with the ``batch`` policy.
+            size_threshold: Bytes to buffer per write with the ``size`` policy.
+            stats: Statistics to record the bytes written in.
+            binary: Whether records that aren't text, such as binary records,
+                will be written, which needs a stream with a binary layer.
+
+        Raises:
+            ValueError: If the flush policy is unknown, or binary output is
+                asked for on a stream without a binary layer.
+        """
+        if flush_policy not in FLUSH_POLICIES:
+            raise ValueError(f"Unknown flush policy: {flush_policy}")
+
+        self._stream = stream if stream is not None else sys.stdout
+        # Write straight to the binary layer when there is one
+        self._binary = getattr(self._stream, "buffer", None)
+        if binary and self._binary is None:
+            raise ValueError("Binary output needs a stream with a binary layer")
+        self._encoding = getattr(self._stream, "encoding", None) or "utf-8"
+        # Whether encoded vibes need converting, worked out on first use
+        self._transcode: bool | None = None
+
+        if flush_policy == "auto":
+            flush_policy = "frame" if self._stream.isatty() else "size"
+        self.flush_policy = flush_policy
+        self.batch_size = batch_size
+        self.size_threshold = size_threshold
+        self.stats = stats
+
+        self.bytes_written = 0
+        self.vibes_written = 0
+        self._pending: list[bytes] = []
+        self._pending_vibes = 0
+        self._pending_bytes = 0
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.flush()
+
+    def write_vibe(self, art: str, message: str, separator: bool = True) -> None:
+        """Buffer a single vibe.
+
+        Args:
+            art: The ASCII art.
+            message: The vibe message.
+            separator: Whether to end the vibe with a separator line.
+        """
+        self.vibes_written += 1
+        self._pending_vibes += 1
+        self._append(format_vibe(art, message, separator))
+
+    def write_encoded(self, data: bytes) -> None:
+        """Buffer a vibe that is already formatted and encoded, e.g. from a catalog.
+
+        Args:
+            data: The formatted vibe, encoded as UTF-8.
+        """
+        self.vibes_written += 1
+        self._pending_vibes += 1
+        if self._transcode is None:
+            self._transcode = codecs.lookup(self._encoding).name != "utf-8"
+        if self._transcode:
+            data = data.decode("utf-8").encode(self._encoding)
+        self._append_bytes(data)
+
+    def write_encoded_vibe(
+        self, art: bytes, message: bytes, separator: bool = True
+    ) -> None:
+        """Buffer a vibe whose art and message are already UTF-8 encoded.
+
+        The pieces are buffered as they are and only joined when flushed.
+
+        Args:
+            art: The encoded ASCII art.
+            message: The encoded vibe message.
+            separator: Whether to end the vibe with a separator line.
+        """
+        if self._transcode is None:
+            self._transcode = codecs.lookup(self._encoding).name != "utf-8"
+        if self._transcode:
+            self.write_encoded(format_encoded_vibe(art, message, separator))
+            return
+
+        self.vibes_written += 1
+        self._pending_vibes += 1
+        if separator:
+            parts = (art, VIBE_GAP, message, VIBE_GAP, SEPARATOR_LINE)
+        else:
+            parts = (art, VIBE_GAP, message, VIBE_GAP)
+        self._pending.extend(parts)
+        self._pending_bytes += sum(map(len, parts))
+        self._apply_policy()
+
+    def write(self, text: str) -> None:
+        """Buffer raw text, such as animation escape sequences, as one frame.
+
+        Args:
+            text: The text to write.
+        """
+        self._pending_vibes += 1
+        self._append(text)
+
+    def write_record(self, data: bytes) -> None:
+        """Buffer an encoded record, such as a JSON line, as one frame.
+
+        Records are written as they are, whatever the stream's encoding. On a
+        stream without a binary layer they have to be text in its encoding;
+        construct the writer with ``binary`` to make sure there is one.
+
+        Args:
+            data: The encoded record.
+        """
+        self._pending_vibes += 1
+        self._append_bytes(data)
+
+    def flush(self) -> None:
+        """Write all buffered output to the stream."""
+        if not self._pending:
+            return
+
+        data = b"".join(self._pending)
+        self._pending.clear()
+        self._pending_vibes = 0
+        self._pending_bytes = 0
+        self.bytes_written += len(data)
+        if self.stats is not None:
+            self.stats.record_bytes(len(data))
+
+        if self._binary is None:
+            self._stream.write(data.decode(self._encoding))
+            self._stream.flush()
+            return
+
+        # Anything printed to the text layer must go out first to keep ordering
+        self._stream.flush()
+        self._binary.write(data)
+        self._binary.flush()
+
+    def _append(self, text: str) -> None:
+        """Buffer encoded text and flush according to the policy."""
+        self._append_bytes(text.encode(self._encoding))
+
+    def _append_bytes(self, data: bytes) -> None:
+        """Buffer encoded data and flush according to the policy."""
+        self._pending.append(data)
+        self._pending_bytes += len(data)
+        self._apply_policy()
+
+    def _apply_policy(self) -> None:
+        """Flush the buffered output if the flush policy says so."""
+        if (
+            self.flush_policy == "frame"
+            or (self.flush_policy == "batch" and self._pending_vibes >= self.batch_size)
+            or (
+                self.flush_policy == "size"
+                and self._pending_bytes >= self.size_threshold
+            )
+        ):
+            self.flush()
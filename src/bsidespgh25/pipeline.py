@@ -0,0 +1,224 @@
+"""
+Producer/consumer pipeline between vibe generation and output.
+"""
+
+import threading
+from collections import deque
+from collections.abc import Callable
+
+from bsidespgh25.scheduler import FrameScheduler
+
+DROP_POLICIES = ("block", "drop-oldest", "drop-newest")
+DEFAULT_DEPTH = 8
+# How long stop() waits for the generator thread, which may be asleep until its next deadline
+STOP_TIMEOUT = 0.1
+
+
+class FrameQueue:
+    """A bounded queue of rendered frames with a policy for when it is full.
+
+    - ``block``: wait for the writer to make room.
+    - ``drop-oldest``: discard the oldest queued frame to make room.
+    - ``drop-newest``: discard the new frame.
+    """
+
+    def __init__(self, depth: int = DEFAULT_DEPTH, drop_policy: str = "block"):
+        """Initialize the queue.
+
+        Args:
+            depth: Maximum number of queued frames.
+            drop_policy: One of ``DROP_POLICIES``.
+
+        Raises:
+            ValueError: If the depth isn't positive or the drop policy is unknown.
+        """
+        if depth <= 0:
+            raise ValueError("depth must be positive")
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(f"Unknown drop policy: {drop_policy}")
+        self.depth = depth
+        self.drop_policy = drop_policy
+        self.dropped = 0
+        self.peak = 0
+        self._frames: deque = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._puts = 0
+        self._occupancy = 0
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def put(self, frame) -> bool:
+        """Queue a frame, applying the drop policy if the queue is full.
+
+        Args:
+            frame: The frame to queue.
+
+        Returns:
+            True if the frame was queued, False if it was dropped or the queue closed.
+        """
+        with self._condition:
+            self._puts += 1
+            self._occupancy += len(self._frames)
+            if len(self._frames) >= self.depth:
+                if self.drop_policy == "drop-newest":
+                    self.dropped += 1
+                    return False
+                if self.drop_policy == "drop-oldest":
+                    self._frames.popleft()
+                    self.dropped += 1
+                else:
+                    while len(self._frames) >= self.depth and not self._closed:
+                        self._condition.wait()
+            if self._closed:
+                return False
+            self._frames.append(frame)
+            self.peak = max(self.peak, len(self._frames))
+            self._condition.notify_all()
+            return True
+
+    def get(self):
+        """Wait for the next frame.
+
+        Returns:
+            The oldest queued frame, or None once the queue is closed and empty.
+        """
+        with self._condition:
+            while not self._frames and not self._closed:
+                self._condition.wait()
+            if not self._frames:
+                return None
+            frame = self._frames.popleft()
+            self._condition.notify_all()
+            return frame
+
+    def close(self, discard: bool = False) -> None:
+        """Stop accepting frames and wake any waiting threads.
+
+        Args:
+            discard: Whether to drop the queued frames instead of letting them drain.
+        """
+        with self._condition:
+            self._closed = True
+            if discard:
+                self._frames.clear()
+            self._condition.notify_all()
+
+    def get_stats(self) -> dict:
+        """Get queue statistics.
+
+        Returns:
+            Dictionary with the depth, peak and mean occupancy seen by new
+            frames, and the number of dropped frames.
+        """
+        with self._condition:
+            mean = self._occupancy / self._puts if self._puts else 0.0
+            return {
+                "queue_depth": self.depth,
+                "queue_peak": self.peak,
+                "queue_mean_occupancy": round(mean, 2),
+                "frames_dropped": self.dropped,
+            }
+
+
+class FramePipeline:
+    """Render frames on a generator thread and write them as they arrive.
+
+    The generator thread renders each frame ahead of its deadline on the
+    scheduler and queues it, so a slow terminal or blocked pipe only backs up
+    the queue instead of stalling generation. Frames are written on the
+    thread that calls ``run()``, which keeps Ctrl+C able to interrupt a
+    blocked write.
+    """
+
+    def __init__(
+        self,
+        render: Callable[[], object],
+        write: Callable[[object], None],
+        scheduler: FrameScheduler,
+        count: int | None = None,
+        depth: int = DEFAULT_DEPTH,
+        drop_policy: str = "block",
+    ):
+        """Initialize the pipeline.
+
+        Args:
+            render: Renders the next frame, on the generator thread.
+            write: Writes a frame, on the thread that calls ``run()``.
+            scheduler: Paces the generator thread.
+            count: Number of frames to render, or None to render until stopped.
+            depth: Maximum number of frames waiting to be written.
+            drop_policy: What to do with frames when the queue is full; one of
+                ``DROP_POLICIES``.
+
+        Raises:
+            ValueError: If the depth or drop policy is invalid.
+        """
+        self.render = render
+        self.write = write
+        self.scheduler = scheduler
+        self.count = count
+        self.queue = FrameQueue(depth, drop_policy)
+        self.produced = 0
+        self.written = 0
+        self._stopping = threading.Event()
+        self._error: BaseException | None = None
+        self._generator = threading.Thread(
+            target=self._generate, name="vibe-generator", daemon=True
+        )
+
+    def run(self) -> None:
+        """Write frames until ``count`` frames were rendered, or until stopped.
+
+        Raises:
+            BaseException: Whatever stopped the generator thread, if anything did.
+        """
+        self._generator.start()
+        try:
+            while (frame := self.queue.get()) is not None:
+                self.write(frame)
+                self.written += 1
+        finally:
+            self.stop()
+        if self._error is not None:
+            raise self._error
+
+    def stop(self) -> None:
+        """Stop rendering and discard any frames that weren't written."""
+        self._stopping.set()
+        self.queue.close(discard=True)
+        if self._generator.is_alive():
+            self._generator.join(STOP_TIMEOUT)
+
+    def get_stats(self) -> dict:
+        """Get pipeline statistics.
+
+        Returns:
+            Dictionary with the frames produced and written, queue statistics
+            and the scheduler's pacing statistics.
+        """
+        return {
+            "frames_produced": self.produced,
+            "frames_written": self.written,
+            **self.queue.get_stats(),
+            **self.scheduler.get_stats(),
+        }
+
+    def _generate(self) -> None:
+        """Render and queue frames on schedule until done or stopped."""
+        try:
+            frame = self.render()
+            self.scheduler.start()
+            while not self._stopping.is_set():
+                self.queue.put(frame)
+                self.produced += 1
+                if self.count is not None and self.produced >= self.count:
+                    break
+                frame = self.render()
+                self.scheduler.wait()
+        except BaseException as error:  # noqa: BLE001
+            # Hand errors, including interrupts raised here, to the writing thread
+            self._error = error
+        finally:
+            self.queue.close()
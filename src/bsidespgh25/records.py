@@ -0,0 +1,244 @@
+"""
+Structured vibe records for downstream pipelines, as JSON lines or binary frames.
+
+JSON lines records are one object per line::
+
+    {"record":"vibe","seq":0,"type":"word","art":"...","message":"...","timestamp":1.5}
+    {"record":"stats","timestamp":2.5,"stats":{"vibes_generated":1,...}}
+
+Binary records are frames of a ``FRAME`` header (record kind, length of the
+rest of the frame) followed by the record, with all integers little-endian:
+
+- Vibe records: a ``VIBE`` header (sequence number, timestamp, and the byte
+  lengths of the type, art and message), then those three as UTF-8.
+- Stats records: a ``STATS`` header (timestamp, number of entries), then per
+  entry a name length byte, the UTF-8 name, and a "q" tag and int64 or a "d"
+  tag and double.
+"""
+
+import json
+import struct
+import time
+from collections.abc import Iterator, Mapping
+from json.encoder import encode_basestring
+
+RECORD_FORMATS = ("jsonl", "binary")
+
+FRAME = struct.Struct("<BI")
+VIBE_RECORD = 1
+STATS_RECORD = 2
+VIBE = struct.Struct("<QdBII")
+STATS = struct.Struct("<dH")
+STAT_NAME = struct.Struct("<B")
+STAT_INT = struct.Struct("<cq")
+STAT_FLOAT = struct.Struct("<cd")
+
+# The frame and vibe headers, packed in one call
+_VIBE_FRAME = struct.Struct(f"<{FRAME.format[1:]}{VIBE.format[1:]}")
+
+
+class RecordEncoder:
+    """Encode vibes and statistics as records in one of ``RECORD_FORMATS``.
+
+    One encoder is reused for a whole stream. Art types and messages repeat,
+    so their encoded forms are cached, and each vibe record is built with a
+    single format or pack call rather than through an intermediate dict.
+    """
+
+    CACHE_SIZE = 4096
+
+    def __init__(self, record_format: str = "jsonl"):
+        """Initialize the encoder.
+
+        Args:
+            record_format: One of ``RECORD_FORMATS``.
+
+        Raises:
+            ValueError: If the record format is unknown.
+        """
+        if record_format not in RECORD_FORMATS:
+            raise ValueError(f"Unknown record format: {record_format}")
+        self.record_format = record_format
+        # Sequence number of the next vibe record
+        self.seq = 0
+        self._cache: dict[str, bytes | str] = {}
+        self._json = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+    def _cached(self, text: str) -> bytes | str:
+        """Encode a repeated string for this format, from the cache if possible."""
+        encoded = self._cache.get(text)
+        if encoded is None:
+            if self.record_format == "jsonl":
+                encoded = encode_basestring(text)
+            else:
+                encoded = text.encode("utf-8")
+            if len(self._cache) >= self.CACHE_SIZE:
+                # Evict the oldest entry to keep the cache bounded
+                del self._cache[next(iter(self._cache))]
+            self._cache[text] = encoded
+        return encoded
+
+    def encode_vibe(
+        self, art_type: str, art: str, message: str, timestamp: float | None = None
+    ) -> bytes:
+        """Encode a vibe as the next record in the sequence.
+
+        Args:
+            art_type: The vibe's art type.
+            art: The ASCII art.
+            message: The vibe message.
+            timestamp: When the vibe was generated; defaults to now.
+
+        Returns:
+            The encoded record.
+        """
+        seq = self.seq
+        self.seq += 1
+        if timestamp is None:
+            timestamp = time.time()
+
+        if self.record_format == "jsonl":
+            return (
+                f'{{"record":"vibe","seq":{seq},"type":{self._cached(art_type)},'
+                f'"art":{encode_basestring(art)},"message":{self._cached(message)},'
+                f'"timestamp":{timestamp!r}}}\n'
+            ).encode()
+
+        type_bytes = self._cached(art_type)
+        art_bytes = art.encode("utf-8")
+        message_bytes = self._cached(message)
+        length = VIBE.size + len(type_bytes) + len(art_bytes) + len(message_bytes)
+        header = _VIBE_FRAME.pack(
+            VIBE_RECORD,
+            length,
+            seq,
+            timestamp,
+            len(type_bytes),
+            len(art_bytes),
+            len(message_bytes),
+        )
+        return b"".join((header, type_bytes, art_bytes, message_bytes))  # type: ignore[arg-type]
+
+    def encode_stats(
+        self, stats: Mapping[str, int | float], timestamp: float | None = None
+    ) -> bytes:
+        """Encode statistics, e.g. from ``VibeGenerator.get_stats()``, as a record.
+
+        Args:
+            stats: Numeric statistics by name.
+            timestamp: When the statistics were taken; defaults to now.
+
+        Returns:
+            The encoded record.
+
+        Raises:
+            TypeError: If a statistic isn't a number.
+            ValueError: If a statistic's name is too long.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        for name, value in stats.items():
+            if not isinstance(value, (int, float)):
+                raise TypeError(f"Statistic {name} isn't a number: {value!r}")
+
+        if self.record_format == "jsonl":
+            record = {"record": "stats", "timestamp": timestamp, "stats": dict(stats)}
+            return (self._json.encode(record) + "\n").encode("utf-8")
+
+        parts = [STATS.pack(timestamp, len(stats))]
+        for name, value in stats.items():
+            name_bytes = name.encode("utf-8")
+            if len(name_bytes) > 255:
+                raise ValueError(f"Statistic name is too long: {name}")
+            parts += [STAT_NAME.pack(len(name_bytes)), name_bytes]
+            if isinstance(value, int):
+                parts.append(STAT_INT.pack(b"q", value))
+            else:
+                parts.append(STAT_FLOAT.pack(b"d", value))
+        body = b"".join(parts)
+        return FRAME.pack(STATS_RECORD, len(body)) + body
+
+
+def iter_binary_records(data: bytes) -> Iterator[dict]:
+    """Decode a stream of binary records.
+
+    Args:
+        data: Concatenated binary records.
+
+    Yields:
+        Each record as the dict its JSON lines form would decode to.
+
+    Raises:
+        ValueError: If the data is truncated or has an unknown record kind.
+    """
+    view = memoryview(data)
+    offset = 0
+    while offset < len(view):
+        if len(view) - offset < FRAME.size:
+            raise ValueError("Truncated record header")
+        kind, length = FRAME.unpack_from(view, offset)
+        offset += FRAME.size
+        body = view[offset : offset + length]
+        if len(body) != length:
+            raise ValueError("Truncated record")
+        offset += length
+
+        try:
+            yield _decode_record(kind, body)
+        except struct.error as error:
+            # A frame too short for the headers and entries it should hold
+            raise ValueError(f"Truncated record: {error}") from None
+
+
+def _decode_record(kind: int, body: memoryview) -> dict:
+    """Decode the body of a binary record.
+
+    Args:
+        kind: The record kind from the frame header.
+        body: The rest of the frame.
+
+    Returns:
+        The record as the dict its JSON lines form would decode to.
+
+    Raises:
+        ValueError: If the body is malformed or the record kind is unknown.
+        struct.error: If the body is too short for its headers or entries.
+    """
+    if kind == VIBE_RECORD:
+        seq, timestamp, type_length, art_length, message_length = VIBE.unpack_from(body)
+        if VIBE.size + type_length + art_length + message_length != len(body):
+            raise ValueError("Vibe record fields don't match its length")
+        start = VIBE.size
+        fields = []
+        for field_length in (type_length, art_length, message_length):
+            fields.append(bytes(body[start : start + field_length]).decode("utf-8"))
+            start += field_length
+        art_type, art, message = fields
+        return {
+            "record": "vibe",
+            "seq": seq,
+            "type": art_type,
+            "art": art,
+            "message": message,
+            "timestamp": timestamp,
+        }
+
+    if kind == STATS_RECORD:
+        timestamp, count = STATS.unpack_from(body)
+        start = STATS.size
+        stats: dict[str, int | float] = {}
+        for _ in range(count):
+            (name_length,) = STAT_NAME.unpack_from(body, start)
+            start += STAT_NAME.size
+            if start + name_length > len(body):
+                raise ValueError("Truncated statistic name")
+            name = bytes(body[start : start + name_length]).decode("utf-8")
+            start += name_length
+            tag, value = STAT_INT.unpack_from(body, start)
+            if tag == b"d":
+                tag, value = STAT_FLOAT.unpack_from(body, start)
+            stats[name] = value
+            start += STAT_INT.size
+        return {"record": "stats", "timestamp": timestamp, "stats": stats}
+
+    raise ValueError(f"Unknown record kind: {kind}")
@@ -0,0 +1,263 @@
+"""
+Registry of the art sources vibes are drawn from.
+"""
+
+from __future__ import annotations
+
+import bisect
+from operator import methodcaller
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import random
+    from collections.abc import Callable
+
+    from bsidespgh25.vibe_generator import VibeGenerator
+
+    ArtSource = Callable[[VibeGenerator], str]
+
+# Installed packages can add art sources under this entry point group
+ENTRY_POINT_GROUP = "bsidespgh25.art"
+
+
+class CountedSource:
+    """Wrap an art source so every vibe it renders is counted in the generator's stats."""
+
+    __slots__ = ("name", "source")
+
+    def __init__(self, name: str, source: ArtSource):
+        """Wrap an art source.
+
+        Args:
+            name: The art type to count vibes as.
+            source: The art source to wrap.
+        """
+        self.name = name
+        self.source = source
+
+    def __call__(self, vibe_gen: VibeGenerator) -> str:
+        vibe_gen.stats.record_vibe(self.name)
+        return self.source(vibe_gen)
+
+
+class ArtRegistry:
+    """Art sources by name, with weights for random selection.
+
+    An art source is any callable which takes a ``VibeGenerator`` and returns
+    the art as a string. Random selection bisects precomputed cumulative
+    weights, so its cost barely grows with the number of sources.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._sources: dict[str, ArtSource] = {}
+        self._weights: dict[str, float] = {}
+        self.names: tuple[str, ...] = ()
+        self._cumulative: list[float] = []
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._sources
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+    def __getitem__(self, name: str) -> ArtSource:
+        return self._sources[name]
+
+    def register(
+        self, name: str, source: ArtSource, weight: float = 1.0, counted: bool = True
+    ) -> None:
+        """Register an art source.
+
+        Args:
+            name: The art type name, as used with ``--vibe-type``.
+            source: Callable that renders art from a ``VibeGenerator``.
+            weight: Relative likelihood of random selection; 0 only allows explicit selection.
+            counted: Whether to count the vibes the source renders in the generator's
+                stats; sources which count their own vibes pass False.
+
+        Raises:
+            ValueError: If the name is taken or reserved, or the weight is negative.
+        """
+        if name == "random" or name in self._sources:
+            raise ValueError(f"Art type already registered: {name}")
+        if weight < 0:
+            raise ValueError("weight must not be negative")
+        self._sources[name] = CountedSource(name, source) if counted else source
+        self._weights[name] = weight
+        self._reindex()
+
+    def unregister(self, name: str) -> None:
+        """Remove an art source.
+
+        Args:
+            name: The art type name.
+
+        Raises:
+            KeyError: If no such art source is registered.
+        """
+        del self._sources[name]
+        del self._weights[name]
+        self._reindex()
+
+    def is_builtin(self, name: str) -> bool:
+        """Check whether a name is registered to its built-in art source.
+
+        Args:
+            name: The art type name.
+
+        Returns:
+            True if the name uses the built-in source, which allows batching.
+        """
+        return (
+            name in BUILTIN_SOURCES and self._sources.get(name) is BUILTIN_SOURCES[name]
+        )
+
+    def weight(self, name: str) -> float:
+        """Get the weight of an art source.
+
+        Args:
+            name: The art type name.
+
+        Returns:
+            The relative likelihood of random selection.
+        """
+        return self._weights[name]
+
+    def set_weight(self, name: str, weight: float) -> None:
+        """Change the weight of an art source.
+
+        Args:
+            name: The art type name.
+            weight: Relative likelihood of random selection.
+
+        Raises:
+            KeyError: If no such art source is registered.
+            ValueError: If the weight is negative.
+        """
+        if name not in self._sources:
+            raise KeyError(name)
+        if weight < 0:
+            raise ValueError("weight must not be negative")
+        self._weights[name] = weight
+        self._reindex()
+
+    def choose(self, rng: random.Random) -> str:
+        """Pick an art type at random, according to the weights.
+
+        Args:
+            rng: The random stream to draw from.
+
+        Returns:
+            The chosen art type name.
+
+        Raises:
+            ValueError: If no art source has a positive weight.
+        """
+        total = self._total()
+        return self.names[bisect.bisect(self._cumulative, rng.random() * total)]
+
+    def choose_many(self, rng: random.Random, count: int) -> list[str]:
+        """Pick many art types at random, according to the weights.
+
+        Args:
+            rng: The random stream to draw from.
+            count: Number of art types to pick.
+
+        Returns:
+            The chosen art type names.
+
+        Raises:
+            ValueError: If no art source has a positive weight.
+        """
+        self._total()
+        return rng.choices(self.names, cum_weights=self._cumulative, k=count)
+
+    def copy(self) -> ArtRegistry:
+        """Copy the registry, e.g. to change weights for one generator.
+
+        Returns:
+            A new registry with the same sources and weights.
+        """
+        registry = ArtRegistry()
+        registry._sources = dict(self._sources)
+        registry._weights = dict(self._weights)
+        registry._reindex()
+        return registry
+
+    def load_entry_points(self, group: str = ENTRY_POINT_GROUP) -> list[str]:
+        """Register the art sources installed packages advertise as entry points.
+
+        Each entry point's name is the art type and it loads the art source. A
+        ``weight`` attribute on the source sets its weight. Sources that fail
+        to load are logged and skipped.
+
+        Args:
+            group: The entry point group to load.
+
+        Returns:
+            Names of the newly registered art types.
+        """
+        # Scanning installed packages is slow, so only pay for it when asked
+        import logging
+        from importlib.metadata import entry_points
+
+        log = logging.getLogger(__name__)
+        loaded = []
+        for entry_point in entry_points(group=group):
+            if entry_point.name in self._sources:
+                log.debug("Art type %s is already registered", entry_point.name)
+                continue
+            try:
+                source = entry_point.load()
+                self.register(entry_point.name, source, getattr(source, "weight", 1.0))
+            except Exception:
+                log.exception("Failed to load art source %s", entry_point.value)
+                continue
+            loaded.append(entry_point.name)
+        return loaded
+
+    def _total(self) -> float:
+        """Get the total weight, which must be positive to choose at random."""
+        total = self._cumulative[-1] if self._cumulative else 0.0
+        if total <= 0:
+            raise ValueError("No art sources with a positive weight to choose from")
+        return total
+
+    def _reindex(self) -> None:
+        """Recompute the names and cumulative weights after a change."""
+        self.names = tuple(self._sources)
+        self._cumulative = []
+        total = 0.0
+        for name in self.names:
+            total += self._weights[name]
+            self._cumulative.append(total)
+
+
+BUILTIN_SOURCES = {
+    "pattern": methodcaller("generate_random_pattern"),
+    "matrix": methodcaller("generate_cyber_matrix"),
+    "word": methodcaller("generate_word_art"),
+    "banner": methodcaller("generate_banner"),
+}
+# Built-in art types that are only drawn when asked for by name or given a weight
+EXPLICIT_SOURCES = frozenset({"banner"})
+
+
+def default_registry() -> ArtRegistry:
+    """Create a registry with the built-in art sources.
+
+    Returns:
+        A registry with equally weighted pattern, matrix and word art, and
+        banner art for explicit selection.
+    """
+    registry = ArtRegistry()
+    for name, source in BUILTIN_SOURCES.items():
+        # The generator methods count their own vibes
+        weight = 0.0 if name in EXPLICIT_SOURCES else 1.0
+        registry.register(name, source, weight, counted=False)
+    return registry
+
+
+# The registry every VibeGenerator uses unless given its own
+ART_REGISTRY = default_registry()
@@ -0,0 +1,259 @@
+"""
+Weighted sampling with an optional guarantee against recent repeats.
+"""
+
+from __future__ import annotations
+
+import bisect
+from collections import deque
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import random
+    from collections.abc import Mapping, Sequence
+
+# Redraws allowed before falling back to an exact draw from the items not drawn recently
+MAX_REDRAWS = 8
+
+
+class Sampler:
+    """Draw items by weight in O(1) with Vose's alias method.
+
+    With ``no_repeat`` set to K, an item is never drawn again within K draws
+    of its last draw. Recently drawn items are redrawn, which is cheap unless
+    they hold most of the weight, in which case the draw falls back to a
+    weighted choice among the remaining items.
+
+    The sampler keeps the sequence it was given rather than a copy, so a
+    list that grows or shrinks afterwards is followed: the tables are
+    rebuilt on the next draw, with any new items weighing 1.
+    """
+
+    __slots__ = (
+        "_alias",
+        "_probability",
+        "_recent",
+        "_recent_set",
+        "_size",
+        "_uniform",
+        "items",
+        "no_repeat",
+        "weights",
+    )
+
+    def __init__(
+        self,
+        items: Sequence,
+        weights: Sequence[float] | None = None,
+        no_repeat: int = 0,
+    ):
+        """Build the alias tables.
+
+        Args:
+            items: The items to draw from. Any sequence works; only drawn
+                items are ever looked up.
+            weights: Relative weight of each item; defaults to equal weights.
+            no_repeat: Number of draws an item is excluded from after being drawn.
+
+        Raises:
+            ValueError: If there are no items, the weights don't match the items,
+                or too few items can be drawn to honor ``no_repeat``.
+        """
+        if not items:
+            raise ValueError("Can't sample from no items")
+        if weights is None:
+            self.weights = [1.0] * len(items)
+            drawable = len(items)
+        else:
+            if len(weights) != len(items):
+                raise ValueError(f"Expected {len(items)} weights, got {len(weights)}")
+            if any(weight < 0 for weight in weights):
+                raise ValueError("Weights must not be negative")
+            self.weights = [float(weight) for weight in weights]
+            drawable = sum(1 for weight in weights if weight > 0)
+            if not drawable:
+                raise ValueError("At least one weight must be positive")
+        if not 0 <= no_repeat < drawable:
+            raise ValueError(
+                f"no_repeat must be between 0 and {drawable - 1} for these weights"
+            )
+
+        self.items = items
+        self.no_repeat = no_repeat
+        self._recent: deque[int] = deque()
+        self._recent_set: set[int] = set()
+        self._uniform = weights is None
+        self._build()
+
+    @classmethod
+    def from_config(
+        cls,
+        items: Sequence,
+        weights: Sequence[float] | Mapping | None = None,
+        no_repeat: int = 0,
+    ) -> Sampler:
+        """Create a sampler from configured weights.
+
+        Unlike the constructor, a ``no_repeat`` larger than the items allow is
+        reduced to the largest possible window, so one setting can apply to
+        item lists of any length.
+
+        Args:
+            items: The items to draw from.
+            weights: A weight per item, a mapping of items to weights where
+                unlisted items weigh 1, or None for equal weights.
+            no_repeat: Number of draws an item is excluded from after being drawn.
+
+        Returns:
+            The sampler.
+
+        Raises:
+            ValueError: If a mapping names an unknown item, or the weights are invalid.
+        """
+        if isinstance(weights, dict):
+            unknown = set(weights) - set(items)
+            if unknown:
+                raise ValueError(f"Weights for unknown items: {sorted(unknown)}")
+            weights = [weights.get(item, 1.0) for item in items]
+        if weights is None:
+            drawable = len(items)
+        else:
+            drawable = sum(1 for weight in weights if weight > 0)
+        return cls(items, weights, max(0, min(no_repeat, drawable - 1)))
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def _build(self) -> None:
+        """Build the alias tables for the current items."""
+        self._size = len(self.items)
+        if self._uniform:
+            # Equal weights never need an alias, so large packs skip building the tables
+            self._probability, self._alias = self.weights, range(self._size)
+        else:
+            self._probability, self._alias = self._build_tables(self.weights)
+
+    def _resize(self) -> None:
+        """Rebuild the tables after the items changed length.
+
+        Raises:
+            ValueError: If no items are left to draw.
+        """
+        size = len(self.items)
+        if not size:
+            raise ValueError("Can't sample from no items")
+        del self.weights[size:]
+        self.weights += [1.0] * (size - len(self.weights))
+        drawable = sum(1 for weight in self.weights if weight > 0)
+        if not drawable:
+            raise ValueError("At least one weight must be positive")
+        self.no_repeat = min(self.no_repeat, drawable - 1)
+        # Recent indices may be past the end or now point at other items
+        self._recent.clear()
+        self._recent_set.clear()
+        self._build()
+
+    def draw(self, rng: random.Random):
+        """Draw an item.
+
+        Args:
+            rng: The random stream to draw from.
+
+        Returns:
+            The drawn item.
+        """
+        if len(self.items) != self._size:
+            self._resize()
+        index = self._draw_index(rng)
+        if self.no_repeat:
+            index = self._avoid_recent(index, rng)
+        return self.items[index]
+
+    def draw_many(self, rng: random.Random, count: int) -> list:
+        """Draw many items, e.g. for a batch of vibes.
+
+        Args:
+            rng: The random stream to draw from.
+            count: Number of items to draw.
+
+        Returns:
+            The drawn items, honoring ``no_repeat`` across the whole batch.
+        """
+        if len(self.items) != self._size:
+            self._resize()
+        if self.no_repeat:
+            return [self.draw(rng) for _ in range(count)]
+
+        items = self.items
+        probability = self._probability
+        alias = self._alias
+        size = self._size
+        random_ = rng.random
+        drawn = []
+        for _ in range(count):
+            position = random_() * size
+            index = int(position)
+            if position - index >= probability[index]:
+                index = alias[index]
+            drawn.append(items[index])
+        return drawn
+
+    def _draw_index(self, rng: random.Random) -> int:
+        """Draw an index from the alias tables using a single random number."""
+        position = rng.random() * self._size
+        index = int(position)
+        if position - index < self._probability[index]:
+            return index
+        return self._alias[index]
+
+    def _avoid_recent(self, index: int, rng: random.Random) -> int:
+        """Redraw an index until it wasn't drawn recently, then remember it."""
+        redraws = 0
+        while index in self._recent_set:
+            redraws += 1
+            if redraws > MAX_REDRAWS:
+                index = self._draw_excluding_recent(rng)
+                break
+            index = self._draw_index(rng)
+
+        self._recent.append(index)
+        self._recent_set.add(index)
+        if len(self._recent) > self.no_repeat:
+            self._recent_set.discard(self._recent.popleft())
+        return index
+
+    def _draw_excluding_recent(self, rng: random.Random) -> int:
+        """Draw an index by weight from the items that weren't drawn recently."""
+        indices = []
+        cumulative = []
+        total = 0.0
+        for index, weight in enumerate(self.weights):
+            if weight > 0 and index not in self._recent_set:
+                total += weight
+                indices.append(index)
+                cumulative.append(total)
+        return indices[bisect.bisect(cumulative, rng.random() * total)]
+
+    @staticmethod
+    def _build_tables(weights: list[float]) -> tuple[list[float], list[int]]:
+        """Build the probability and alias tables for Vose's alias method."""
+        size = len(weights)
+        total = sum(weights)
+        scaled = [weight * size / total for weight in weights]
+        probability = [1.0] * size
+        alias = list(range(size))
+        small = [index for index, weight in enumerate(scaled) if weight < 1]
+        large = [index for index, weight in enumerate(scaled) if weight >= 1]
+
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            probability[less] = scaled[less]
+            alias[less] = more
+            scaled[more] -= 1 - scaled[less]
+            if scaled[more] < 1:
+                small.append(more)
+            else:
+                large.append(more)
+        # Whatever is left over is 1 up to rounding errors
+        return probability, alias
@@ -0,0 +1,101 @@
+"""
+Frame pacing against absolute deadlines.
+"""
+
+import time
+from collections import deque
+from collections.abc import Callable
+
+# Lateness samples kept for the jitter percentiles
+JITTER_SAMPLES = 4096
+JITTER_PERCENTILES = (50, 95, 99)
+
+
+class FrameScheduler:
+    """Pace frames to absolute deadlines on the monotonic clock.
+
+    Frame N is due ``N * period`` after ``start()``, however long each frame
+    took to produce, so the period doesn't drift. A frame that isn't ready by
+    its deadline counts as missed; if it is late by whole periods, those
+    slots are skipped rather than rushed through to catch up.
+    """
+
+    def __init__(
+        self,
+        period: float,
+        clock: Callable[[], float] | None = None,
+        sleep: Callable[[float], None] | None = None,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            period: Seconds between frames.
+            clock: Monotonic clock returning seconds; defaults to ``time.monotonic``.
+            sleep: Sleeps for a number of seconds; defaults to ``time.sleep``.
+
+        Raises:
+            ValueError: If the period is negative.
+        """
+        if period < 0:
+            raise ValueError("period must not be negative")
+        self.period = period
+        self._clock = time.monotonic if clock is None else clock
+        self._sleep = time.sleep if sleep is None else sleep
+        self.deadline: float | None = None
+        self.frames = 0
+        self.missed = 0
+        self._lateness: deque[float] = deque(maxlen=JITTER_SAMPLES)
+
+    def start(self) -> None:
+        """Start the schedule; the first frame is due now."""
+        self.deadline = self._clock()
+
+    def wait(self) -> None:
+        """Sleep until the next frame is due."""
+        if self.deadline is None:
+            self.start()
+        self.frames += 1
+        if not self.period:
+            return
+
+        self.deadline += self.period
+        remaining = self.deadline - self._clock()
+        if remaining > 0:
+            self._sleep(remaining)
+            self._lateness.append(max(0.0, self._clock() - self.deadline))
+            return
+
+        # Measure against the frame's own deadline, before skipping past it
+        self._lateness.append(-remaining)
+        self.missed += 1
+        skipped = int(-remaining // self.period)
+        if skipped:
+            self.missed += skipped
+            self.deadline += skipped * self.period
+
+    def jitter(self) -> dict[int, float]:
+        """Get percentiles of how late frames were, in seconds.
+
+        Returns:
+            Dictionary of percentile to lateness, over recent frames.
+        """
+        samples = sorted(self._lateness)
+        if not samples:
+            return dict.fromkeys(JITTER_PERCENTILES, 0.0)
+        return {
+            percentile: samples[min(len(samples) - 1, len(samples) * percentile // 100)]
+            for percentile in JITTER_PERCENTILES
+        }
+
+    def get_stats(self) -> dict:
+        """Get pacing statistics.
+
+        Returns:
+            Dictionary with the frames scheduled, missed deadlines and jitter
+            percentiles in milliseconds.
+        """
+        stats = {"frames_scheduled": self.frames, "missed_deadlines": self.missed}
+        for percentile, lateness in self.jitter().items():
+            stats[f"jitter_p{percentile}_ms"] = round(lateness * 1000, 3)
+        stats["jitter_max_ms"] = round(max(self._lateness, default=0.0) * 1000, 3)
+        return stats
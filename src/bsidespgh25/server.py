@@ -0,0 +1,319 @@
+"""
+Stream vibes to many clients over TCP, chunked HTTP or server-sent events.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Iterator
+
+from bsidespgh25.output import format_vibe
+from bsidespgh25.vibe_generator import VibeGenerator
+
+LOG = logging.getLogger(__name__)
+
+# How long to wait for a client to speak before treating it as a raw TCP client
+PROBE_TIMEOUT = 0.25
+# How long an HTTP client has to send its headers, and how many it may send
+HEADER_TIMEOUT = 5.0
+MAX_HEADER_LINES = 100
+
+HTTP_HEADERS = {
+    "text": b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: text/plain; charset=utf-8\r\n"
+    b"Transfer-Encoding: chunked\r\n"
+    b"Cache-Control: no-cache\r\n\r\n",
+    "sse": b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: text/event-stream; charset=utf-8\r\n"
+    b"Transfer-Encoding: chunked\r\n"
+    b"Cache-Control: no-cache\r\n\r\n",
+}
+HTTP_NOT_FOUND = (
+    b"HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\nConnection: close\r\n\r\n"
+)
+HTTP_BAD_REQUEST = (
+    b"HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\nConnection: close\r\n\r\n"
+)
+HTTP_PATHS = {"/": "text", "/vibes": "text", "/events": "sse"}
+
+# Which pre-encoded form of a frame each protocol sends
+FRAME_ENCODINGS = {"tcp": "raw", "text": "http", "sse": "sse"}
+
+
+def parse_address(address: str) -> tuple[str, int]:
+    """Parse a HOST:PORT string.
+
+    Args:
+        address: The address to parse; the host may be empty to listen on all interfaces.
+
+    Returns:
+        Tuple of (host, port).
+
+    Raises:
+        ValueError: If the address is not in HOST:PORT form.
+    """
+    host, separator, port = address.rpartition(":")
+    if not separator or not port.isdigit():
+        raise ValueError(f"Expected HOST:PORT, got {address!r}")
+    return host.strip("[]") or "0.0.0.0", int(port)
+
+
+def _chunk(data: bytes) -> bytes:
+    """Wrap data in an HTTP/1.1 chunk."""
+    return b"%x\r\n%s\r\n" % (len(data), data)
+
+
+class ServerFrame:
+    """A vibe encoded once for every protocol the server speaks."""
+
+    __slots__ = ("http", "raw", "sequence", "sse")
+
+    def __init__(self, sequence: int, art: str, message: str):
+        """Encode a vibe.
+
+        Args:
+            sequence: The frame sequence number.
+            art: The ASCII art.
+            message: The vibe message.
+        """
+        text = format_vibe(art, message)
+        event = "".join(f"data: {line}\n" for line in text.rstrip("\n").split("\n"))
+
+        self.sequence = sequence
+        self.raw = text.encode()
+        self.http = _chunk(self.raw)
+        self.sse = _chunk(f"id: {sequence}\nevent: vibe\n{event}\n".encode())
+
+
+class Subscriber:
+    """A client's bounded frame queue which drops the oldest frame when full."""
+
+    def __init__(self, queue_size: int):
+        """Initialize the subscriber.
+
+        Args:
+            queue_size: Maximum number of frames waiting to be sent.
+        """
+        self.queue: asyncio.Queue[ServerFrame] = asyncio.Queue(maxsize=queue_size)
+        self.dropped = 0
+
+    def offer(self, frame: ServerFrame) -> None:
+        """Queue a frame, dropping the oldest queued frame if the client is behind.
+
+        Args:
+            frame: The frame to queue.
+        """
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(frame)
+
+
+class VibeServer:
+    """Generate vibes once and stream them to every connected client."""
+
+    def __init__(
+        self,
+        vibe_gen: VibeGenerator,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        vibe_type: str = "random",
+        delay: float = 2.0,
+        ring_size: int = 32,
+        queue_size: int = 8,
+    ):
+        """Initialize the server.
+
+        Args:
+            vibe_gen: The vibe generator to draw frames from.
+            host: Interface to listen on.
+            port: Port to listen on; 0 picks a free port.
+            vibe_type: Type of vibe to generate.
+            delay: Delay between frames in seconds.
+            ring_size: Number of recent frames kept and pre-generated at a time.
+            queue_size: Maximum frames queued per client before dropping the oldest.
+        """
+        self.vibe_gen = vibe_gen
+        self.host = host
+        self.port = port
+        self.vibe_type = vibe_type
+        self.delay = delay
+        self.queue_size = queue_size
+        self.ring: deque[ServerFrame] = deque(maxlen=ring_size)
+        self.subscribers: set[Subscriber] = set()
+        self.frames_published = 0
+        self.frames_dropped = 0
+        self.clients_served = 0
+        self._vibes: Iterator[tuple[str, str]] = vibe_gen.iter_vibes(
+            vibe_type=vibe_type, batch_size=ring_size
+        )
+        self._server: asyncio.Server | None = None
+        self._producer: asyncio.Task | None = None
+        self._handlers: set[asyncio.Task] = set()
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """The (host, port) the server is listening on."""
+        if self._server is None:
+            return self.host, self.port
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def start(self, produce: bool = True) -> None:
+        """Start listening and, optionally, producing frames.
+
+        Args:
+            produce: Whether to start the frame producer.
+        """
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        if produce:
+            self._producer = asyncio.create_task(self._produce())
+        LOG.info("Serving vibes on %s:%s", *self.address)
+
+    async def stop(self) -> None:
+        """Stop producing frames and close the listening socket."""
+        if self._producer is not None:
+            self._producer.cancel()
+            await asyncio.gather(self._producer, return_exceptions=True)
+            self._producer = None
+        if self._server is not None:
+            self._server.close()
+            for handler in self._handlers:
+                handler.cancel()
+            await asyncio.gather(*self._handlers, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    async def serve_forever(self) -> None:
+        """Start the server and run until cancelled."""
+        await self.start()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await self.stop()
+
+    def publish(self, art: str, message: str) -> ServerFrame:
+        """Encode a vibe once and queue it for every subscriber.
+
+        Args:
+            art: The ASCII art.
+            message: The vibe message.
+
+        Returns:
+            The published frame.
+        """
+        self.frames_published += 1
+        frame = ServerFrame(self.frames_published, art, message)
+        self.ring.append(frame)
+        for subscriber in self.subscribers:
+            subscriber.offer(frame)
+        return frame
+
+    def get_stats(self) -> dict:
+        """Get server statistics.
+
+        Returns:
+            Dictionary containing server statistics.
+        """
+        return {
+            "clients_connected": len(self.subscribers),
+            "clients_served": self.clients_served,
+            "frames_published": self.frames_published,
+            "frames_dropped": self.frames_dropped
+            + sum(subscriber.dropped for subscriber in self.subscribers),
+        }
+
+    async def _produce(self) -> None:
+        """Publish a new frame every delay seconds."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        for art, message in self._vibes:
+            self.publish(art, message)
+            deadline += self.delay
+            await asyncio.sleep(max(0.0, deadline - loop.time()))
+
+    async def _detect_protocol(self, reader: asyncio.StreamReader) -> str | None:
+        """Work out what a new client speaks.
+
+        Returns:
+            "tcp", "text" or "sse", or None for an unknown HTTP path.
+
+        Raises:
+            ValueError: If a line is too long, or an HTTP client sends too many
+                headers or takes too long to send them.
+        """
+        try:
+            request = await asyncio.wait_for(reader.readline(), PROBE_TIMEOUT)
+        except TimeoutError:
+            return "tcp"
+
+        if not request.startswith(b"GET "):
+            return "tcp"
+
+        try:
+            await asyncio.wait_for(self._skip_headers(reader), HEADER_TIMEOUT)
+        except TimeoutError:
+            raise ValueError("Request headers took too long") from None
+        parts = request.split()
+        if len(parts) < 2:
+            # A request line without a path can't match any page
+            return None
+        path = parts[1].decode("latin-1").split("?")[0]
+        return HTTP_PATHS.get(path)
+
+    @staticmethod
+    async def _skip_headers(reader: asyncio.StreamReader) -> None:
+        """Read up to the blank line that ends the request headers.
+
+        Raises:
+            ValueError: If a header is too long or there are too many.
+        """
+        for _ in range(MAX_HEADER_LINES):
+            if not (await reader.readline()).strip():
+                return
+        raise ValueError("Too many request headers")
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Stream frames to a single client until it disconnects."""
+        subscriber = Subscriber(self.queue_size)
+        handler = asyncio.current_task()
+        if handler is not None:
+            self._handlers.add(handler)
+        try:
+            try:
+                protocol = await self._detect_protocol(reader)
+            except ValueError as error:
+                LOG.debug("Bad request: %s", error)
+                writer.write(HTTP_BAD_REQUEST)
+                await writer.drain()
+                return
+            if protocol is None:
+                writer.write(HTTP_NOT_FOUND)
+                await writer.drain()
+                return
+            if protocol in HTTP_HEADERS:
+                writer.write(HTTP_HEADERS[protocol])
+
+            self.clients_served += 1
+            self.subscribers.add(subscriber)
+            if self.ring:
+                subscriber.offer(self.ring[-1])
+
+            encoding = FRAME_ENCODINGS[protocol]
+            while True:
+                frame = await subscriber.queue.get()
+                writer.write(getattr(frame, encoding))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            LOG.debug("Client disconnected")
+        except asyncio.CancelledError:
+            # The server is shutting down; end the connection cleanly
+            LOG.debug("Closing client connection")
+        finally:
+            if subscriber in self.subscribers:
+                self.subscribers.discard(subscriber)
+                self.frames_dropped += subscriber.dropped
+            if handler is not None:
+                self._handlers.discard(handler)
+            writer.close()
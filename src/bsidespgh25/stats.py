@@ -0,0 +1,163 @@
+"""
+Thread-safe vibe statistics.
+"""
+
+import threading
+import time
+from collections import Counter
+
+BYTES = "bytes"
+VIBE_PREFIX = "vibes."
+
+
+class _ThreadToken:
+    """Held only by a thread's local storage, so it goes away with the thread."""
+
+    __slots__ = ("__weakref__",)
+
+
+class VibeStats:
+    """Counters that many threads can update without contending on a lock.
+
+    Every thread increments its own ``Counter``; a lock is only taken the
+    first time a thread records something, when the thread ends and its
+    counter is folded into the shared totals, and when the counters are
+    merged for reading.
+    """
+
+    def __init__(self):
+        """Initialize empty counters and start the clock used for rates."""
+        self.started = time.monotonic()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # Counters of the threads still running, by id
+        self._counters: dict[int, Counter] = {}
+        # Counts of the threads that have finished
+        self._retired: Counter = Counter()
+
+    def increment(self, key: str, amount: int = 1) -> None:
+        """Increment a counter for the calling thread.
+
+        Args:
+            key: Name of the counter.
+            amount: Amount to add.
+        """
+        try:
+            counter = self._local.counter
+        except AttributeError:
+            counter = self._register_thread()
+        counter[key] += amount
+
+    def _register_thread(self) -> Counter:
+        """Create the calling thread's counter, retired when the thread ends."""
+        import weakref
+
+        counter = self._local.counter = Counter()
+        token = self._local.token = _ThreadToken()
+        with self._lock:
+            self._counters[id(counter)] = counter
+        # The callback mustn't refer to self, or the local storage would keep
+        # these statistics alive for as long as the thread runs
+        finalizer = weakref.finalize(
+            token, _retire, self._lock, self._counters, self._retired, counter
+        )
+        finalizer.atexit = False
+        return counter
+
+    def record_vibe(self, vibe_type: str, count: int = 1) -> None:
+        """Record generated vibes.
+
+        Args:
+            vibe_type: The type of vibe generated.
+            count: Number of vibes generated.
+        """
+        self.increment(VIBE_PREFIX + vibe_type, count)
+
+    def record_bytes(self, count: int) -> None:
+        """Record bytes emitted.
+
+        Args:
+            count: Number of bytes emitted.
+        """
+        self.increment(BYTES, count)
+
+    def merge(self, counts: dict[str, int]) -> None:
+        """Add counts gathered elsewhere, e.g. by a worker process.
+
+        Args:
+            counts: Counters as returned by ``counts()``.
+        """
+        for key, amount in counts.items():
+            self.increment(key, amount)
+
+    def counts(self) -> dict[str, int]:
+        """Merge every thread's counters.
+
+        Returns:
+            The summed counters.
+        """
+        with self._lock:
+            total = self._retired.copy()
+            counters = list(self._counters.values())
+        for counter in counters:
+            # dict.copy() is atomic, so the owning thread can keep counting
+            total.update(dict.copy(counter))
+        return dict(total)
+
+    def vibes_by_type(self, counts: dict[str, int] | None = None) -> dict[str, int]:
+        """Get the number of vibes generated per type.
+
+        Args:
+            counts: Previously merged counters, to avoid merging again.
+
+        Returns:
+            Dictionary mapping vibe type to count.
+        """
+        counts = self.counts() if counts is None else counts
+        return {
+            key.removeprefix(VIBE_PREFIX): value
+            for key, value in counts.items()
+            if key.startswith(VIBE_PREFIX)
+        }
+
+    def total_vibes(self) -> int:
+        """Get the total number of vibes generated.
+
+        Returns:
+            The number of vibes generated across all threads.
+        """
+        return sum(self.vibes_by_type().values())
+
+    def snapshot(self) -> dict:
+        """Get totals and rates.
+
+        Returns:
+            Dictionary with totals, per-type counts, bytes and rates per second.
+        """
+        counts = self.counts()
+        by_type = self.vibes_by_type(counts)
+        vibes = sum(by_type.values())
+        emitted = counts.get(BYTES, 0)
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+
+        return {
+            "vibes": vibes,
+            "by_type": by_type,
+            "bytes_emitted": emitted,
+            "elapsed_seconds": round(elapsed, 3),
+            "vibes_per_second": round(vibes / elapsed, 2),
+            "bytes_per_second": round(emitted / elapsed, 2),
+            "counts": counts,
+        }
+
+
+def _retire(
+    lock: threading.Lock,
+    counters: dict[int, Counter],
+    retired: Counter,
+    counter: Counter,
+) -> None:
+    """Fold a finished thread's counter into the shared totals."""
+    with lock:
+        counters.pop(id(counter), None)
+        retired.update(counter)
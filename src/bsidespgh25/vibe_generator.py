@@ -3,7 +3,19 @@ Vibe generator for creating cybersecurity-themed ASCII art.
 """
 
 import random
-from typing import Tuple
+import threading
+from collections.abc import Iterator
+
+from bsidespgh25.matrix import DEFAULT_SIZE, MatrixBuffer
+from bsidespgh25.registry import ART_REGISTRY, ArtRegistry
+from bsidespgh25.sampler import Sampler
+from bsidespgh25.stats import VibeStats
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from bsidespgh25.catalog import VibeCatalog
+    from bsidespgh25.content import ContentPack
+    from bsidespgh25.frame import Frame
 
 
 class VibeGenerator:
@@ -72,9 +84,200 @@ class VibeGenerator:
         "🔍 Scanning for maximum vibes... Found! 🔍",
     ]
 
-    def __init__(self):
-        """Initialize the vibe generator."""
-        self.vibe_count = 0
+    # The built-in art types; ``registry`` holds every available one
+    ART_TYPES = ("pattern", "matrix", "word")
+
+    MATRIX_CHARS = "01╬═║╔╗╚╝░▓█"
+
+    WORD_ART_CACHE_SIZE = 256
+    # Patterns, word art and messages come from bounded lists, so their
+    # encodings are worth keeping
+    ENCODED_CACHE_SIZE = 4096
+    # Built-in art types whose art repeats, so its encoding is cached
+    STATIC_ART_TYPES = ("pattern", "word", "banner")
+
+    def __init__(
+        self,
+        seed: int | None = None,
+        catalog: "VibeCatalog | None" = None,
+        registry: ArtRegistry | None = None,
+        weights: dict | None = None,
+        no_repeat: int = 0,
+        content: "ContentPack | None" = None,
+        matrix_size: tuple[int, int] = DEFAULT_SIZE,
+        banner_text: str | None = None,
+    ):
+        """Initialize the vibe generator.
+
+        Args:
+            seed: Seed for this generator's random stream, or None to seed from the OS.
+            catalog: Pre-rendered vibes for ``iter_frames()`` to serve.
+            registry: Art sources to draw from; defaults to the shared ``ART_REGISTRY``.
+            weights: Selection weights, as loaded by ``config.load_weights()``:
+                "art_types", "patterns", "words" and "messages" each map to a
+                list of weights or a mapping of items to weights.
+            no_repeat: Number of draws a pattern, word or message is excluded
+                from after being drawn, up to what each list allows.
+            content: Patterns, words and messages to use instead of the built-in
+                ones, e.g. from ``content.load_content_pack()``.
+            matrix_size: Default (width, height) of matrix art.
+            banner_text: Text for banner art instead of a random cyber word.
+
+        Raises:
+            ValueError: If the weights are invalid.
+        """
+        weights = weights or {}
+        self.seed = seed
+        self.catalog = catalog
+        self.registry = ART_REGISTRY if registry is None else registry
+        if weights.get("art_types"):
+            self.registry = self.registry.copy()
+            for art_type, weight in weights["art_types"].items():
+                if art_type not in self.registry:
+                    raise ValueError(f"Weight for unknown vibe type: {art_type}")
+                self.registry.set_weight(art_type, weight)
+        self.weights = weights
+        self.no_repeat = no_repeat
+        self.content = content
+        # The built-in lists the samplers were built from, to notice them being replaced
+        self._sampled_lists = self._builtin_lists()
+        self.pattern_sampler, self.word_sampler, self.message_sampler = (
+            self.build_samplers(content)
+        )
+        self.rng = random.Random(seed)
+        self.stats = VibeStats()
+        self._word_art_cache: dict[str, str] = {}
+        self._encoded_cache: dict[str, bytes] = {}
+        self.matrix_size = matrix_size
+        self._matrix_buffer = MatrixBuffer(*matrix_size, self.MATRIX_CHARS)
+        self.banner_text = banner_text
+        self._staged_content: tuple | None = None
+        self._staged_lock = threading.Lock()
+
+    def build_samplers(
+        self, content: "ContentPack | None" = None
+    ) -> tuple[Sampler, Sampler, Sampler]:
+        """Build samplers over a content pack with this generator's weights.
+
+        Args:
+            content: The content pack; its missing sections, or all of them if
+                None, fall back to the built-in content.
+
+        Returns:
+            Tuple of (pattern_sampler, word_sampler, message_sampler).
+
+        Raises:
+            ValueError: If the weights don't fit the content.
+        """
+        defaults = self._builtin_lists()
+        sections = (None,) * len(defaults) if content is None else content.sections()
+        return tuple(
+            Sampler.from_config(
+                default if section is None else section,
+                self.weights.get(name),
+                self.no_repeat,
+            )
+            for name, default, section in zip(
+                ("patterns", "words", "messages"), defaults, sections
+            )
+        )
+
+    def stage_content(self, content: "ContentPack | None") -> None:
+        """Prepare new content for ``swap_content()`` to switch to.
+
+        Building the samplers is the slow part of a switch, so call this from
+        a background thread and leave only the swap to the render loop.
+
+        Args:
+            content: The new content pack, or None for the built-in content.
+
+        Raises:
+            ValueError: If the weights don't fit the content.
+        """
+        lists = self._builtin_lists()
+        samplers = self.build_samplers(content)
+        with self._staged_lock:
+            self._staged_content = (content, lists, samplers)
+
+    def swap_content(self) -> bool:
+        """Switch to the content prepared by ``stage_content()``, if any.
+
+        The patterns, words and messages all change at once, so call this
+        between vibes.
+
+        Returns:
+            True if the content changed.
+        """
+        if self._staged_content is None:
+            return False
+        with self._staged_lock:
+            staged, self._staged_content = self._staged_content, None
+        self.content, self._sampled_lists, samplers = staged
+        self.pattern_sampler, self.word_sampler, self.message_sampler = samplers
+        self.stats.increment("content_reloads")
+        return True
+
+    def _builtin_lists(self) -> tuple[list[str], list[str], list[str]]:
+        """The built-in patterns, words and messages, as currently assigned."""
+        return (self.ASCII_PATTERNS, self.CYBER_WORDS, self.VIBE_MESSAGES)
+
+    def _follow_lists(self) -> None:
+        """Rebuild the samplers if a built-in list was replaced since they were built.
+
+        Samplers follow lists changed in place themselves; this catches lists
+        assigned anew, on the class or on this generator.
+        """
+        patterns, words, messages = self._sampled_lists
+        if (
+            self.CYBER_WORDS is not words
+            or self.ASCII_PATTERNS is not patterns
+            or self.VIBE_MESSAGES is not messages
+        ):
+            self._sampled_lists = self._builtin_lists()
+            self.pattern_sampler, self.word_sampler, self.message_sampler = (
+                self.build_samplers(self.content)
+            )
+
+    @property
+    def vibe_count(self) -> int:
+        """The number of vibes generated so far, across all threads."""
+        return self.stats.total_vibes()
+
+    def spawn_seeds(self, count: int) -> list[int]:
+        """Derive seeds for independent sub-streams.
+
+        The seeds are drawn from this generator's stream, so a seeded parent
+        always derives the same seeds.
+
+        Args:
+            count: Number of seeds to derive.
+
+        Returns:
+            A list of seeds, e.g. to hand to worker processes.
+        """
+        return [self.rng.getrandbits(64) for _ in range(count)]
+
+    def spawn(self, count: int) -> list["VibeGenerator"]:
+        """Create independently seeded generators, e.g. one per worker thread.
+
+        Args:
+            count: Number of generators to create.
+
+        Returns:
+            A list of new generators with their own random streams.
+        """
+        return [
+            type(self)(
+                seed=seed,
+                registry=self.registry,
+                weights=self.weights,
+                no_repeat=self.no_repeat,
+                content=self.content,
+                matrix_size=self.matrix_size,
+                banner_text=self.banner_text,
+            )
+            for seed in self.spawn_seeds(count)
+        ]
 
     def generate_random_pattern(self) -> str:
         """Generate a random ASCII art pattern.
@@ -82,34 +285,195 @@ class VibeGenerator:
         Returns:
             A randomly selected ASCII art pattern.
         """
-        return random.choice(self.ASCII_PATTERNS)
+        self.stats.record_vibe("pattern")
+        self._follow_lists()
+        return self.pattern_sampler.draw(self.rng)
+
+    def resize_matrix(self, width: int, height: int) -> None:
+        """Change the default size of matrix art.
+
+        Safe to call from a signal handler or another thread; the matrix
+        buffer is reallocated by the next matrix rendered.
+
+        Args:
+            width: Width of the matrix.
+            height: Height of the matrix.
+
+        Raises:
+            ValueError: If a size is negative.
+        """
+        if width < 0 or height < 0:
+            raise ValueError("width and height must not be negative")
+        self.matrix_size = (width, height)
 
-    def generate_cyber_matrix(self, width: int = 40, height: int = 10) -> str:
+    def generate_cyber_matrix(
+        self, width: int | None = None, height: int | None = None
+    ) -> str:
         """Generate a matrix-style cyber pattern.
 
         Args:
-            width: Width of the matrix pattern.
-            height: Height of the matrix pattern.
+            width: Width of the matrix pattern; defaults to ``matrix_size``.
+            height: Height of the matrix pattern; defaults to ``matrix_size``.
 
         Returns:
             A matrix-style ASCII pattern.
         """
-        chars = "01╬═║╔╗╚╝░▓█"
-        lines = []
+        return self.generate_cyber_matrix_batch(1, width, height)[0]
+
+    def generate_cyber_matrix_batch(
+        self, n: int, width: int | None = None, height: int | None = None
+    ) -> list[str]:
+        """Generate several matrix-style cyber patterns at once.
+
+        Frames are rendered into a buffer that is reused for as long as the
+        size stays the same, avoiding per-cell and per-line Python work.
+
+        Args:
+            n: Number of matrix patterns to generate.
+            width: Width of each matrix pattern; defaults to ``matrix_size``.
+            height: Height of each matrix pattern; defaults to ``matrix_size``.
+
+        Returns:
+            A list of ``n`` matrix-style ASCII patterns.
+        """
+        if n <= 0:
+            return []
+        buffer = self._sized_matrix_buffer(width, height)
+        self.stats.record_vibe("matrix", n)
+        return [buffer.render(self.rng) for _ in range(n)]
+
+    def _generate_matrix_frame_batch(self, n: int) -> list["Frame"]:
+        """Generate several default-size matrices as frames, without building text.
+
+        Args:
+            n: Number of matrices to generate.
+
+        Returns:
+            A list of ``n`` frames.
+        """
+        if n <= 0:
+            return []
+        buffer = self._sized_matrix_buffer(None, None)
+        self.stats.record_vibe("matrix", n)
+        return [buffer.render_frame(self.rng) for _ in range(n)]
+
+    def _sized_matrix_buffer(
+        self, width: int | None, height: int | None
+    ) -> MatrixBuffer:
+        """Get the matrix buffer resized for the next matrix.
+
+        Args:
+            width: Width of the matrix, or None for the default width.
+            height: Height of the matrix, or None for the default height.
+
+        Returns:
+            The shared matrix buffer.
+        """
+        default_width, default_height = self.matrix_size
+        buffer = self._matrix_buffer
+        buffer.resize(
+            default_width if width is None else width,
+            default_height if height is None else height,
+        )
+        return buffer
+
+    def generate_matrix_frames(
+        self, n: int, width: int | None = None, height: int | None = None
+    ) -> list["Frame"]:
+        """Generate several matrix frames without building their text.
+
+        Args:
+            n: Number of frames to generate.
+            width: Width of each frame; defaults to ``matrix_size``.
+            height: Height of each frame; defaults to ``matrix_size``.
+
+        Returns:
+            A list of ``n`` frames.
+        """
+        return list(self.iter_matrix_frames(max(0, n), width, height))
 
-        for _ in range(height):
-            line = "".join(random.choice(chars) for _ in range(width))
-            lines.append(line)
+    def iter_matrix_frames(
+        self,
+        count: int | None = None,
+        width: int | None = None,
+        height: int | None = None,
+    ) -> Iterator["Frame"]:
+        """Lazily generate matrix frames without building their text.
 
-        return "\n".join(lines)
+        Frames follow ``resize_matrix()`` unless a size is given.
+
+        Args:
+            count: Number of frames to generate, or None to generate forever.
+            width: Width of each frame; defaults to ``matrix_size``.
+            height: Height of each frame; defaults to ``matrix_size``.
+
+        Yields:
+            Frames, whose ``str()`` and ``bytes()`` are built on first use.
+        """
+        generated = 0
+        while count is None or generated < count:
+            buffer = self._sized_matrix_buffer(width, height)
+            self.stats.record_vibe("matrix")
+            generated += 1
+            yield buffer.render_frame(self.rng)
 
     def generate_word_art(self) -> str:
         """Generate random cyber word art.
 
+        Rendered boxes are cached per word, so repeated words are served as
+        pre-built strings and new words are rendered on first use.
+
         Returns:
             ASCII art featuring a random cyber word.
         """
-        word = random.choice(self.CYBER_WORDS)
+        self.stats.record_vibe("word")
+        self._follow_lists()
+        word = self.word_sampler.draw(self.rng)
+        art = self._word_art_cache.get(word)
+
+        if art is None:
+            self.stats.increment("word_art_cache_misses")
+            art = self.render_word_art(word)
+            if len(self._word_art_cache) >= self.WORD_ART_CACHE_SIZE:
+                # Evict the oldest entry to keep the cache bounded
+                del self._word_art_cache[next(iter(self._word_art_cache))]
+            self._word_art_cache[word] = art
+        else:
+            self.stats.increment("word_art_cache_hits")
+
+        return art
+
+    def encode_static(self, text: str) -> bytes:
+        """Encode a pattern, word art box or message as UTF-8.
+
+        These come from bounded lists, so encodings are cached and repeated
+        text is encoded once.
+
+        Args:
+            text: The text to encode.
+
+        Returns:
+            The text encoded as UTF-8.
+        """
+        encoded = self._encoded_cache.get(text)
+        if encoded is None:
+            encoded = text.encode("utf-8")
+            if len(self._encoded_cache) >= self.ENCODED_CACHE_SIZE:
+                # Evict the oldest entry to keep the cache bounded
+                del self._encoded_cache[next(iter(self._encoded_cache))]
+            self._encoded_cache[text] = encoded
+        return encoded
+
+    @staticmethod
+    def render_word_art(word: str) -> str:
+        """Render a word inside a box.
+
+        Args:
+            word: The word to render.
+
+        Returns:
+            ASCII art featuring the word.
+        """
         border = "─" * (len(word) + 4)
 
         return f"""
@@ -118,44 +482,317 @@ class VibeGenerator:
     └{border}┘
         """
 
+    def generate_banner(self, text: str | None = None) -> str:
+        """Generate a big-letter banner.
+
+        Args:
+            text: Text to render; defaults to ``banner_text``, or a random cyber
+                word if that isn't set.
+
+        Returns:
+            ASCII art of the text in big letters.
+        """
+        # The glyph atlas is only compiled once banners are used
+        from bsidespgh25.banner import BANNER_FONT
+
+        self.stats.record_vibe("banner")
+        if text is None:
+            text = self.banner_text
+        if text is None:
+            self._follow_lists()
+            text = self.word_sampler.draw(self.rng)
+        return BANNER_FONT.render(text)
+
     def get_vibe_message(self) -> str:
         """Get a random vibe message.
 
         Returns:
             A random vibe message string.
         """
-        return random.choice(self.VIBE_MESSAGES)
+        self._follow_lists()
+        return self.message_sampler.draw(self.rng)
+
+    def generate_art(self, art_type: str) -> str:
+        """Generate art from a registered art source.
+
+        Args:
+            art_type: Name of the art source.
+
+        Returns:
+            The ASCII art.
+
+        Raises:
+            ValueError: If no such art source is registered.
+        """
+        try:
+            source = self.registry[art_type]
+        except KeyError:
+            raise ValueError(f"Unknown vibe type: {art_type}") from None
+        return source(self)
 
-    def generate_full_vibe(self) -> Tuple[str, str]:
+    def generate_full_vibe(self) -> tuple[str, str]:
         """Generate a complete vibe with art and message.
 
+        The art type is picked according to the registry's weights.
+
         Returns:
             Tuple of (ascii_art, vibe_message).
         """
-        self.vibe_count += 1
+        art = self.registry[self.registry.choose(self.rng)](self)
+        message = self.get_vibe_message()
+
+        return art, message
+
+    def generate_encoded_vibe(self, vibe_type: str = "random") -> tuple[bytes, bytes]:
+        """Generate a complete vibe encoded as UTF-8, ready to write.
+
+        Matrices are built as bytes directly and cached encodings are used
+        for patterns, word art and messages.
 
-        art_type = random.choice(["pattern", "matrix", "word"])
+        Args:
+            vibe_type: A registered art type or "random" to pick one by weight.
+
+        Returns:
+            Tuple of (ascii_art, vibe_message) encoded as UTF-8.
 
-        if art_type == "pattern":
-            art = self.generate_random_pattern()
-        elif art_type == "matrix":
-            art = self.generate_cyber_matrix()
+        Raises:
+            ValueError: If no such art source is registered.
+        """
+        if vibe_type == "random":
+            vibe_type = self.registry.choose(self.rng)
+        if vibe_type == "matrix" and self.registry.is_builtin("matrix"):
+            art = bytes(self._generate_matrix_frame_batch(1)[0])
         else:
-            art = self.generate_word_art()
+            art = self._encode_art(vibe_type, self.generate_art(vibe_type))
+        return art, self.encode_static(self.get_vibe_message())
 
-        message = self.get_vibe_message()
+    def _encode_art(self, art_type: str, art: str) -> bytes:
+        """Encode art, from the cache if its source is a built-in static one."""
+        if art_type in self.STATIC_ART_TYPES and self.registry.is_builtin(art_type):
+            return self.encode_static(art)
+        return art.encode("utf-8")
 
-        return art, message
+    def iter_vibes(
+        self,
+        count: int | None = None,
+        vibe_type: str = "random",
+        batch_size: int = 1024,
+        frames: bool = False,
+    ) -> Iterator[tuple["str | Frame", str]]:
+        """Lazily generate many vibes.
+
+        Art types, patterns, messages and matrix glyphs are selected a batch at
+        a time to amortize the random number generation and dispatch overhead.
+
+        Args:
+            count: Number of vibes to generate, or None to generate forever.
+            vibe_type: A registered art type or "random".
+            batch_size: Number of vibes to pre-select at a time.
+            frames: Whether to yield built-in matrix art as ``Frame`` objects,
+                e.g. to buffer or send them before their text is needed.
+
+        Yields:
+            Tuples of (ascii_art, vibe_message).
+
+        Raises:
+            ValueError: If the vibe type or batch size is invalid.
+        """
+        return self._iter_vibes(count, vibe_type, batch_size, frames=frames)
+
+    def iter_encoded_vibes(
+        self,
+        count: int | None = None,
+        vibe_type: str = "random",
+        batch_size: int = 1024,
+    ) -> Iterator[tuple[bytes, bytes]]:
+        """Lazily generate many vibes encoded as UTF-8, ready to write.
+
+        Like ``iter_vibes()``, but patterns, word art and messages are served
+        from cached encodings and matrices are built as bytes directly, so
+        only art from other sources is encoded per vibe.
+
+        Args:
+            count: Number of vibes to generate, or None to generate forever.
+            vibe_type: A registered art type or "random".
+            batch_size: Number of vibes to pre-select at a time.
+
+        Yields:
+            Tuples of (ascii_art, vibe_message) encoded as UTF-8.
+
+        Raises:
+            ValueError: If the vibe type or batch size is invalid.
+        """
+        return self._iter_vibes(count, vibe_type, batch_size, encoded=True)
+
+    def iter_typed_vibes(
+        self,
+        count: int | None = None,
+        vibe_type: str = "random",
+        batch_size: int = 1024,
+    ) -> Iterator[tuple[str, str, str]]:
+        """Lazily generate many vibes along with their art types.
+
+        Like ``iter_vibes()``, for consumers that record what each vibe is.
+
+        Args:
+            count: Number of vibes to generate, or None to generate forever.
+            vibe_type: A registered art type or "random".
+            batch_size: Number of vibes to pre-select at a time.
+
+        Yields:
+            Tuples of (art_type, ascii_art, vibe_message).
+
+        Raises:
+            ValueError: If the vibe type or batch size is invalid.
+        """
+        return self._iter_vibes(count, vibe_type, batch_size, typed=True)
+
+    def _iter_vibes(
+        self,
+        count: int | None,
+        vibe_type: str,
+        batch_size: int,
+        encoded: bool = False,
+        typed: bool = False,
+        frames: bool = False,
+    ) -> Iterator[tuple]:
+        """Generate vibes for ``iter_vibes()`` and its variants.
+
+        Matrices are rendered as frames and only turned into text or bytes as
+        they are yielded, unless ``frames`` asks for the frames themselves.
+        """
+        registry = self.registry
+        if vibe_type != "random" and vibe_type not in registry:
+            raise ValueError(f"Unknown vibe type: {vibe_type}")
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+
+        # The built-in pattern and matrix sources can be drawn a whole batch at a time
+        batch_patterns = registry.is_builtin("pattern")
+        batch_matrices = registry.is_builtin("matrix")
+        encode = self.encode_static
+
+        remaining = count
+        while remaining is None or remaining > 0:
+            size = batch_size if remaining is None else min(batch_size, remaining)
+            if remaining is not None:
+                remaining -= size
+
+            if vibe_type == "random":
+                art_types = registry.choose_many(self.rng, size)
+            else:
+                art_types = [vibe_type] * size
+            self._follow_lists()
+            messages = self.message_sampler.draw_many(self.rng, size)
+            pattern_count = art_types.count("pattern") if batch_patterns else 0
+            patterns = self.pattern_sampler.draw_many(self.rng, pattern_count)
+            if pattern_count:
+                self.stats.record_vibe("pattern", pattern_count)
+            matrix_count = art_types.count("matrix") if batch_matrices else 0
+            matrices = self._generate_matrix_frame_batch(matrix_count)
+            if encoded:
+                messages = map(encode, messages)
+                patterns = map(encode, patterns)
+                matrices = map(bytes, matrices)
+            elif not frames:
+                matrices = map(str, matrices)
+            patterns = iter(patterns)
+            matrices = iter(matrices)
+
+            for art_type, message in zip(art_types, messages):
+                if art_type == "pattern" and batch_patterns:
+                    art = next(patterns)
+                elif art_type == "matrix" and batch_matrices:
+                    art = next(matrices)
+                else:
+                    art = registry[art_type](self)
+                    if encoded:
+                        art = self._encode_art(art_type, art)
+
+                if typed:
+                    yield art_type, art, message
+                else:
+                    yield art, message
+
+    def iter_frames(
+        self,
+        count: int | None = None,
+        vibe_type: str = "random",
+        separator: bool = True,
+    ) -> Iterator[bytes]:
+        """Serve random pre-rendered vibes from the catalog.
+
+        As with ``generate_full_vibe()``, a random vibe picks its art type
+        first, so every type is equally likely however many entries it has.
+
+        Args:
+            count: Number of vibes to serve, or None to serve forever.
+            vibe_type: One of the catalog's art types or "random".
+            separator: Whether each vibe ends with a separator line.
+
+        Yields:
+            Formatted vibes encoded as UTF-8.
+
+        Raises:
+            ValueError: If there is no catalog or it has no vibes of this type.
+        """
+        if self.catalog is None:
+            raise ValueError("No catalog to serve frames from")
+        ranges = self.catalog.ranges
+        if vibe_type == "random":
+            art_types = self.catalog.types
+            if not art_types:
+                raise ValueError("The catalog is empty")
+        elif vibe_type in ranges:
+            art_types = (vibe_type,)
+        else:
+            raise ValueError(f"The catalog has no {vibe_type} vibes")
+
+        frame = self.catalog.frame
+        choice = self.rng.choice
+        randrange = self.rng.randrange
+        record_vibe = self.stats.record_vibe
+        served = 0
+        while count is None or served < count:
+            art_type = choice(art_types)
+            first, size = ranges[art_type]
+            record_vibe(art_type)
+            served += 1
+            yield frame(first + randrange(size), separator)
 
     def get_stats(self) -> dict:
         """Get vibe generation statistics.
 
+        Every generated vibe is counted by type, whichever method produced it.
+
         Returns:
             Dictionary containing vibe statistics.
         """
+        self._follow_lists()
+        snapshot = self.stats.snapshot()
+        counts = snapshot["counts"]
+        vibes = snapshot["vibes"]
+        by_type = {f"{vibe_type}_vibes": 0 for vibe_type in self.registry.names}
+        by_type.update(
+            (f"{vibe_type}_vibes", count)
+            for vibe_type, count in snapshot["by_type"].items()
+        )
+
         return {
-            "vibes_generated": self.vibe_count,
-            "patterns_available": len(self.ASCII_PATTERNS),
-            "cyber_words_available": len(self.CYBER_WORDS),
-            "messages_available": len(self.VIBE_MESSAGES),
+            "vibes_generated": vibes,
+            **by_type,
+            "patterns_available": len(self.pattern_sampler),
+            "cyber_words_available": len(self.word_sampler),
+            "messages_available": len(self.message_sampler),
+            "word_art_cache_hits": counts.get("word_art_cache_hits", 0),
+            "word_art_cache_misses": counts.get("word_art_cache_misses", 0),
+            "content_reloads": counts.get("content_reloads", 0),
+            "bytes_emitted": snapshot["bytes_emitted"],
+            "bytes_per_vibe": round(snapshot["bytes_emitted"] / vibes, 1)
+            if vibes
+            else 0.0,
+            "color_bytes": counts.get("color_bytes", 0),
+            "elapsed_seconds": snapshot["elapsed_seconds"],
+            "vibes_per_second": snapshot["vibes_per_second"],
+            "bytes_per_second": snapshot["bytes_per_second"],
         }
@@ -0,0 +1,271 @@
+"""
+Watch content packs for changes.
+"""
+
+import logging
+import os
+import select
+import sys
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+from bsidespgh25.content import load_content_pack, pack_fingerprint
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Self
+
+    from bsidespgh25.vibe_generator import VibeGenerator
+
+LOG = logging.getLogger(__name__)
+
+# inotify(7) flags, from <sys/inotify.h>
+IN_MODIFY = 0x002
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = (
+    IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+)
+
+DEFAULT_POLL_INTERVAL = 1.0
+# Editors often save in several steps, so wait for a burst of events to settle
+DEFAULT_SETTLE = 0.1
+
+
+def watch_paths(path: str | os.PathLike) -> list[Path]:
+    """List the directories to watch for changes to a pack.
+
+    A pack file's directory is watched rather than the file itself, so saves
+    that replace the file are seen.
+
+    Args:
+        path: The pack.
+
+    Returns:
+        The directories that hold the pack's files.
+    """
+    path = Path(path)
+    if not path.is_dir():
+        return [path.parent]
+    return [directory for directory in (path, path / "patterns") if directory.is_dir()]
+
+
+class Inotify:
+    """A minimal inotify binding, via ctypes."""
+
+    def __init__(self):
+        """Create an inotify instance.
+
+        Raises:
+            OSError: If inotify isn't available.
+        """
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        import ctypes
+        import ctypes.util
+
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._add_watch = self._libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+
+    def add_watch(self, path: str | os.PathLike, mask: int = WATCH_MASK) -> None:
+        """Watch a path, or update the mask of a watched path.
+
+        Args:
+            path: The file or directory to watch.
+            mask: The events to watch for.
+
+        Raises:
+            OSError: If the path can't be watched.
+        """
+        if self._add_watch(self.fd, os.fsencode(path), mask) < 0:
+            import ctypes
+
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error), os.fspath(path))
+
+    def drain(self) -> bool:
+        """Discard pending events.
+
+        Returns:
+            True if there were any events.
+        """
+        drained = False
+        while True:
+            try:
+                if not os.read(self.fd, 65536):
+                    return drained
+            except BlockingIOError:
+                return drained
+            drained = True
+
+    def close(self) -> None:
+        """Close the inotify instance."""
+        os.close(self.fd)
+
+
+class ContentWatcher:
+    """Call back from a background thread whenever a content pack changes.
+
+    Changes are detected with inotify on Linux and by polling the pack's
+    fingerprint elsewhere. Either way the callback only runs once the pack's
+    fingerprint has actually changed.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        on_change: Callable[[], None],
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        settle: float = DEFAULT_SETTLE,
+        use_inotify: bool = True,
+    ):
+        """Initialize the watcher.
+
+        Args:
+            path: The content pack to watch.
+            on_change: Called from the watcher thread after the pack changes.
+            poll_interval: Seconds between checks when polling.
+            settle: Seconds to wait for more events before checking the pack.
+            use_inotify: Whether to try inotify before falling back to polling.
+        """
+        self.path = path
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        self.settle = settle
+        self.use_inotify = use_inotify
+        self.backend: str | None = None
+        self._inotify: Inotify | None = None
+        self._fingerprint = self._current_fingerprint()
+        self._stopping = threading.Event()
+        self._wake_read, self._wake_write = os.pipe()
+        self._thread = threading.Thread(
+            target=self._run, name="content-watcher", daemon=True
+        )
+
+    def __enter__(self) -> "Self":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Start watching in a background thread."""
+        if self.use_inotify:
+            try:
+                self._inotify = Inotify()
+                self._watch()
+            except (OSError, AttributeError) as error:
+                LOG.debug("Polling for content changes, inotify failed: %s", error)
+                if self._inotify is not None:
+                    self._inotify.close()
+                self._inotify = None
+        self.backend = "polling" if self._inotify is None else "inotify"
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop watching and wait for the background thread to finish."""
+        self._stopping.set()
+        os.write(self._wake_write, b"\0")
+        if self._thread.is_alive():
+            self._thread.join()
+        if self._inotify is not None:
+            self._inotify.close()
+        os.close(self._wake_read)
+        os.close(self._wake_write)
+
+    def check(self) -> bool:
+        """Call back if the pack changed since the last check.
+
+        Returns:
+            True if the pack changed.
+        """
+        current = self._current_fingerprint()
+        if current is None or current == self._fingerprint:
+            return False
+        self._fingerprint = current
+        try:
+            self.on_change()
+        except Exception:
+            LOG.exception("Failed to handle a change to %s", self.path)
+        return True
+
+    def _current_fingerprint(self) -> bytes | None:
+        """Get the pack's fingerprint, or None while it can't be read."""
+        try:
+            return pack_fingerprint(self.path)
+        except OSError:
+            return None
+
+    def _watch(self) -> None:
+        """Watch the pack's directories, including any created since the last call."""
+        for path in watch_paths(self.path):
+            self._inotify.add_watch(path)
+
+    def _wait(self, timeout: float | None) -> bool:
+        """Wait for inotify events or a stop request.
+
+        Returns:
+            True if there were inotify events.
+        """
+        watched = [self._wake_read]
+        if self._inotify is not None:
+            watched.append(self._inotify.fd)
+        ready, _, _ = select.select(watched, [], [], timeout)
+        return self._inotify is not None and self._inotify.fd in ready
+
+    def _run(self) -> None:
+        """Wait for changes until stopped."""
+        while not self._stopping.is_set():
+            if self._inotify is None:
+                self._wait(self.poll_interval)
+            elif self._wait(None):
+                # Coalesce a burst of events into a single check
+                while self._inotify.drain() and not self._stopping.is_set():
+                    self._wait(self.settle)
+                try:
+                    self._watch()
+                except OSError:
+                    pass
+            if not self._stopping.is_set():
+                self.check()
+
+
+def watch_content(
+    vibe_gen: "VibeGenerator", path: str | os.PathLike, **kwargs
+) -> ContentWatcher:
+    """Create a watcher that reloads a generator's content pack when it changes.
+
+    The pack is loaded and its samplers built on the watcher thread; the
+    render loop only has to call ``vibe_gen.swap_content()`` between vibes.
+    A pack that fails to load is logged and the current content is kept.
+
+    Args:
+        vibe_gen: The generator to stage reloaded content in.
+        path: The content pack.
+        **kwargs: Passed on to ``ContentWatcher``.
+
+    Returns:
+        The watcher, not yet started.
+    """
+
+    def reload() -> None:
+        try:
+            vibe_gen.stage_content(load_content_pack(path))
+        except ValueError as error:
+            LOG.warning("Keeping the current content: %s", error)
+        else:
+            LOG.info("Reloaded content pack %s", path)
+
+    return ContentWatcher(path, reload, **kwargs)
@@ -1,14 +1,45 @@
 #!/usr/bin/env python3
 """
 bsidespgh25 script entrypoint
+
+This runs as a short-lived job, so only the modules needed to write a vibe are
+imported up front. Anything else (argparse, logging, asyncio, multiprocessing)
+is imported by the code paths that use it.
 """
 
-import argparse
-import time
+from __future__ import annotations
+
+import sys
 
-from bsidespgh25 import config
+from bsidespgh25.output import (
+    FLUSH_POLICIES,
+    SEPARATOR,
+    VibeWriter,
+    format_encoded_vibe,
+    format_vibe,
+)
+from bsidespgh25.registry import ART_REGISTRY, ENTRY_POINT_GROUP
 from bsidespgh25.vibe_generator import VibeGenerator
 
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import argparse
+    from collections.abc import Iterable
+    from typing import TextIO
+
+    from bsidespgh25.catalog import VibeCatalog
+    from bsidespgh25.color import ColorRenderer
+    from bsidespgh25.records import RecordEncoder
+
+# Options the fast path can handle without building the full argument parser
+FAST_OPTIONS = {
+    "--vibe-type": "vibe_type",
+    "--seed": "seed",
+    "--count": "count",
+    "--catalog": "catalog",
+    "--content-pack": "content_pack",
+}
+
 
 def create_parser() -> argparse.ArgumentParser:
     """Create the argument parser with vibe-specific options.
@@ -16,6 +47,13 @@ def create_parser() -> argparse.ArgumentParser:
     Returns:
         Configured argument parser.
     """
+    from bsidespgh25 import config
+    from bsidespgh25.animator import MatrixAnimator
+    from bsidespgh25.color import COLOR_DEPTHS
+    from bsidespgh25.matrix import DEFAULT_SIZE
+    from bsidespgh25.pipeline import DEFAULT_DEPTH, DROP_POLICIES
+    from bsidespgh25.records import RECORD_FORMATS
+
     parser = config.create_arg_parser()
 
     parser.add_argument(
@@ -24,29 +62,256 @@ def create_parser() -> argparse.ArgumentParser:
 
     parser.add_argument(
         "--vibe-type",
-        choices=["pattern", "matrix", "word", "random"],
+        choices=[*ART_REGISTRY.names, "random"],
         default="random",
         help="Type of vibe to generate (default: random)",
     )
 
+    parser.add_argument(
+        "--plugins",
+        action="store_true",
+        help=f"Load art types from installed '{ENTRY_POINT_GROUP}' entry point plugins",
+    )
+
     parser.add_argument(
         "--continuous", action="store_true", help="Continuously generate vibes"
     )
 
     parser.add_argument(
+        "--count",
+        type=int,
+        help="Number of vibes to generate; written as fast as possible unless --continuous with a --delay",
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes used to generate --count vibes (default: 1)",
+    )
+
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=1000,
+        help="Number of vibes each worker generates per task (default: 1000)",
+    )
+
+    parser.add_argument(
+        "--unordered",
+        action="store_true",
+        help="Write worker output as soon as it is ready instead of in a deterministic order",
+    )
+
+    pacing = parser.add_mutually_exclusive_group()
+    pacing.add_argument(
         "--delay",
         type=float,
         default=2.0,
         help="Delay between continuous vibes in seconds (default: 2.0)",
     )
+    pacing.add_argument(
+        "--fps",
+        type=float,
+        help="Continuous vibes per second, as an alternative to --delay",
+    )
+
+    parser.add_argument(
+        "--queue-depth",
+        type=int,
+        default=DEFAULT_DEPTH,
+        help=f"Continuous vibes rendered ahead of the writer (default: {DEFAULT_DEPTH})",
+    )
+
+    parser.add_argument(
+        "--drop-policy",
+        choices=DROP_POLICIES,
+        default="block",
+        help="What to do with new continuous vibes when the writer falls --queue-depth "
+        "behind: wait for it, drop the oldest queued vibe or drop the new one (default: block)",
+    )
+
+    parser.add_argument(
+        "--width",
+        type=int,
+        help=f"Width of matrix vibes (default: {DEFAULT_SIZE[0]}, or the terminal's "
+        "with --fit-terminal)",
+    )
+
+    parser.add_argument(
+        "--height",
+        type=int,
+        help=f"Height of matrix vibes (default: {DEFAULT_SIZE[1]}, or the terminal's "
+        "with --fit-terminal)",
+    )
+
+    parser.add_argument(
+        "--fit-terminal",
+        action="store_true",
+        help="Size matrix vibes to fill the terminal, following it when resized",
+    )
 
     parser.add_argument(
-        "--stats", action="store_true", help="Show vibe generation statistics"
+        "--color",
+        nargs="?",
+        const="auto",
+        choices=("auto", *COLOR_DEPTHS),
+        help="Color the art with ANSI escapes, detecting the color depth from the "
+        "terminal unless one is given; $NO_COLOR turns color off",
+    )
+
+    parser.add_argument(
+        "--no-color",
+        dest="color",
+        action="store_const",
+        const=None,
+        help="Don't color the art, overriding an earlier --color",
+    )
+
+    parser.add_argument(
+        "--animate",
+        action="store_true",
+        help="In continuous matrix mode, redraw only the changed cells in place",
+    )
+
+    parser.add_argument(
+        "--animation-mode",
+        choices=MatrixAnimator.MODES,
+        default="mutate",
+        help="How the animated matrix changes each tick (default: mutate)",
+    )
+
+    parser.add_argument(
+        "--mutation-rate",
+        type=float,
+        default=0.1,
+        help="Fraction of cells (or columns in rain mode) changed per animation tick (default: 0.1)",
+    )
+
+    parser.add_argument(
+        "--flush",
+        choices=FLUSH_POLICIES,
+        default="auto",
+        help="When to write buffered output: every frame, every batch, by size, "
+        "or auto to pick frame for terminals and size for pipes (default: auto)",
+    )
+
+    parser.add_argument(
+        "--serve",
+        metavar="HOST:PORT",
+        help="Stream vibes to TCP, chunked HTTP (/) and server-sent event (/events) clients",
+    )
+
+    parser.add_argument(
+        "--catalog",
+        metavar="PATH",
+        help="Serve pre-rendered vibes from a catalog built with --build-catalog",
+    )
+
+    parser.add_argument(
+        "--build-catalog",
+        metavar="PATH",
+        help="Pre-render --count vibes of each type (default: 1000) into a catalog and exit",
+    )
+
+    parser.add_argument(
+        "--content-pack",
+        metavar="PATH",
+        help="Directory or JSON/TOML file of patterns, words and messages to use "
+        "instead of the built-in ones",
+    )
+
+    parser.add_argument(
+        "--banner-text",
+        metavar="TEXT",
+        help="Text for banner vibes instead of a random cyber word",
+    )
+
+    parser.add_argument(
+        "--weights",
+        metavar="PATH",
+        help="JSON or TOML file of weights for vibe types, patterns, words and messages",
+    )
+
+    parser.add_argument(
+        "--no-repeat",
+        type=int,
+        metavar="K",
+        help="Never repeat a pattern, word or message within K draws (default: 0, "
+        "or no_repeat from --weights)",
+    )
+
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="Seed the random stream to reproduce an exact sequence of vibes",
+    )
+
+    parser.add_argument(
+        "--output",
+        choices=("text", *RECORD_FORMATS),
+        default="text",
+        help="Write vibes, and --stats, as decorated text, JSON lines or binary "
+        "records with their type, sequence number and timestamp (default: text)",
+    )
+
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Show vibe generation statistics; with --vibe, print them to stderr afterwards",
     )
 
     return parser
 
 
+def parse_fast_args(argv: list[str]) -> dict | None:
+    """Parse the common one-shot invocations without argparse.
+
+    Only ``--vibe`` with any of ``--vibe-type``, ``--seed``, ``--count``,
+    ``--catalog`` and ``--content-pack`` is understood. Anything else, including invalid values and
+    ``--plugins``, returns None so the full parser can handle it and report
+    errors.
+
+    Args:
+        argv: Command line arguments, without the program name.
+
+    Returns:
+        Dictionary with vibe_type, seed, count, catalog and content_pack, or None.
+    """
+    options: dict = {
+        "vibe_type": "random",
+        "seed": None,
+        "count": None,
+        "catalog": None,
+        "content_pack": None,
+    }
+    if "--vibe" not in argv:
+        return None
+
+    remaining = iter(argv)
+    for arg in remaining:
+        if arg == "--vibe":
+            continue
+        flag, equals, value = arg.partition("=")
+        if flag not in FAST_OPTIONS:
+            return None
+        if not equals:
+            value = next(remaining, None)
+            if value is None:
+                return None
+        options[FAST_OPTIONS[flag]] = value
+
+    if options["vibe_type"] != "random" and options["vibe_type"] not in ART_REGISTRY:
+        return None
+    try:
+        for key in ("seed", "count"):
+            if options[key] is not None:
+                options[key] = int(options[key])
+    except ValueError:
+        return None
+    return options
+
+
 def generate_vibe(vibe_gen: VibeGenerator, vibe_type: str) -> tuple[str, str]:
     """Generate a vibe based on the specified type.
 
@@ -57,63 +322,605 @@ def generate_vibe(vibe_gen: VibeGenerator, vibe_type: str) -> tuple[str, str]:
     Returns:
         Tuple of (ascii_art, message).
     """
-    if vibe_type == "pattern":
-        art = vibe_gen.generate_random_pattern()
-        message = vibe_gen.get_vibe_message()
-    elif vibe_type == "matrix":
-        art = vibe_gen.generate_cyber_matrix()
-        message = vibe_gen.get_vibe_message()
-    elif vibe_type == "word":
-        art = vibe_gen.generate_word_art()
-        message = vibe_gen.get_vibe_message()
-    else:  # random
-        art, message = vibe_gen.generate_full_vibe()
+    if vibe_type == "random":
+        return vibe_gen.generate_full_vibe()
 
+    art = vibe_gen.generate_art(vibe_type)
+    message = vibe_gen.get_vibe_message()
     return art, message
 
 
-def main():
-    """Main entry point for the application."""
+def write_vibes(vibes: Iterable[tuple[str, str]], writer: VibeWriter) -> None:
+    """Write vibes through a buffered writer.
+
+    Args:
+        vibes: Tuples of (ascii_art, message) to write.
+        writer: The writer to buffer the vibes in.
+    """
+    for art, message in vibes:
+        writer.write_vibe(art, message)
+    writer.flush()
+
+
+def write_encoded_vibes(
+    vibes: Iterable[tuple[bytes, bytes]], writer: VibeWriter
+) -> None:
+    """Write vibes that are already UTF-8 encoded through a buffered writer.
+
+    Args:
+        vibes: Tuples of (ascii_art, message) encoded as UTF-8.
+        writer: The writer to buffer the vibes in.
+    """
+    for art, message in vibes:
+        writer.write_encoded_vibe(art, message)
+    writer.flush()
+
+
+def animate_matrix(
+    args: argparse.Namespace, vibe_gen: VibeGenerator, writer: VibeWriter
+) -> None:
+    """Continuously animate a matrix in place until interrupted.
+
+    Args:
+        args: Parsed command line arguments.
+        vibe_gen: The vibe generator whose random stream drives the animation.
+        writer: The writer to send frames to.
+    """
+    from bsidespgh25.animator import MatrixAnimator
+    from bsidespgh25.scheduler import FrameScheduler
+
+    width, height = vibe_gen.matrix_size
+    animator = MatrixAnimator(
+        width=width,
+        height=height,
+        mutation_rate=args.mutation_rate,
+        mode=args.animation_mode,
+        rng=vibe_gen.rng,
+    )
+    scheduler = FrameScheduler(args.delay)
+    scheduler.start()
+    writer.write(animator.render_full())
+    try:
+        while True:
+            scheduler.wait()
+            writer.write(animator.tick())
+    except KeyboardInterrupt:
+        writer.write(animator.park_cursor())
+        writer.flush()
+        print("\n\n✨ Vibe session ended! Stay secure! ✨")
+        print(f"Total frames animated: {animator.ticks}")
+
+
+def matrix_size(args: argparse.Namespace) -> tuple[int, int]:
+    """Get the matrix size selected on the command line.
+
+    Args:
+        args: Parsed command line arguments.
+
+    Returns:
+        Tuple of (width, height); ``--width`` and ``--height`` override the
+        terminal's size with ``--fit-terminal``.
+    """
+    from bsidespgh25.matrix import DEFAULT_SIZE, fit_matrix, terminal_size
+
+    width, height = fit_matrix(*terminal_size()) if args.fit_terminal else DEFAULT_SIZE
+    return (
+        width if args.width is None else args.width,
+        height if args.height is None else args.height,
+    )
+
+
+def color_renderer(
+    args: argparse.Namespace, vibe_gen: VibeGenerator
+) -> ColorRenderer | None:
+    """Create the renderer that colors art, if color was asked for.
+
+    Args:
+        args: Parsed command line arguments.
+        vibe_gen: The vibe generator whose statistics record the color overhead.
+
+    Returns:
+        The renderer, or None when color is off.
+    """
+    from bsidespgh25.color import ColorRenderer, color_depth
+
+    depth = color_depth(args.color)
+    if depth is None:
+        return None
+    return ColorRenderer(depth, stats=vibe_gen.stats)
+
+
+def follow_terminal_size(args: argparse.Namespace, vibe_gen: VibeGenerator) -> object:
+    """Resize matrix vibes whenever the terminal is resized.
+
+    The terminal is only queried again on ``SIGWINCH``, and the generator
+    reallocates its matrix buffer on the next matrix it renders.
+
+    Args:
+        args: Parsed command line arguments.
+        vibe_gen: The vibe generator to resize.
+
+    Returns:
+        The previous ``SIGWINCH`` handler to restore, or None if nothing was installed.
+    """
+    import signal
+
+    if not args.fit_terminal or not hasattr(signal, "SIGWINCH"):
+        return None
+
+    def on_resize(signum, frame) -> None:
+        vibe_gen.resize_matrix(*matrix_size(args))
+
+    return signal.signal(signal.SIGWINCH, on_resize)
+
+
+def print_stats(stats: dict, stream: TextIO | None = None) -> None:
+    """Print vibe generation statistics.
+
+    Args:
+        stats: Statistics as returned by ``VibeGenerator.get_stats()``.
+        stream: Stream to print to; defaults to stdout.
+    """
+    print("\n📊 Vibe Generator Statistics 📊", file=stream)
+    print("─" * 40, file=stream)
+    for key, value in stats.items():
+        print(f"{key.replace('_', ' ').title()}: {value}", file=stream)
+
+
+def run_continuous(
+    args: argparse.Namespace,
+    vibe_gen: VibeGenerator,
+    writer: VibeWriter,
+    renderer: ColorRenderer | None = None,
+    encoder: RecordEncoder | None = None,
+) -> dict:
+    """Write a vibe every ``--delay`` seconds until interrupted or ``--count`` is reached.
+
+    Vibes are rendered on a generator thread, each ahead of its deadline,
+    and queued for this thread to write, so slow output doesn't hold up
+    generation. A ``--content-pack`` is watched for changes and reloaded
+    between vibes, and with ``--fit-terminal`` matrices follow the terminal's
+    size.
+
+    Args:
+        args: Parsed command line arguments.
+        vibe_gen: The vibe generator instance.
+        writer: The writer to send vibes to.
+        renderer: Colors the art, if given.
+        encoder: Writes vibes as records instead, if given, with progress
+            messages going to stderr to keep them out of the records.
+
+    Returns:
+        The pipeline's queue and pacing statistics.
+    """
+    from bsidespgh25.pipeline import FramePipeline
+    from bsidespgh25.scheduler import FrameScheduler
+
+    if encoder is not None:
+        # Drawn one at a time so content can swap in between vibes
+        typed_vibes = vibe_gen.iter_typed_vibes(vibe_type=args.vibe_type, batch_size=1)
+
+    def render() -> bytes:
+        vibe_gen.swap_content()
+        if encoder is not None:
+            return encoder.encode_vibe(*next(typed_vibes))
+        if renderer is None:
+            return format_encoded_vibe(*vibe_gen.generate_encoded_vibe(args.vibe_type))
+        art, message = generate_vibe(vibe_gen, args.vibe_type)
+        return format_vibe(renderer.colorize(art), message).encode("utf-8")
+
+    previous_handler = follow_terminal_size(args, vibe_gen)
+    watcher = None
+    if args.content_pack:
+        from bsidespgh25.watcher import watch_content
+
+        watcher = watch_content(vibe_gen, args.content_pack)
+        watcher.start()
+
+    console = sys.stdout if encoder is None else sys.stderr
+    print("🎉 Starting continuous vibe mode! Press Ctrl+C to stop.", file=console)
+    print(SEPARATOR, file=console)
+    pipeline = FramePipeline(
+        render,
+        writer.write_encoded if encoder is None else writer.write_record,
+        FrameScheduler(args.delay),
+        count=args.count,
+        depth=args.queue_depth,
+        drop_policy=args.drop_policy,
+    )
+    try:
+        pipeline.run()
+        writer.flush()
+        print(
+            f"\n✨ Vibe session complete! Generated {pipeline.written} vibes ✨",
+            file=console,
+        )
+    except KeyboardInterrupt:
+        writer.flush()
+        stats = pipeline.get_stats()
+        print("\n\n✨ Vibe session ended! Stay secure! ✨", file=console)
+        print(f"Total vibes generated: {stats['frames_written']}", file=console)
+        print(f"Missed deadlines: {stats['missed_deadlines']}", file=console)
+        print(
+            "Jitter p50/p95/p99: "
+            f"{stats['jitter_p50_ms']}/{stats['jitter_p95_ms']}/{stats['jitter_p99_ms']} ms",
+            file=console,
+        )
+        print(
+            f"Queue occupancy: mean {stats['queue_mean_occupancy']}, "
+            f"peak {stats['queue_peak']}/{stats['queue_depth']}",
+            file=console,
+        )
+        print(f"Dropped frames: {stats['frames_dropped']}", file=console)
+        reloads = vibe_gen.get_stats()["content_reloads"]
+        if reloads:
+            print(f"Content reloads: {reloads}", file=console)
+    finally:
+        if watcher is not None:
+            watcher.stop()
+        if previous_handler is not None:
+            import signal
+
+            signal.signal(signal.SIGWINCH, previous_handler)
+    return pipeline.get_stats()
+
+
+def run_vibes(
+    args: argparse.Namespace, vibe_gen: VibeGenerator, writer: VibeWriter
+) -> dict:
+    """Generate vibes in the mode selected on the command line.
+
+    Args:
+        args: Parsed command line arguments.
+        vibe_gen: The vibe generator instance.
+        writer: The writer to send vibes to.
+
+    Returns:
+        Statistics about the run beyond the generator's own, e.g. pacing.
+    """
+    if vibe_gen.catalog is not None:
+        frames = vibe_gen.iter_frames(
+            1 if args.count is None else args.count,
+            args.vibe_type,
+            separator=args.count is not None,
+        )
+        for frame in frames:
+            writer.write_encoded(frame)
+        return {}
+
+    renderer = color_renderer(args, vibe_gen)
+    if args.count is not None and args.workers > 1:
+        from bsidespgh25.farm import VibeFarm
+
+        farm = VibeFarm(
+            vibe_gen,
+            args.workers,
+            chunk_size=args.chunk_size,
+            ordered=not args.unordered,
+        )
+        vibes = farm.iter_vibes(args.count, args.vibe_type)
+    elif args.count is not None and (not args.continuous or args.delay == 0):
+        if renderer is None:
+            encoded = vibe_gen.iter_encoded_vibes(args.count, args.vibe_type)
+            write_encoded_vibes(encoded, writer)
+            return {}
+        vibes = vibe_gen.iter_vibes(args.count, args.vibe_type)
+    elif args.continuous and args.animate and args.vibe_type == "matrix":
+        animate_matrix(args, vibe_gen, writer)
+        return {}
+    elif args.continuous:
+        return run_continuous(args, vibe_gen, writer, renderer)
+    else:
+        # Single vibe
+        art, message = generate_vibe(vibe_gen, args.vibe_type)
+        if renderer is not None:
+            art = renderer.colorize(art)
+        writer.write_vibe(art, message, separator=False)
+        return {}
+
+    if renderer is not None:
+        vibes = renderer.colorize_vibes(vibes)
+    write_vibes(vibes, writer)
+    return {}
+
+
+def run_records(
+    args: argparse.Namespace,
+    vibe_gen: VibeGenerator,
+    writer: VibeWriter,
+    encoder: RecordEncoder,
+) -> dict:
+    """Write vibes as structured records in the mode selected on the command line.
+
+    Args:
+        args: Parsed command line arguments.
+        vibe_gen: The vibe generator instance.
+        writer: The writer to send records to.
+        encoder: Encodes each vibe as a record.
+
+    Returns:
+        Statistics about the run beyond the generator's own, e.g. pacing.
+    """
+    if args.continuous and (args.count is None or args.delay > 0):
+        return run_continuous(args, vibe_gen, writer, encoder=encoder)
+
+    vibes = vibe_gen.iter_typed_vibes(
+        1 if args.count is None else args.count, args.vibe_type
+    )
+    encode = encoder.encode_vibe
+    for vibe in vibes:
+        writer.write_record(encode(*vibe))
+    writer.flush()
+    return {}
+
+
+def open_catalog(path: str, vibe_type: str) -> VibeCatalog:
+    """Open a catalog and check that it can serve a vibe type.
+
+    Args:
+        path: The catalog file.
+        vibe_type: Type of vibe to serve.
+
+    Returns:
+        The opened catalog.
+
+    Raises:
+        ValueError: If the catalog can't be opened or has no vibes of this type.
+    """
+    from bsidespgh25.catalog import VibeCatalog
+
+    try:
+        catalog = VibeCatalog(path)
+    except OSError as error:
+        raise ValueError(f"Can't open catalog: {error}") from error
+    if vibe_type != "random" and vibe_type not in catalog.ranges:
+        catalog.close()
+        raise ValueError(f"The catalog has no {vibe_type} vibes")
+    return catalog
+
+
+def run_fast(
+    vibe_type: str,
+    seed: int | None,
+    count: int | None,
+    catalog: str | None,
+    content_pack: str | None,
+) -> bool:
+    """Write one vibe, or count vibes, using only the modules already imported.
+
+    Args:
+        vibe_type: Type of vibe to generate.
+        seed: Seed for the random stream.
+        count: Number of vibes to generate, or None for a single vibe.
+        catalog: Catalog to serve vibes from, if any.
+        content_pack: Content pack to generate vibes from, if any.
+
+    Returns:
+        False if the catalog or content pack can't be used, leaving the full
+        parser to report it.
+    """
+    if catalog is not None and content_pack is not None:
+        return False
+
+    vibe_catalog = None
+    if catalog is not None:
+        try:
+            vibe_catalog = open_catalog(catalog, vibe_type)
+        except ValueError:
+            return False
+
+    content = None
+    if content_pack is not None:
+        from bsidespgh25.content import load_content_pack
+
+        try:
+            content = load_content_pack(content_pack)
+        except ValueError:
+            return False
+
+    vibe_gen = VibeGenerator(seed=seed, catalog=vibe_catalog, content=content)
+    with VibeWriter(sys.stdout, stats=vibe_gen.stats) as writer:
+        if vibe_catalog is not None:
+            frames = vibe_gen.iter_frames(
+                1 if count is None else count, vibe_type, separator=count is not None
+            )
+            for frame in frames:
+                writer.write_encoded(frame)
+        elif count is None:
+            art, message = generate_vibe(vibe_gen, vibe_type)
+            writer.write_vibe(art, message, separator=False)
+        else:
+            write_encoded_vibes(vibe_gen.iter_encoded_vibes(count, vibe_type), writer)
+    return True
+
+
+def main(argv: list[str] | None = None):
+    """Main entry point for the application.
+
+    Args:
+        argv: Command line arguments; defaults to ``sys.argv[1:]``.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    options = parse_fast_args(argv)
+    if options is not None and run_fast(**options):
+        return
+
+    from bsidespgh25 import config
+
+    # Plugins have to be loaded before the parser lists the available vibe types
+    if "--plugins" in argv:
+        ART_REGISTRY.load_entry_points()
+
     # Parse arguments manually to avoid conflicts with config
     parser = create_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    if args.workers > 1 and args.count is None:
+        parser.error("--workers requires --count")
+    if args.chunk_size <= 0:
+        parser.error("--chunk-size must be positive")
+    if args.queue_depth <= 0:
+        parser.error("--queue-depth must be positive")
+    if args.fps is not None:
+        if args.fps <= 0:
+            parser.error("--fps must be positive")
+        args.delay = 1 / args.fps
+    if (args.width is not None and args.width <= 0) or (
+        args.height is not None and args.height <= 0
+    ):
+        parser.error("--width and --height must be positive")
+    if not 0.0 <= args.mutation_rate <= 1.0:
+        parser.error("--mutation-rate must be between 0 and 1")
+    if args.serve:
+        from bsidespgh25.server import parse_address
+
+        try:
+            parse_address(args.serve)
+        except ValueError as error:
+            parser.error(str(error))
+    if args.catalog and (args.workers > 1 or args.continuous or args.serve):
+        parser.error("--catalog only supports single vibes and --count")
+    if args.build_catalog and args.count is not None and args.count < 0:
+        parser.error("--count must not be negative")
+    if args.catalog and args.content_pack:
+        parser.error("--catalog vibes are pre-rendered; build it with --content-pack")
+    if args.catalog and args.banner_text:
+        parser.error(
+            "--catalog vibes are pre-rendered; --banner-text can't change them"
+        )
+    if args.color and (args.catalog or args.serve):
+        parser.error("--color only applies to vibes generated for stdout")
+    if args.output != "text" and (
+        args.workers > 1 or args.catalog or args.serve or args.animate or args.color
+    ):
+        parser.error(
+            f"--output {args.output} doesn't support --workers, --catalog, --serve, "
+            "--animate or --color"
+        )
 
     # Setup logging
-    log = config.setup_logging(args.loglevel)
+    log = config.setup_logging(args.loglevel, queue=args.log_queue)
     log.debug("Logging initialized with level: %s", log.level)
 
+    content = None
+    if args.content_pack:
+        from bsidespgh25.content import load_content_pack
+
+        try:
+            content = load_content_pack(args.content_pack)
+        except ValueError as error:
+            parser.error(str(error))
+
+    if args.build_catalog:
+        from bsidespgh25.catalog import DEFAULT_SEED, DEFAULT_SIZE, build_catalog
+
+        entries = build_catalog(
+            args.build_catalog,
+            size=DEFAULT_SIZE if args.count is None else args.count,
+            seed=DEFAULT_SEED if args.seed is None else args.seed,
+            content=content,
+        )
+        print(f"📚 Wrote {entries} vibes to {args.build_catalog}")
+        return
+
+    catalog = None
+    if args.catalog:
+        try:
+            catalog = open_catalog(args.catalog, args.vibe_type)
+        except ValueError as error:
+            parser.error(str(error))
+
+    weights = {}
+    if args.weights:
+        try:
+            weights = config.load_weights(args.weights)
+        except (TypeError, ValueError) as error:
+            parser.error(str(error))
+    no_repeat = (
+        weights.get("no_repeat", 0) if args.no_repeat is None else args.no_repeat
+    )
+    if no_repeat < 0:
+        parser.error("--no-repeat must not be negative")
+
     # Create vibe generator
-    vibe_gen = VibeGenerator()
+    try:
+        vibe_gen = VibeGenerator(
+            seed=args.seed,
+            catalog=catalog,
+            registry=ART_REGISTRY,
+            weights=weights,
+            no_repeat=no_repeat,
+            content=content,
+            matrix_size=matrix_size(args),
+            banner_text=args.banner_text,
+        )
+    except ValueError as error:
+        parser.error(str(error))
 
     # Handle different modes
-    if args.stats:
-        stats = vibe_gen.get_stats()
-        print("\n📊 Vibe Generator Statistics 📊")
-        print("─" * 40)
-        for key, value in stats.items():
-            print(f"{key.replace('_', ' ').title()}: {value}")
+    if args.stats and not args.vibe:
+        if args.output == "text":
+            print_stats(vibe_gen.get_stats())
+        else:
+            from bsidespgh25.records import RecordEncoder
+
+            try:
+                writer = VibeWriter(sys.stdout, binary=args.output == "binary")
+            except ValueError as error:
+                parser.error(str(error))
+            with writer:
+                encoder = RecordEncoder(args.output)
+                writer.write_record(encoder.encode_stats(vibe_gen.get_stats()))
+        return
+
+    if args.serve:
+        import asyncio
+
+        from bsidespgh25.server import VibeServer, parse_address
+
+        host, port = parse_address(args.serve)
+        server = VibeServer(
+            vibe_gen, host, port, vibe_type=args.vibe_type, delay=args.delay
+        )
+        print(f"📡 Serving vibes on {args.serve}! Press Ctrl+C to stop.")
+        try:
+            asyncio.run(server.serve_forever())
+        except KeyboardInterrupt:
+            stats = server.get_stats()
+            print("\n\n✨ Vibe server stopped! Stay secure! ✨")
+            print(f"Frames published: {stats['frames_published']}")
+            print(f"Clients served: {stats['clients_served']}")
         return
 
     if args.vibe:
-        if args.continuous:
-            print("🎉 Starting continuous vibe mode! Press Ctrl+C to stop.")
-            print("─" * 60)
-            try:
-                while True:
-                    art, message = generate_vibe(vibe_gen, args.vibe_type)
-                    print(art)
-                    print(f"\n{message}\n")
-                    print("─" * 60)
-                    time.sleep(args.delay)
-            except KeyboardInterrupt:
-                print("\n\n✨ Vibe session ended! Stay secure! ✨")
-                stats = vibe_gen.get_stats()
-                print(f"Total vibes generated: {stats['vibes_generated']}")
-        else:
-            # Single vibe
-            art, message = generate_vibe(vibe_gen, args.vibe_type)
-            print(art)
-            print(f"\n{message}\n")
+        flush_policy = args.flush
+        if flush_policy == "auto" and args.continuous and args.delay > 0:
+            # Paced output should show up as it is generated, even when piped
+            flush_policy = "frame"
+        try:
+            writer = VibeWriter(
+                sys.stdout,
+                flush_policy=flush_policy,
+                stats=vibe_gen.stats,
+                binary=args.output == "binary",
+            )
+        except ValueError as error:
+            parser.error(str(error))
+        with writer:
+            if args.output == "text":
+                run_stats = run_vibes(args, vibe_gen, writer)
+            else:
+                from bsidespgh25.records import RecordEncoder
+
+                encoder = RecordEncoder(args.output)
+                run_stats = run_records(args, vibe_gen, writer, encoder)
+                if args.stats:
+                    # The summary follows the vibes as a record of its own
+                    writer.flush()
+                    stats = {**vibe_gen.get_stats(), **run_stats}
+                    writer.write_record(encoder.encode_stats(stats))
+        if args.stats and args.output == "text":
+            # Keep the summary out of the vibe stream so it can be piped
+            print_stats({**vibe_gen.get_stats(), **run_stats}, sys.stderr)
     else:
         # Default behavior - show help
         parser.print_help()
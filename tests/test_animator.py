@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Test bsidespgh25/animator.py
+"""
+
+import random
+import re
+
+import pytest
+
+from bsidespgh25.animator import MatrixAnimator, move_cursor
+
+ESCAPE = re.compile(r"\x1b\[(\d+);(\d+)H")
+
+
+def apply_updates(screen: list[list[str]], output: str) -> None:
+    """Apply cursor positioned writes to a simulated screen."""
+    pieces = ESCAPE.split(output)
+    for index in range(1, len(pieces), 3):
+        row, column, text = (
+            int(pieces[index]) - 1,
+            int(pieces[index + 1]) - 1,
+            pieces[index + 2],
+        )
+        for offset, glyph in enumerate(text):
+            screen[row][column + offset] = glyph
+
+
+@pytest.mark.unit
+def test_move_cursor():
+    """Test move_cursor() uses one-based ANSI coordinates"""
+    assert move_cursor(0, 0) == "\x1b[1;1H"
+    assert move_cursor(4, 9) == "\x1b[5;10H"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("mode", MatrixAnimator.MODES)
+def test_tick_updates_match_frame(mode):
+    """Test that applying tick() output reproduces the animator frame"""
+    animator = MatrixAnimator(
+        width=20, height=6, mutation_rate=0.2, mode=mode, rng=random.Random(7)
+    )
+    screen = [[" "] * 20 for _ in range(6)]
+    apply_updates(screen, animator.render_full())
+    assert "\n".join("".join(row) for row in screen) == animator.frame
+
+    for _ in range(10):
+        apply_updates(screen, animator.tick())
+        assert "\n".join("".join(row) for row in screen) == animator.frame
+
+    assert animator.ticks == 10
+
+
+@pytest.mark.unit
+def test_tick_writes_less_than_full_frame():
+    """Test that a sparse mutation emits far less than a full redraw"""
+    animator = MatrixAnimator(
+        width=200, height=60, mutation_rate=0.01, rng=random.Random(1)
+    )
+
+    assert len(animator.tick()) * 5 < len(animator.render_full())
+
+
+@pytest.mark.unit
+def test_zero_mutation_rate_is_silent():
+    """Test that a zero mutation rate emits nothing"""
+    animator = MatrixAnimator(mutation_rate=0.0)
+
+    assert animator.tick() == ""
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"width": 0}, {"height": -1}, {"mutation_rate": 1.5}, {"mode": "invalid"}],
+)
+def test_invalid_arguments(kwargs):
+    """Test that invalid arguments are rejected"""
+    with pytest.raises(ValueError):
+        MatrixAnimator(**kwargs)
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Test bsidespgh25/banner.py
+"""
+
+import time
+
+import pytest
+
+from bsidespgh25.banner import BANNER_FONT, GLYPHS, BannerFont
+
+
+@pytest.mark.unit
+def test_render():
+    """Test that banners are drawn from the glyph atlas"""
+    font = BannerFont({"H": "#.#|###|#.#", "I": "#|#|#", "?": "##|.#|#."}, fill="#")
+
+    assert font.render("hi") == "\n    # # #\n    ### #\n    # # #\n"
+    assert font.height == 3
+
+
+@pytest.mark.unit
+def test_normalize():
+    """Test that text is mapped onto the atlas"""
+    assert BANNER_FONT.normalize("hack\tthe  planet") == "HACK THE PLANET"
+    assert BANNER_FONT.normalize("vibe✨") == "VIBE?"
+
+
+@pytest.mark.unit
+def test_every_glyph():
+    """Test that every glyph renders at the font's height"""
+    rows = BANNER_FONT.render("".join(GLYPHS)).split("\n")
+
+    assert rows[0] == ""
+    assert rows[-1] == ""
+    assert len(rows) == BANNER_FONT.height + 2
+
+
+@pytest.mark.unit
+def test_cache():
+    """Test that rendered banners are cached"""
+    font = BannerFont(cache_size=2)
+
+    assert font.render("HACK") is font.render("HACK")
+    assert font.render.cache_info().hits == 1
+
+
+@pytest.mark.unit
+def test_render_time():
+    """Test that a 40-character banner renders well under a millisecond"""
+    font = BannerFont(cache_size=0)
+    text = "SHELLCODE ROOTKIT SANDBOX FORENSIC 12345"
+
+    start = time.perf_counter()
+    for _ in range(100):
+        font.render(text)
+    assert (time.perf_counter() - start) / 100 < 0.0005
+
+
+@pytest.mark.unit
+def test_invalid_font():
+    """Test that inconsistent atlases are rejected"""
+    with pytest.raises(ValueError):
+        BannerFont({"A": "#"})
+    with pytest.raises(ValueError):
+        BannerFont({"?": "#|#", "A": "#"})
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Test bsidespgh25/catalog.py
+"""
+
+import pytest
+
+from bsidespgh25.catalog import VibeCatalog, build_catalog
+from bsidespgh25.output import format_vibe
+from bsidespgh25.vibe_generator import VibeGenerator
+
+
+@pytest.fixture
+def catalog_path(tmp_path):
+    """Build a small catalog"""
+    path = tmp_path / "catalog.vibes"
+    build_catalog(path, size=5, seed=1)
+    return path
+
+
+@pytest.mark.unit
+def test_build_catalog(catalog_path):
+    """Test that build_catalog() renders every art type"""
+    with VibeCatalog(catalog_path) as catalog:
+        assert len(catalog) == 15
+        assert catalog.types == VibeGenerator.ART_TYPES
+        assert catalog.ranges["matrix"] == (5, 5)
+
+
+@pytest.mark.unit
+def test_build_catalog_is_reproducible(tmp_path, catalog_path):
+    """Test that the same seed builds the same catalog"""
+    other = tmp_path / "other.vibes"
+    build_catalog(other, size=5, seed=1)
+
+    assert other.read_bytes() == catalog_path.read_bytes()
+
+
+@pytest.mark.unit
+def test_catalog_frames_match_format_vibe(catalog_path):
+    """Test that frames are formatted exactly like format_vibe()"""
+    with VibeCatalog(catalog_path) as catalog:
+        for index, (art, message) in enumerate(catalog):
+            assert catalog.frame(index) == format_vibe(art, message).encode()
+            assert catalog.frame(index, separator=False) == (
+                format_vibe(art, message, separator=False).encode()
+            )
+
+
+@pytest.mark.unit
+def test_catalog_index_out_of_range(catalog_path):
+    """Test that missing entries raise IndexError"""
+    with VibeCatalog(catalog_path) as catalog:
+        with pytest.raises(IndexError):
+            catalog.frame(15)
+        with pytest.raises(IndexError):
+            catalog.vibe(-1)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("content", [b"", b"not a catalog at all, really"])
+def test_catalog_invalid_file(tmp_path, content):
+    """Test that files which aren't catalogs are rejected"""
+    path = tmp_path / "invalid.vibes"
+    path.write_bytes(content)
+
+    with pytest.raises(ValueError):
+        VibeCatalog(path)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("size", [20, 100, 500, -1])
+def test_catalog_truncated_file(tmp_path, catalog_path, size):
+    """Test that truncated catalogs are rejected"""
+    path = tmp_path / "truncated.vibes"
+    path.write_bytes(catalog_path.read_bytes()[:size])
+
+    with pytest.raises(ValueError, match="Truncated"):
+        VibeCatalog(path)
+
+
+@pytest.mark.unit
+def test_iter_frames(catalog_path):
+    """Test VibeGenerator.iter_frames() serves and counts catalog vibes"""
+    with VibeCatalog(catalog_path) as catalog:
+        vibe_gen = VibeGenerator(seed=3, catalog=catalog)
+        frames = list(vibe_gen.iter_frames(6, vibe_type="word"))
+
+        assert len(frames) == 6
+        first = catalog.ranges["word"][0]
+        word_frames = {catalog.frame(first + offset) for offset in range(5)}
+        assert set(frames) <= word_frames
+        assert vibe_gen.get_stats()["word_vibes"] == 6
+
+
+@pytest.mark.unit
+def test_iter_frames_invalid(catalog_path):
+    """Test iter_frames() without a catalog or with a missing type"""
+    with pytest.raises(ValueError):
+        next(VibeGenerator().iter_frames(1))
+
+    with VibeCatalog(catalog_path) as catalog, pytest.raises(ValueError):
+        next(VibeGenerator(catalog=catalog).iter_frames(1, vibe_type="banner"))
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Test bsidespgh25/color.py
+"""
+
+import random
+import re
+
+import pytest
+
+from bsidespgh25.color import (
+    RESET,
+    ColorRenderer,
+    color_depth,
+    detect_color_depth,
+    escape,
+)
+from bsidespgh25.matrix import MatrixBuffer
+from bsidespgh25.stats import VibeStats
+from bsidespgh25.vibe_generator import VibeGenerator
+
+ESCAPE = re.compile(r"\x1b\[[\d;]*m")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("depth", "expected"),
+    [
+        ("truecolor", "\x1b[38;2;0;200;0m"),
+        ("256", "\x1b[38;5;40m"),
+        ("16", "\x1b[32m"),
+    ],
+)
+def test_escape(depth, expected):
+    """Test escape sequences at each color depth"""
+    assert escape((0, 200, 0), depth) == expected
+
+    with pytest.raises(ValueError):
+        escape((0, 200, 0), "mono")
+
+
+@pytest.mark.unit
+def test_color_depth():
+    """Test resolving the color depth from the environment"""
+    assert detect_color_depth({"COLORTERM": "truecolor"}) == "truecolor"
+    assert detect_color_depth({"TERM": "xterm-256color"}) == "256"
+    assert detect_color_depth({"TERM": "xterm"}) == "16"
+
+    assert color_depth("auto", {"TERM": "xterm-256color"}) == "256"
+    assert color_depth("16", {"COLORTERM": "truecolor"}) == "16"
+    assert color_depth(None, {}) is None
+    assert color_depth("truecolor", {"NO_COLOR": "1"}) is None
+
+
+@pytest.mark.unit
+def test_colorize_coalesces_runs():
+    """Test that each run of same-colored cells gets a single escape"""
+    renderer = ColorRenderer(
+        "16", gradient=[(0, 205, 0)], glyph_colors={"1": (255, 255, 255)}
+    )
+
+    assert renderer.colorize("ab11 1c\n\n1x") == (
+        "\x1b[32mab\x1b[97m11 1\x1b[32mc\n\n\x1b[97m1\x1b[32mx" + RESET
+    )
+    assert renderer.colorize("") == ""
+
+
+@pytest.mark.unit
+def test_colorize_gradient():
+    """Test that lines take their color from the gradient"""
+    renderer = ColorRenderer(
+        "truecolor", gradient=[(0, 100, 0), (0, 200, 0)], glyph_colors={}
+    )
+    lines = renderer.colorize("a\nb\nc\nd").split("\n")
+
+    assert [ESCAPE.findall(line)[0] for line in lines] == [
+        escape((0, 100, 0), "truecolor"),
+        escape((0, 100, 0), "truecolor"),
+        escape((0, 200, 0), "truecolor"),
+        escape((0, 200, 0), "truecolor"),
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("depth", ["16", "256", "truecolor"])
+def test_colorize_matrix(depth):
+    """Test that colored matrices keep their glyphs and bounded overhead"""
+    stats = VibeStats()
+    renderer = ColorRenderer(depth, stats=stats)
+    art = MatrixBuffer(80, 20, VibeGenerator.MATRIX_CHARS).render(random.Random(1))
+    colored = renderer.colorize(art)
+
+    assert ESCAPE.sub("", colored) == art
+    added = len(colored.encode()) - len(art.encode())
+    assert stats.counts()["color_bytes"] == added
+    # Far below an escape per cell
+    assert len(ESCAPE.findall(colored)) < 80 * 20 / 2
+
+
+@pytest.mark.unit
+def test_invalid_renderer():
+    """Test that invalid renderer settings are rejected"""
+    with pytest.raises(ValueError):
+        ColorRenderer("mono")
+    with pytest.raises(ValueError):
+        ColorRenderer(gradient=[])
+    with pytest.raises(ValueError):
+        ColorRenderer(glyph_colors={" ": (0, 0, 0)})
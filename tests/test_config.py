@@ -4,7 +4,12 @@ Test bsidespgh25/config.py
 """
 
 import argparse
+import io
+import json
 import logging
+import logging.handlers
+import sys
+import time
 
 import pytest
 
@@ -37,8 +42,154 @@ def test_setup_logging(mocker):
     assert isinstance(config.setup_logging(), logging.Logger)
 
 
+def make_record(message: str, *args, **kwargs) -> logging.LogRecord:
+    """Build a log record"""
+    return logging.LogRecord(
+        "bsidespgh25", logging.WARNING, __file__, 1, message, args, None, **kwargs
+    )
+
+
+@pytest.mark.unit
+def test_json_formatter():
+    """Test that messages with quotes, backslashes and newlines stay valid JSON"""
+    formatter = config.JsonFormatter()
+    record = make_record('say "%s"\n\\', "hi")
+
+    line = formatter.format(record)
+    assert "\n" not in line
+    assert json.loads(line) == {
+        "timestamp": formatter.formatTime(record),
+        "namespace": "bsidespgh25",
+        "loglevel": "WARNING",
+        "message": 'say "hi"\n\\',
+    }
+
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        record.exc_info = sys.exc_info()
+    assert "RuntimeError: boom" in json.loads(formatter.format(record))["exception"]
+
+
+@pytest.mark.unit
+def test_json_formatter_time():
+    """Test that timestamps are formatted once per second"""
+    formatter = config.JsonFormatter()
+    record = make_record("vibes")
+    record.created, record.msecs = 1_700_000_000.25, 250.0
+    expected = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(1_700_000_000))
+
+    assert formatter.formatTime(record) == f"{expected},250"
+    cached = formatter._second
+    record.msecs = 999.0
+    assert formatter.formatTime(record) == f"{expected},999"
+    assert formatter._second is cached
+    assert formatter.formatTime(record, "%Y") == expected[:4]
+
+
+@pytest.mark.unit
+def test_setup_logging_queue(monkeypatch):
+    """Test writing log records from a queue listener thread"""
+    root = logging.getLogger()
+    stream = io.StringIO()
+    monkeypatch.setattr(root, "handlers", [])
+    monkeypatch.setattr(root, "level", root.level)
+    monkeypatch.setattr(sys, "stderr", stream)
+    listeners = []
+    monkeypatch.setattr("atexit.register", listeners.append)
+
+    log = config.setup_logging(logging.INFO, queue=True)
+    log.debug("hidden")
+    log.info('queued "vibes"')
+    (stop,) = listeners
+    stop()
+
+    (line,) = stream.getvalue().splitlines()
+    assert json.loads(line)["message"] == 'queued "vibes"'
+    assert isinstance(root.handlers[0], logging.handlers.QueueHandler)
+
+
+@pytest.mark.unit
+def test_setup_logging_queue_exception(monkeypatch):
+    """Test that queued exceptions are written as a separate key"""
+    root = logging.getLogger()
+    stream = io.StringIO()
+    monkeypatch.setattr(root, "handlers", [])
+    monkeypatch.setattr(root, "level", root.level)
+    monkeypatch.setattr(sys, "stderr", stream)
+    listeners = []
+    monkeypatch.setattr("atexit.register", listeners.append)
+
+    log = config.setup_logging(logging.INFO, queue=True)
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        log.exception("failed %s", "vibe")
+    (stop,) = listeners
+    stop()
+
+    (line,) = stream.getvalue().splitlines()
+    record = json.loads(line)
+    assert record["message"] == "failed vibe"
+    assert "RuntimeError: boom" in record["exception"]
+
+
 @pytest.mark.unit
 def test_create_arg_parser():
     """Test create_arg_parser()"""
     # Validate the return type
     assert isinstance(config.create_arg_parser(), argparse.ArgumentParser)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("name", "content"),
+    [
+        (
+            "weights.json",
+            '{"no_repeat": 2, "words": {"HACK": 3}, "patterns": [1, 2, 3]}',
+        ),
+        ("weights.toml", "no_repeat = 2\npatterns = [1, 2, 3]\n[words]\nHACK = 3\n"),
+    ],
+)
+def test_load_weights(tmp_path, name, content):
+    """Test load_weights() with JSON and TOML files"""
+    path = tmp_path / name
+    path.write_text(content)
+
+    assert config.load_weights(path) == {
+        "no_repeat": 2,
+        "words": {"HACK": 3},
+        "patterns": [1, 2, 3],
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "content",
+    [
+        "not json",
+        '{"colors": {}}',
+        '{"art_types": [1, 2, 3]}',
+        '{"words": {"HACK": -1}}',
+        '{"patterns": [true]}',
+        '{"no_repeat": 1.5}',
+    ],
+)
+def test_load_weights_invalid(tmp_path, content):
+    """Test load_weights() rejects invalid files"""
+    path = tmp_path / "weights.json"
+    path.write_text(content)
+
+    with pytest.raises(ValueError):
+        config.load_weights(path)
+
+
+@pytest.mark.unit
+def test_load_weights_not_a_table(tmp_path):
+    """Test load_weights() rejects files that don't hold a table"""
+    path = tmp_path / "weights.json"
+    path.write_text("[1, 2]")
+
+    with pytest.raises(TypeError):
+        config.load_weights(path)
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Test bsidespgh25/content.py
+"""
+
+import json
+import pickle
+
+import pytest
+
+from bsidespgh25.content import (
+    ContentPackError,
+    PackStrings,
+    cache_path,
+    load_content_pack,
+    parse_content_pack,
+)
+from bsidespgh25.vibe_generator import VibeGenerator
+
+
+@pytest.fixture
+def pack_dir(tmp_path):
+    """A content pack directory"""
+    path = tmp_path / "pack"
+    (path / "patterns").mkdir(parents=True)
+    (path / "patterns" / "01-glider.txt").write_text(".#.\n..#\n###\n")
+    (path / "patterns" / "02-block.txt").write_text("##\n##\n")
+    (path / "words.txt").write_text("# Conference words\nBSIDES\n\nPGH\n")
+    return path
+
+
+@pytest.mark.unit
+def test_parse_directory(pack_dir):
+    """Test reading a pack directory"""
+    assert parse_content_pack(pack_dir) == {
+        "patterns": [".#.\n..#\n###\n", "##\n##\n"],
+        "words": ["BSIDES", "PGH"],
+    }
+
+
+@pytest.mark.unit
+def test_parse_toml(tmp_path):
+    """Test reading a TOML pack"""
+    path = tmp_path / "pack.toml"
+    path.write_text('messages = ["🔐 TOML vibes 🔐"]\n')
+
+    assert parse_content_pack(path) == {"messages": ["🔐 TOML vibes 🔐"]}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "content",
+    [
+        "[]",
+        "{}",
+        '{"jokes": ["knock knock"]}',
+        '{"words": []}',
+        '{"words": "HACK"}',
+        '{"words": ["HACK", 1]}',
+        '{"messages": ["   "]}',
+        '{"messages": ["two\\nlines"]}',
+        "not json",
+    ],
+)
+def test_parse_invalid(tmp_path, content):
+    """Test that malformed packs are rejected"""
+    path = tmp_path / "pack.json"
+    path.write_text(content)
+
+    with pytest.raises(ContentPackError):
+        parse_content_pack(path)
+
+
+@pytest.mark.unit
+def test_parse_unsupported(tmp_path):
+    """Test that unsupported pack files are rejected"""
+    path = tmp_path / "pack.yaml"
+    path.write_text("words: [HACK]")
+
+    with pytest.raises(ContentPackError):
+        parse_content_pack(path)
+    with pytest.raises(ContentPackError):
+        load_content_pack(tmp_path / "missing.json", tmp_path)
+
+
+@pytest.mark.unit
+def test_load_compiles_cache(pack_dir, tmp_path, mocker):
+    """Test that a loaded pack is cached and served from the cache"""
+    cache_dir = tmp_path / "cache"
+    pack = load_content_pack(pack_dir, cache_dir)
+
+    assert cache_path(pack_dir, cache_dir).exists()
+    assert isinstance(pack.words, PackStrings)
+    assert list(pack.words) == ["BSIDES", "PGH"]
+    assert pack.patterns[-1] == "##\n##\n"
+    assert pack.patterns[:1] == [".#.\n..#\n###\n"]
+    assert pack.messages is None
+
+    # A warm cache doesn't parse the pack again
+    parse = mocker.patch("bsidespgh25.content.parse_content_pack")
+    assert list(load_content_pack(pack_dir, cache_dir).words) == ["BSIDES", "PGH"]
+    parse.assert_not_called()
+
+
+@pytest.mark.unit
+def test_load_detects_changes(pack_dir, tmp_path):
+    """Test that changing a pack invalidates its cache"""
+    cache_dir = tmp_path / "cache"
+    load_content_pack(pack_dir, cache_dir)
+
+    (pack_dir / "words.txt").write_text("SECURE\n")
+    (pack_dir / "patterns" / "03-dot.txt").write_text(".\n")
+    pack = load_content_pack(pack_dir, cache_dir)
+
+    assert list(pack.words) == ["SECURE"]
+    assert len(pack.patterns) == 3
+
+
+@pytest.mark.unit
+def test_load_without_cache(pack_dir, tmp_path):
+    """Test that a pack loads even if its cache can't be written"""
+    cache_dir = tmp_path / "cache"
+    cache_dir.write_text("not a directory")
+
+    pack = load_content_pack(pack_dir, cache_dir)
+
+    assert pack.words == ["BSIDES", "PGH"]
+
+
+@pytest.mark.unit
+def test_large_pack(tmp_path):
+    """Test sampling a large pack"""
+    path = tmp_path / "pack.json"
+    path.write_text(json.dumps({"messages": [f"vibe {n}" for n in range(50_000)]}))
+    load_content_pack(path, tmp_path)
+
+    pack = load_content_pack(path, tmp_path)
+    vibe_gen = VibeGenerator(seed=1, content=pack)
+
+    assert vibe_gen.get_vibe_message().startswith("vibe ")
+    assert vibe_gen.get_stats()["messages_available"] == 50_000
+
+
+@pytest.mark.unit
+def test_generator_uses_pack(pack_dir, tmp_path, monkeypatch):
+    """Test that generators draw from the pack and keep built-in content for missing sections"""
+    monkeypatch.setenv("BSIDESPGH25_CACHE_DIR", str(tmp_path))
+    pack = load_content_pack(pack_dir)
+    vibe_gen = VibeGenerator(seed=1, content=pack)
+
+    assert vibe_gen.generate_random_pattern() in pack.patterns
+    word_art = vibe_gen.generate_word_art()
+    assert any(f"│  {word}  │" in word_art for word in pack.words)
+    assert vibe_gen.get_vibe_message() in VibeGenerator.VIBE_MESSAGES
+    assert all(child.content is pack for child in vibe_gen.spawn(2))
+
+    # Worker processes reload the pack by path
+    assert list(pickle.loads(pickle.dumps(pack)).words) == ["BSIDES", "PGH"]
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Test bsidespgh25/farm.py
+"""
+
+import pickle
+
+import pytest
+
+from bsidespgh25.farm import VibeFarm, generate_chunk
+from bsidespgh25.frame import Frame
+from bsidespgh25.vibe_generator import VibeGenerator
+
+
+@pytest.mark.unit
+def test_generate_chunk():
+    """Test generate_chunk() returns vibes and the worker counters"""
+    vibes, counts = generate_chunk(seed=1, count=5, vibe_type="word")
+
+    assert len(vibes) == 5
+    assert counts["vibes.word"] == 5
+    lookups = counts.get("word_art_cache_hits", 0) + counts["word_art_cache_misses"]
+    assert lookups == 5
+
+
+@pytest.mark.unit
+def test_generate_chunk_frames():
+    """Test that worker matrices come back as frames of the same art"""
+    vibes, _ = generate_chunk(seed=2, count=4, vibe_type="matrix")
+
+    assert all(isinstance(art, Frame) for art, _ in vibes)
+    expected = list(VibeGenerator(seed=2).iter_vibes(4, "matrix"))
+    assert [(str(art), message) for art, message in vibes] == expected
+    # Pickled frames are far smaller than the text they stand for
+    assert len(pickle.dumps(vibes)) * 2 < len(pickle.dumps(expected))
+
+
+@pytest.mark.unit
+def test_farm_is_deterministic():
+    """Test that ordered output only depends on the seed and chunk size"""
+    first = VibeFarm(VibeGenerator(seed=5), workers=2, chunk_size=7)
+    second = VibeFarm(VibeGenerator(seed=5), workers=3, chunk_size=7)
+
+    assert list(first.iter_vibes(30)) == list(second.iter_vibes(30))
+
+
+@pytest.mark.unit
+def test_farm_aggregates_stats():
+    """Test that worker statistics are merged into the parent generator"""
+    vibe_gen = VibeGenerator(seed=5)
+    farm = VibeFarm(vibe_gen, workers=2, chunk_size=4, ordered=False)
+
+    vibes = list(farm.iter_vibes(10, vibe_type="matrix"))
+
+    assert len(vibes) == 10
+    stats = vibe_gen.get_stats()
+    assert stats["vibes_generated"] == 10
+    assert stats["matrix_vibes"] == 10
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("kwargs", [{"workers": 0}, {"workers": 2, "chunk_size": 0}])
+def test_farm_invalid_arguments(kwargs):
+    """Test that invalid farm arguments are rejected"""
+    with pytest.raises(ValueError):
+        VibeFarm(VibeGenerator(), **kwargs)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test bsidespgh25/frame.py
+"""
+
+import pickle
+import sys
+
+import pytest
+
+from bsidespgh25.frame import Frame, GlyphTable
+
+TABLE = GlyphTable("01█")
+
+
+def make_frame(rows: list[str]) -> Frame:
+    """Build a frame from rows of glyphs"""
+    text = "\n".join(rows)
+    indices = bytes(TABLE.decoding_table.index(char) for char in text)
+    return Frame(indices, len(rows[0]), len(rows), TABLE)
+
+
+@pytest.mark.unit
+def test_materialize():
+    """Test that text and bytes are built once, on demand"""
+    frame = make_frame(["01█", "█10"])
+
+    assert frame._text is None
+    text = str(frame)
+    assert text == "01█\n█10"
+    assert str(frame) is text
+    encoded = bytes(frame)
+    assert encoded == "01█\n█10".encode()
+    assert bytes(frame) is encoded
+    assert f"{frame}" == "01█\n█10"
+
+
+@pytest.mark.unit
+def test_encode():
+    """Test that ASCII glyphs translate to bytes and others encode as UTF-8"""
+    assert TABLE.encoding_table is None
+    assert TABLE.encode(bytes([0, 2, 3, 1])) == "0█\n1".encode()
+
+    table = GlyphTable("01")
+    assert table.encoding_table is not None
+    assert table.encode(bytes([0, 1, 2, 1])) == b"01\n1"
+    assert bytes(Frame(bytes([1, 0, 2, 0, 0]), 2, 2, table)) == b"10\n00"
+
+
+@pytest.mark.unit
+def test_compact():
+    """Test that frames take less memory than their text"""
+    frame = make_frame(["█" * 80] * 20)
+
+    size = sys.getsizeof(frame) + sys.getsizeof(frame.indices)
+    assert size * 1.8 < sys.getsizeof(str(frame))
+    assert size * 2.5 < sys.getsizeof(bytes(frame))
+
+
+@pytest.mark.unit
+def test_diff():
+    """Test finding the cells that changed"""
+    previous = make_frame(["0000", "0000", "0000"])
+    frame = make_frame(["0110", "0000", "█00█"])
+
+    assert frame.diff(previous) == [(0, 1, "11"), (2, 0, "█"), (2, 3, "█")]
+    assert frame.diff(frame) == []
+    # Without a comparable frame, everything changed
+    assert frame.diff(None) == [(0, 0, "0110"), (1, 0, "0000"), (2, 0, "█00█")]
+    assert frame.diff(make_frame(["00", "00"])) == frame.diff(None)
+
+
+@pytest.mark.unit
+def test_equality():
+    """Test that frames compare by their cells"""
+    assert make_frame(["01", "10"]) == make_frame(["01", "10"])
+    assert make_frame(["01", "10"]) != make_frame(["01", "11"])
+    assert len({make_frame(["01"]), make_frame(["01"])}) == 1
+
+
+@pytest.mark.unit
+def test_pickle():
+    """Test that frames pickle without their cached text"""
+    frame = make_frame(["01█", "█10"])
+    str(frame)
+
+    copy = pickle.loads(pickle.dumps(frame))
+    assert copy == frame
+    assert copy._text is None
+    assert str(copy) == str(frame)
+
+
+@pytest.mark.unit
+def test_invalid():
+    """Test that mismatched indices and glyph tables are rejected"""
+    with pytest.raises(ValueError):
+        Frame(b"\x00\x01", 3, 1, TABLE)
+    with pytest.raises(ValueError):
+        GlyphTable("")
@@ -50,3 +50,20 @@ def test_main_as_script():
     # Should show help text
     assert "--vibe" in result.stdout
     assert "Tip:" in result.stdout
+
+
+@pytest.mark.unit
+def test_main_fast_path_imports():
+    """Test that a one-shot vibe skips the heavy imports"""
+    main_path = Path(__file__).parent.parent / "src" / "main.py"
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", str(main_path), "--vibe"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    imported = {line.split("|")[-1].strip() for line in result.stderr.splitlines()}
+    for module in ("argparse", "asyncio", "concurrent.futures", "json", "logging"):
+        assert module not in imported
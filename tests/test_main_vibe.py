@@ -2,11 +2,28 @@
 Tests for the main module vibe functionality.
 """
 
+import io
+import json
+import re
+import signal
+import sys
 from unittest.mock import Mock, patch
 
 import pytest
 
-from main import create_parser, generate_vibe, main
+from bsidespgh25.output import SEPARATOR, VibeWriter
+from bsidespgh25.records import iter_binary_records
+from bsidespgh25.registry import ART_REGISTRY
+from bsidespgh25.vibe_generator import VibeGenerator
+from bsidespgh25.watcher import watch_content
+from main import (
+    create_parser,
+    follow_terminal_size,
+    generate_vibe,
+    main,
+    parse_fast_args,
+    write_vibes,
+)
 
 
 class TestMainVibeFeatures:
@@ -31,9 +48,9 @@ class TestMainVibeFeatures:
 
     def test_generate_vibe_pattern_type(self):
         """Test generate_vibe with pattern type."""
-        vibe_gen = Mock()
-        vibe_gen.generate_random_pattern.return_value = "pattern_art"
-        vibe_gen.get_vibe_message.return_value = "vibe_message"
+        vibe_gen = VibeGenerator()
+        vibe_gen.generate_random_pattern = Mock(return_value="pattern_art")
+        vibe_gen.get_vibe_message = Mock(return_value="vibe_message")
 
         art, message = generate_vibe(vibe_gen, "pattern")
 
@@ -44,9 +61,9 @@ class TestMainVibeFeatures:
 
     def test_generate_vibe_matrix_type(self):
         """Test generate_vibe with matrix type."""
-        vibe_gen = Mock()
-        vibe_gen.generate_cyber_matrix.return_value = "matrix_art"
-        vibe_gen.get_vibe_message.return_value = "vibe_message"
+        vibe_gen = VibeGenerator()
+        vibe_gen.generate_cyber_matrix = Mock(return_value="matrix_art")
+        vibe_gen.get_vibe_message = Mock(return_value="vibe_message")
 
         art, message = generate_vibe(vibe_gen, "matrix")
 
@@ -57,9 +74,9 @@ class TestMainVibeFeatures:
 
     def test_generate_vibe_word_type(self):
         """Test generate_vibe with word type."""
-        vibe_gen = Mock()
-        vibe_gen.generate_word_art.return_value = "word_art"
-        vibe_gen.get_vibe_message.return_value = "vibe_message"
+        vibe_gen = VibeGenerator()
+        vibe_gen.generate_word_art = Mock(return_value="word_art")
+        vibe_gen.get_vibe_message = Mock(return_value="vibe_message")
 
         art, message = generate_vibe(vibe_gen, "word")
 
@@ -68,6 +85,17 @@ class TestMainVibeFeatures:
         vibe_gen.generate_word_art.assert_called_once()
         vibe_gen.get_vibe_message.assert_called_once()
 
+    def test_generate_vibe_uses_generator_registry(self):
+        """Test that generate_vibe dispatches through the generator's own registry."""
+        registry = ART_REGISTRY.copy()
+        registry.register("glider", lambda vibe_gen: "GLIDER")
+        vibe_gen = VibeGenerator(registry=registry)
+
+        art, _ = generate_vibe(vibe_gen, "glider")
+
+        assert art == "GLIDER"
+        assert "glider" not in ART_REGISTRY
+
     def test_generate_vibe_random_type(self):
         """Test generate_vibe with random type."""
         vibe_gen = Mock()
@@ -81,7 +109,7 @@ class TestMainVibeFeatures:
 
     @patch("sys.argv", ["main.py", "--stats"])
     @patch("builtins.print")
-    @patch("main.config.setup_logging")
+    @patch("bsidespgh25.config.setup_logging")
     def test_main_stats_mode(self, mock_logging, mock_print):
         """Test main function in stats mode."""
         mock_logging.return_value = Mock(level="INFO")
@@ -93,22 +121,36 @@ class TestMainVibeFeatures:
         assert any("Vibe Generator Statistics" in str(call) for call in print_calls)
         assert any("Vibes Generated:" in str(call) for call in print_calls)
 
+    @patch("sys.argv", ["main.py", "--vibe", "--count", "3", "--stats"])
+    @patch("bsidespgh25.config.setup_logging")
+    def test_main_vibe_with_stats(self, mock_logging, capsys):
+        """Test that --stats with --vibe reports on stderr after generating."""
+        mock_logging.return_value = Mock(level="INFO")
+
+        main()
+
+        captured = capsys.readouterr()
+        assert captured.out.count(SEPARATOR) == 3
+        assert "Vibes Generated: 3" in captured.err
+        assert f"Bytes Emitted: {len(captured.out.encode())}" in captured.err
+
     @patch("sys.argv", ["main.py", "--vibe"])
-    @patch("builtins.print")
-    @patch("main.config.setup_logging")
-    def test_main_single_vibe_mode(self, mock_logging, mock_print):
+    @patch("bsidespgh25.config.setup_logging")
+    def test_main_single_vibe_mode(self, mock_logging, capsys):
         """Test main function in single vibe mode."""
         mock_logging.return_value = Mock(level="INFO")
 
         main()
 
-        # Check that a vibe was printed
-        assert mock_print.call_count > 0
+        # Check that a vibe was written
+        output = capsys.readouterr().out
+        assert any(message in output for message in VibeGenerator.VIBE_MESSAGES)
+        assert SEPARATOR not in output
 
     @patch("sys.argv", ["main.py", "--vibe", "--continuous"])
     @patch("time.sleep")
     @patch("builtins.print")
-    @patch("main.config.setup_logging")
+    @patch("bsidespgh25.config.setup_logging")
     def test_main_continuous_mode(self, mock_logging, mock_print, mock_sleep):
         """Test main function in continuous mode."""
         mock_logging.return_value = Mock(level="INFO")
@@ -123,9 +165,140 @@ class TestMainVibeFeatures:
         assert any("Starting continuous vibe mode" in str(call) for call in print_calls)
         assert any("Vibe session ended" in str(call) for call in print_calls)
 
+    @patch(
+        "sys.argv",
+        ["main.py", "--vibe", "--continuous", "--vibe-type", "matrix", "--animate"],
+    )
+    @patch("time.sleep")
+    @patch("builtins.print")
+    @patch("bsidespgh25.config.setup_logging")
+    def test_main_animated_matrix_mode(
+        self, mock_logging, mock_print, mock_sleep, capsys
+    ):
+        """Test main function in animated matrix mode."""
+        mock_logging.return_value = Mock(level="INFO")
+        mock_sleep.side_effect = [None, None, KeyboardInterrupt]
+
+        main()
+
+        # The first frame is drawn in full and later ticks only redraw cells
+        output = capsys.readouterr().out
+        assert "\x1b[2J" in output
+        assert output.endswith("\x1b[?25h")
+        print_calls = [str(call) for call in mock_print.call_args_list]
+        assert any("Vibe session ended" in str(call) for call in print_calls)
+        assert any("Total frames animated: 2" in str(call) for call in print_calls)
+
+    @patch("sys.argv", ["main.py", "--vibe", "--count", "5", "--vibe-type", "word"])
+    @patch("bsidespgh25.config.setup_logging")
+    def test_main_count_mode(self, mock_logging, capsys):
+        """Test main function writes the requested number of vibes."""
+        mock_logging.return_value = Mock(level="INFO")
+
+        main()
+
+        output = capsys.readouterr().out
+        assert output.count(SEPARATOR) == 5
+        assert output.count("┌") == 5
+
+    @patch(
+        "sys.argv",
+        ["main.py", "--vibe", "--continuous", "--count", "2", "--delay", "1"],
+    )
+    @patch("time.sleep")
+    @patch("builtins.print")
+    @patch("bsidespgh25.config.setup_logging")
+    def test_main_continuous_count_mode(self, mock_logging, mock_print, mock_sleep):
+        """Test that continuous mode stops after the requested count."""
+        mock_logging.return_value = Mock(level="INFO")
+
+        main()
+
+        # There's nothing to wait for after the last vibe
+        assert mock_sleep.call_count == 1
+        print_calls = [str(call) for call in mock_print.call_args_list]
+        assert any("Generated 2 vibes" in str(call) for call in print_calls)
+
+    @patch("bsidespgh25.config.setup_logging")
+    def test_main_seed_is_reproducible(self, mock_logging, capsys):
+        """Test that --seed replays the same vibes."""
+        mock_logging.return_value = Mock(level="INFO")
+        outputs = []
+        for _ in range(2):
+            with patch(
+                "sys.argv", ["main.py", "--vibe", "--count", "3", "--seed", "9"]
+            ):
+                main()
+            outputs.append(capsys.readouterr().out)
+
+        assert outputs[0] == outputs[1]
+
+    @patch("bsidespgh25.config.setup_logging")
+    def test_main_workers_mode(self, mock_logging, capsys):
+        """Test that --workers writes the requested number of vibes."""
+        mock_logging.return_value = Mock(level="INFO")
+        outputs = []
+        for workers in ["1", "2"]:
+            argv = ["main.py", "--vibe", "--count", "6", "--seed", "9"]
+            with patch("sys.argv", [*argv, "--workers", workers, "--chunk-size", "2"]):
+                main()
+            outputs.append(capsys.readouterr().out)
+
+        assert outputs[1].count(SEPARATOR) == 6
+        assert outputs[0].count(SEPARATOR) == 6
+
+    @patch("sys.argv", ["main.py", "--vibe", "--workers", "2"])
+    def test_main_workers_requires_count(self):
+        """Test that --workers without --count is rejected."""
+        with pytest.raises(SystemExit):
+            main()
+
+    @pytest.mark.parametrize("chunk_size", ["0", "-5"])
+    def test_main_invalid_chunk_size(self, chunk_size, capsys):
+        """Test that a non-positive --chunk-size is reported by the parser."""
+        argv = ["--vibe", "--count", "10", "--workers", "2"]
+
+        with pytest.raises(SystemExit):
+            main([*argv, "--chunk-size", chunk_size])
+        assert "--chunk-size must be positive" in capsys.readouterr().err
+
+    @patch("sys.argv", ["main.py", "--serve", "localhost"])
+    def test_main_serve_requires_port(self):
+        """Test that --serve without a port is rejected."""
+        with pytest.raises(SystemExit):
+            main()
+
+    @patch("sys.argv", ["main.py", "--serve", "127.0.0.1:0"])
+    @patch("asyncio.run")
+    @patch("builtins.print")
+    @patch("bsidespgh25.config.setup_logging")
+    def test_main_serve_mode(self, mock_logging, mock_print, mock_run):
+        """Test that --serve runs the server until interrupted."""
+        mock_logging.return_value = Mock(level="INFO")
+
+        def interrupt(coroutine):
+            coroutine.close()
+            raise KeyboardInterrupt
+
+        mock_run.side_effect = interrupt
+
+        main()
+
+        print_calls = [str(call) for call in mock_print.call_args_list]
+        assert any("Vibe server stopped" in str(call) for call in print_calls)
+
+    def test_write_vibes_flushes_writer(self):
+        """Test that write_vibes buffers every vibe and flushes once."""
+        writer = Mock(spec=VibeWriter)
+
+        write_vibes([("art", "message")] * 5, writer)
+
+        assert writer.write_vibe.call_count == 5
+        writer.flush.assert_called_once()
+
     @patch("sys.argv", ["main.py"])
     @patch("builtins.print")
-    @patch("main.config.setup_logging")
+    @patch("bsidespgh25.config.setup_logging")
     def test_main_help_mode(self, mock_logging, mock_print):
         """Test main function shows help when no args."""
         mock_logging.return_value = Mock(level="INFO")
@@ -159,3 +332,396 @@ class TestMainVibeFeatures:
 
         args = parser.parse_args(["--delay", "0.1"])
         assert args.delay == 0.1
+
+    def test_parse_fast_args(self):
+        """Test that one-shot invocations are parsed without argparse."""
+        assert parse_fast_args(["--vibe"]) == {
+            "vibe_type": "random",
+            "seed": None,
+            "count": None,
+            "catalog": None,
+            "content_pack": None,
+        }
+        assert parse_fast_args(
+            ["--vibe", "--vibe-type=word", "--count", "5", "--seed", "3"]
+        ) == {
+            "vibe_type": "word",
+            "seed": 3,
+            "count": 5,
+            "catalog": None,
+            "content_pack": None,
+        }
+
+    def test_parse_fast_args_falls_back(self):
+        """Test that anything unusual is left to the full parser."""
+        for argv in [
+            [],
+            ["--stats"],
+            ["--vibe", "--continuous"],
+            ["--vibe", "--vibe-type", "invalid"],
+            ["--vibe", "--count", "many"],
+            ["--vibe", "--seed"],
+        ]:
+            assert parse_fast_args(argv) is None
+
+    @patch("bsidespgh25.config.setup_logging")
+    def test_fast_path_matches_full_path(self, mock_logging, capsys):
+        """Test that the fast path writes what the full parser would."""
+        mock_logging.return_value = Mock(level="INFO")
+
+        main(["--vibe", "--count", "4", "--seed", "2"])
+        fast = capsys.readouterr().out
+        # --flush forces the full parser without changing the output
+        main(["--vibe", "--count", "4", "--seed", "2", "--flush", "size"])
+        full = capsys.readouterr().out
+
+        assert fast == full
+        mock_logging.assert_called_once()
+
+    @patch("bsidespgh25.config.setup_logging")
+    def test_main_catalog_mode(self, mock_logging, tmp_path, capsys):
+        """Test building a catalog and serving vibes from it."""
+        mock_logging.return_value = Mock(level="INFO")
+        path = str(tmp_path / "catalog.vibes")
+
+        main(["--build-catalog", path, "--count", "4"])
+        assert "Wrote 12 vibes" in capsys.readouterr().out
+
+        # Both the fast path and the full parser serve from the catalog
+        main(["--vibe", "--catalog", path, "--count", "3"])
+        assert capsys.readouterr().out.count(SEPARATOR) == 3
+        main(["--vibe", "--catalog", path, "--vibe-type", "word", "--stats"])
+        captured = capsys.readouterr()
+        assert SEPARATOR not in captured.out
+        assert "Word Vibes: 1" in captured.err
+
+    @patch("bsidespgh25.config.setup_logging")
+    def test_main_catalog_errors(self, mock_logging, tmp_path):
+        """Test that unusable catalogs are reported by the parser."""
+        mock_logging.return_value = Mock(level="INFO")
+
+        with pytest.raises(SystemExit):
+            main(["--vibe", "--catalog", str(tmp_path / "missing.vibes")])
+        with pytest.raises(SystemExit):
+            main(["--vibe", "--catalog", "catalog.vibes", "--continuous"])
+        with pytest.raises(SystemExit):
+            main(["--build-catalog", str(tmp_path / "negative.vibes"), "--count", "-1"])
+        assert not (tmp_path / "negative.vibes").exists()
+
+    @patch("bsidespgh25.config.setup_logging")
+    def test_main_plugins(self, mock_logging, mocker, capsys):
+        """Test that --plugins makes entry point art types available."""
+        mock_logging.return_value = Mock(level="INFO")
+        glider = mocker.Mock()
+        glider.name = "glider"
+        glider.load.return_value = lambda vibe_gen: "GLIDER"
+        mocker.patch("importlib.metadata.entry_points", return_value=[glider])
+        mocker.patch("main.ART_REGISTRY", ART_REGISTRY.copy())
+
+        main(["--vibe", "--plugins", "--vibe-type", "glider"])
+
+        assert capsys.readouterr().out.startswith("GLIDER\n\n")
+
+    @patch("bsidespgh25.config.setup_logging")
+    def test_main_weights(self, mock_logging, tmp_path, capsys):
+        """Test that --weights and --no-repeat steer the selection."""
+        mock_logging.return_value = Mock(level="INFO")
+        path = tmp_path / "weights.json"
+        path.write_text('{"art_types": {"pattern": 0, "matrix": 0}, "no_repeat": 3}')
+
+        main(["--vibe", "--count", "4", "--weights", str(path), "--stats"])
+
+        captured = capsys.readouterr()
+        assert "Word Vibes: 4" in captured.err
+        words = [line for line in captured.out.splitlines() if "│  " in line]
+        assert len(set(words)) == 4
+
+    @patch("bsidespgh25.config.setup_logging")
+    def test_main_invalid_weights(self, mock_logging, tmp_path):
+        """Test that invalid weights are reported by the parser."""
+        mock_logging.return_value = Mock(level="INFO")
+        path = tmp_path / "weights.json"
+        path.write_text('{"art_types": {"glider": 1}}')
+
+        with pytest.raises(SystemExit):
+            main(["--vibe", "--weights", str(path)])
+
+    @patch("bsidespgh25.config.setup_logging")
+    def test_main_content_pack(self, mock_logging, tmp_path, monkeypatch, capsys):
+        """Test generating vibes from a content pack."""
+        mock_logging.return_value = Mock(level="INFO")
+        monkeypatch.setenv("BSIDESPGH25_CACHE_DIR", str(tmp_path / "cache"))
+        path = tmp_path / "pack.json"
+        path.write_text('{"words": ["BSIDES"], "messages": ["Pack vibes"]}')
+
+        # Both the fast path and the full parser use the pack
+        main(["--vibe", "--vibe-type", "word", "--content-pack", str(path)])
+        assert "│  BSIDES  │" in capsys.readouterr().out
+        main(["--vibe", "--content-pack", str(path), "--count", "3", "--stats"])
+        captured = capsys.readouterr()
+        assert captured.out.count("Pack vibes") == 3
+        assert "Cyber Words Available: 1" in captured.err
+
+    @patch("bsidespgh25.config.setup_logging")
+    def test_main_content_pack_errors(self, mock_logging, tmp_path, monkeypatch):
+        """Test that invalid content packs are reported by the parser."""
+        mock_logging.return_value = Mock(level="INFO")
+        monkeypatch.setenv("BSIDESPGH25_CACHE_DIR", str(tmp_path / "cache"))
+        path = tmp_path / "pack.json"
+        path.write_text('{"words": []}')
+
+        for argv in [
+            ["--vibe", "--content-pack", str(path)],
+            ["--vibe", "--content-pack", str(tmp_path / "missing.json")],
+            ["--vibe", "--content-pack", str(path), "--catalog", "catalog.vibes"],
+        ]:
+            with pytest.raises(SystemExit):
+                main(argv)
+
+    @patch("time.sleep")
+    @patch("bsidespgh25.config.setup_logging")
+    def test_main_continuous_reloads_content(
+        self, mock_logging, mock_sleep, tmp_path, monkeypatch, mocker, capsys
+    ):
+        """Test that continuous mode switches to an edited content pack."""
+        mock_logging.return_value = Mock(level="INFO")
+        monkeypatch.setenv("BSIDESPGH25_CACHE_DIR", str(tmp_path / "cache"))
+        path = tmp_path / "pack.json"
+        path.write_text('{"messages": ["Morning vibes"]}')
+        watchers = []
+
+        def start_watcher(*args, **kwargs):
+            watchers.append(watch_content(*args, **kwargs))
+            return watchers[-1]
+
+        def edit_pack(delay):
+            if mock_sleep.call_count == 1:
+                path.write_text('{"messages": ["Afternoon vibes"]}')
+                # Stands in for the watcher thread noticing the edit
+                watchers[0].check()
+
+        mocker.patch("bsidespgh25.watcher.watch_content", side_effect=start_watcher)
+        mock_sleep.side_effect = edit_pack
+        main(["--vibe", "--continuous", "--count", "3", "--content-pack", str(path)])
+
+        # The second vibe was generated before the edit, so only the third changes
+        output = capsys.readouterr().out
+        assert output.index("Morning vibes") < output.index("Afternoon vibes")
+        assert not watchers[0]._thread.is_alive()
+
+    @patch("time.sleep")
+    @patch("bsidespgh25.config.setup_logging")
+    def test_main_fps(self, mock_logging, mock_sleep, capsys):
+        """Test that --fps paces continuous mode and pacing is reported with --stats."""
+        mock_logging.return_value = Mock(level="INFO")
+
+        main(["--vibe", "--continuous", "--count", "3", "--fps", "4", "--stats"])
+
+        assert mock_sleep.call_count == 2
+        assert 0 < mock_sleep.call_args_list[0].args[0] <= 0.25
+        captured = capsys.readouterr()
+        assert "Frames Scheduled: 2" in captured.err
+        assert "Missed Deadlines: " in captured.err
+        assert "Jitter P99 Ms: " in captured.err
+
+    @patch("bsidespgh25.config.setup_logging")
+    def test_main_invalid_fps(self, mock_logging):
+        """Test that invalid frame rates are reported by the parser."""
+        mock_logging.return_value = Mock(level="INFO")
+
+        for argv in [
+            ["--vibe", "--continuous", "--fps", "0"],
+            ["--vibe", "--continuous", "--fps", "5", "--delay", "1"],
+        ]:
+            with pytest.raises(SystemExit):
+                main(argv)
+
+    @patch("time.sleep")
+    @patch("bsidespgh25.config.setup_logging")
+    def test_main_continuous_summary(self, mock_logging, mock_sleep, capsys):
+        """Test that the exit summary reports the queue and pacing metrics."""
+        mock_logging.return_value = Mock(level="INFO")
+        mock_sleep.side_effect = [None, KeyboardInterrupt]
+
+        main(
+            [
+                "--vibe",
+                "--continuous",
+                "--queue-depth",
+                "4",
+                "--drop-policy",
+                "drop-oldest",
+            ]
+        )
+
+        output = capsys.readouterr().out
+        assert "Total vibes generated: 2" in output
+        assert "Missed deadlines: 0" in output
+        # How far the writer fell behind depends on the threads' timing
+        assert re.search(r"Queue occupancy: mean [\d.]+, peak [12]/4", output)
+        assert "Dropped frames: 0" in output
+
+    @patch("bsidespgh25.config.setup_logging")
+    def test_main_invalid_queue_depth(self, mock_logging):
+        """Test that invalid queue depths are reported by the parser."""
+        mock_logging.return_value = Mock(level="INFO")
+
+        with pytest.raises(SystemExit):
+            main(["--vibe", "--continuous", "--queue-depth", "0"])
+
+    @pytest.mark.parametrize("rate", ["-0.1", "1.5"])
+    def test_main_invalid_mutation_rate(self, rate, capsys):
+        """Test that mutation rates outside [0, 1] are reported by the parser."""
+        argv = ["--vibe", "--continuous", "--animate", "--vibe-type", "matrix"]
+
+        with pytest.raises(SystemExit):
+            main([*argv, "--mutation-rate", rate])
+        assert "--mutation-rate must be between 0 and 1" in capsys.readouterr().err
+
+    @patch("bsidespgh25.config.setup_logging")
+    def test_main_matrix_size(self, mock_logging, monkeypatch, capsys):
+        """Test sizing matrix vibes explicitly and to the terminal."""
+        mock_logging.return_value = Mock(level="INFO")
+        monkeypatch.setenv("COLUMNS", "30")
+        monkeypatch.setenv("LINES", "12")
+
+        def matrix_lines(argv):
+            main(["--vibe", "--vibe-type", "matrix", *argv])
+            lines = capsys.readouterr().out.split("\n")
+            return [
+                line
+                for line in lines
+                if line and set(line) <= set(VibeGenerator.MATRIX_CHARS)
+            ]
+
+        assert [
+            len(line) for line in matrix_lines(["--width", "6", "--height", "2"])
+        ] == [6] * 2
+        assert [len(line) for line in matrix_lines(["--fit-terminal"])] == [30] * 8
+        assert [
+            len(line) for line in matrix_lines(["--fit-terminal", "--height", "3"])
+        ] == [30] * 3
+
+        for argv in [["--width", "0"], ["--height", "-2"]]:
+            with pytest.raises(SystemExit):
+                main(["--vibe", *argv])
+
+    @pytest.mark.skipif(not hasattr(signal, "SIGWINCH"), reason="needs SIGWINCH")
+    def test_follow_terminal_size(self, monkeypatch):
+        """Test that matrices follow the terminal when it is resized."""
+        monkeypatch.setenv("COLUMNS", "30")
+        monkeypatch.setenv("LINES", "12")
+        args = create_parser().parse_args(["--vibe", "--fit-terminal"])
+        vibe_gen = VibeGenerator(seed=1)
+
+        previous = follow_terminal_size(args, vibe_gen)
+        try:
+            monkeypatch.setenv("COLUMNS", "50")
+            signal.raise_signal(signal.SIGWINCH)
+            assert vibe_gen.matrix_size == (50, 8)
+        finally:
+            signal.signal(signal.SIGWINCH, previous)
+
+        args = create_parser().parse_args(["--vibe"])
+        assert follow_terminal_size(args, vibe_gen) is None
+
+    @patch("bsidespgh25.config.setup_logging")
+    def test_main_color(self, mock_logging, monkeypatch, capsys):
+        """Test coloring art and turning color off."""
+        mock_logging.return_value = Mock(level="INFO")
+        monkeypatch.delenv("NO_COLOR", raising=False)
+
+        main(
+            [
+                "--vibe",
+                "--vibe-type",
+                "matrix",
+                "--count",
+                "2",
+                "--color",
+                "256",
+                "--stats",
+            ]
+        )
+        captured = capsys.readouterr()
+        assert captured.out.count("\x1b[0m") == 2
+        assert "\x1b[38;5;" in captured.out
+        assert re.search(r"Color Bytes: [1-9]", captured.err)
+        assert "Bytes Per Vibe: " in captured.err
+
+        main(["--vibe", "--color", "--no-color"])
+        assert "\x1b[" not in capsys.readouterr().out
+
+        monkeypatch.setenv("NO_COLOR", "1")
+        main(["--vibe", "--color"])
+        assert "\x1b[" not in capsys.readouterr().out
+
+        with pytest.raises(SystemExit):
+            main(["--vibe", "--color", "--serve", "127.0.0.1:0"])
+
+    @patch("bsidespgh25.config.setup_logging")
+    def test_main_output_records(self, mock_logging, capsysbinary):
+        """Test writing vibes and stats as JSON lines and binary records."""
+        mock_logging.return_value = Mock(level="INFO")
+
+        main(["--vibe", "--count", "3", "--output", "jsonl", "--stats"])
+        output = capsysbinary.readouterr().out
+        records = [json.loads(line) for line in output.splitlines()]
+        assert [record["record"] for record in records] == ["vibe"] * 3 + ["stats"]
+        assert [record["seq"] for record in records[:3]] == [0, 1, 2]
+        assert records[3]["stats"]["vibes_generated"] == 3
+
+        main(["--stats", "--output", "jsonl"])
+        assert json.loads(capsysbinary.readouterr().out)["record"] == "stats"
+
+        main(["--vibe", "--vibe-type", "word", "--output", "binary"])
+        (record,) = iter_binary_records(capsysbinary.readouterr().out)
+        assert record["type"] == "word"
+
+        with pytest.raises(SystemExit):
+            main(["--vibe", "--output", "jsonl", "--workers", "2", "--count", "4"])
+
+    @patch("bsidespgh25.config.setup_logging")
+    def test_main_binary_records_need_binary_stdout(self, mock_logging, monkeypatch):
+        """Test that binary records are refused on a text-only stdout."""
+        mock_logging.return_value = Mock(level="INFO")
+        monkeypatch.setattr(sys, "stdout", io.StringIO())
+
+        with pytest.raises(SystemExit):
+            main(["--vibe", "--output", "binary"])
+        with pytest.raises(SystemExit):
+            main(["--stats", "--output", "binary"])
+
+    @patch("bsidespgh25.config.setup_logging")
+    @patch("time.sleep")
+    def test_main_continuous_records(self, mock_sleep, mock_logging, capsys):
+        """Test that continuous records keep progress messages out of stdout."""
+        mock_logging.return_value = Mock(level="INFO")
+
+        main(
+            [
+                "--vibe",
+                "--continuous",
+                "--count",
+                "2",
+                "--delay",
+                "0.01",
+                "--output",
+                "jsonl",
+            ]
+        )
+        captured = capsys.readouterr()
+        assert [json.loads(line)["seq"] for line in captured.out.splitlines()] == [0, 1]
+        assert "Starting continuous vibe mode" in captured.err
+
+    @patch("bsidespgh25.config.setup_logging")
+    def test_main_banner(self, mock_logging, capsys):
+        """Test banner vibes with custom text."""
+        mock_logging.return_value = Mock(level="INFO")
+
+        main(["--vibe", "--vibe-type", "banner", "--banner-text", "hi"])
+        output = capsys.readouterr().out
+        assert "    █   █ ███\n    █   █  █\n    █████  █\n" in output
+
+        with pytest.raises(SystemExit):
+            main(["--vibe", "--catalog", "vibes.catalog", "--banner-text", "hi"])
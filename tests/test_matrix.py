@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Test bsidespgh25/matrix.py
+"""
+
+import random
+import time
+from collections import Counter
+
+import pytest
+
+from bsidespgh25.matrix import MatrixBuffer, fit_matrix, terminal_size
+
+GLYPHS = "01╬═║╔╗╚╝░▓█"
+
+
+@pytest.mark.unit
+def test_render_shape():
+    """Test that frames have the buffer's size and only its glyphs"""
+    buffer = MatrixBuffer(7, 3, GLYPHS)
+    frame = buffer.render(random.Random(1))
+
+    lines = frame.split("\n")
+    assert len(lines) == 3
+    assert all(len(line) == 7 for line in lines)
+    assert set(frame) <= set(GLYPHS) | {"\n"}
+    assert buffer.render(random.Random(1)) == frame
+
+
+@pytest.mark.unit
+def test_render_frame():
+    """Test that frames hold the same cells the text would"""
+    buffer = MatrixBuffer(7, 3, GLYPHS)
+    frame = buffer.render_frame(random.Random(1))
+
+    assert (frame.width, frame.height) == (7, 3)
+    assert str(frame) == MatrixBuffer(7, 3, GLYPHS).render(random.Random(1))
+    # Later frames don't overwrite earlier ones
+    buffer.render_frame(random.Random(2))
+    assert str(frame) == MatrixBuffer(7, 3, GLYPHS).render(random.Random(1))
+
+
+@pytest.mark.unit
+def test_render_bytes():
+    """Test that frames render straight to UTF-8"""
+    buffer = MatrixBuffer(7, 3, GLYPHS)
+
+    expected = buffer.render(random.Random(1)).encode()
+    assert buffer.render_bytes(random.Random(1)) == expected
+    ascii_buffer = MatrixBuffer(5, 2, "01")
+    expected = ascii_buffer.render(random.Random(1)).encode()
+    assert ascii_buffer.render_bytes(random.Random(1)) == expected
+
+
+@pytest.mark.unit
+def test_resize():
+    """Test that the buffer is only reallocated for a new size"""
+    buffer = MatrixBuffer(4, 2, GLYPHS)
+    allocated = buffer._buffer
+
+    buffer.resize(4, 2)
+    assert buffer._buffer is allocated
+
+    buffer.resize(6, 5)
+    assert buffer._buffer is not allocated
+    lines = buffer.render(random.Random()).split("\n")
+    assert [len(line) for line in lines] == [6] * 5
+
+    with pytest.raises(ValueError):
+        buffer.resize(-1, 5)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("width", "height", "expected"), [(0, 3, "\n\n"), (5, 0, ""), (0, 0, "")]
+)
+def test_empty(width, height, expected):
+    """Test frames without any cells"""
+    assert MatrixBuffer(width, height, GLYPHS).render(random.Random()) == expected
+
+
+@pytest.mark.unit
+def test_distribution():
+    """Test that glyphs are drawn evenly"""
+    frame = MatrixBuffer(300, 80, GLYPHS).render(random.Random(7))
+    counts = Counter(frame.replace("\n", ""))
+
+    assert set(counts) == set(GLYPHS)
+    expected = 300 * 80 / len(GLYPHS)
+    assert all(abs(count - expected) < expected * 0.1 for count in counts.values())
+
+
+@pytest.mark.unit
+def test_invalid_glyphs():
+    """Test that unusable glyph sets are rejected"""
+    with pytest.raises(ValueError):
+        MatrixBuffer(4, 2, "")
+    with pytest.raises(ValueError):
+        MatrixBuffer(4, 2, "x" * 256)
+
+
+@pytest.mark.unit
+def test_full_screen_budget():
+    """Test that full-screen frames render well within a 60 fps frame"""
+    buffer = MatrixBuffer(300, 80, GLYPHS)
+    rng = random.Random()
+    buffer.render(rng)
+
+    start = time.perf_counter()
+    for _ in range(10):
+        buffer.render(rng)
+    assert (time.perf_counter() - start) / 10 < 0.008
+
+
+@pytest.mark.unit
+def test_fit_matrix(monkeypatch):
+    """Test sizing matrices to the terminal"""
+    monkeypatch.setenv("COLUMNS", "120")
+    monkeypatch.setenv("LINES", "40")
+
+    assert terminal_size() == (120, 40)
+    assert fit_matrix(120, 40) == (120, 36)
+    assert fit_matrix(120, 40, reserved_lines=0) == (120, 40)
+    assert fit_matrix(0, 2) == (1, 1)
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Test bsidespgh25/output.py
+"""
+
+import io
+from unittest.mock import Mock
+
+import pytest
+
+from bsidespgh25.output import (
+    SEPARATOR,
+    VibeWriter,
+    format_encoded_vibe,
+    format_vibe,
+)
+
+
+class BinaryStream(io.TextIOWrapper):
+    """A non-TTY text stream over a byte buffer that records binary writes."""
+
+    def __init__(self):
+        super().__init__(io.BytesIO(), encoding="utf-8")
+        self.binary_writes = 0
+        write = self.buffer.write
+
+        def counting_write(data):
+            self.binary_writes += 1
+            return write(data)
+
+        self.buffer.write = counting_write  # type: ignore[method-assign]
+
+    def value(self) -> str:
+        self.flush()
+        return self.buffer.getvalue().decode("utf-8")  # type: ignore[attr-defined]
+
+
+@pytest.mark.unit
+def test_format_vibe():
+    """Test format_vibe() with and without a separator"""
+    assert format_vibe("art", "msg") == f"art\n\nmsg\n\n{SEPARATOR}\n"
+    assert format_vibe("art", "msg", separator=False) == "art\n\nmsg\n\n"
+
+
+@pytest.mark.unit
+def test_format_encoded_vibe():
+    """Test that pre-encoded vibes format to the same bytes as text ones"""
+    art, message = "╔═╗", "✨ vibes ✨"
+    for separator in (True, False):
+        assert (
+            format_encoded_vibe(art.encode(), message.encode(), separator)
+            == format_vibe(art, message, separator).encode()
+        )
+
+
+@pytest.mark.unit
+def test_auto_policy_detects_tty():
+    """Test that the auto policy picks frame for a TTY and size otherwise"""
+    tty = Mock()
+    tty.isatty.return_value = True
+
+    assert VibeWriter(tty).flush_policy == "frame"
+    assert VibeWriter(io.StringIO()).flush_policy == "size"
+
+
+@pytest.mark.unit
+def test_frame_policy_writes_every_vibe():
+    """Test that the frame policy writes each vibe with a single binary write"""
+    stream = BinaryStream()
+    writer = VibeWriter(stream, flush_policy="frame")
+
+    for _ in range(3):
+        writer.write_vibe("╔═╗", "✨ vibes ✨")
+
+    assert stream.binary_writes == 3
+    assert stream.value() == format_vibe("╔═╗", "✨ vibes ✨") * 3
+    assert writer.bytes_written == len(stream.value().encode("utf-8"))
+
+
+@pytest.mark.unit
+def test_batch_policy_writes_per_batch():
+    """Test that the batch policy writes once per batch_size vibes"""
+    stream = BinaryStream()
+    with VibeWriter(stream, flush_policy="batch", batch_size=4) as writer:
+        for _ in range(10):
+            writer.write_vibe("art", "msg")
+        assert stream.binary_writes == 2
+
+    # The remainder is written when the writer is closed
+    assert stream.binary_writes == 3
+    assert writer.vibes_written == 10
+
+
+@pytest.mark.unit
+def test_size_policy_writes_at_threshold():
+    """Test that the size policy writes once enough bytes are buffered"""
+    stream = BinaryStream()
+    writer = VibeWriter(stream, flush_policy="size", size_threshold=1000)
+
+    writer.write_vibe("a" * 400, "msg")
+    assert stream.binary_writes == 0
+    writer.write_vibe("a" * 700, "msg")
+    assert stream.binary_writes == 1
+
+
+@pytest.mark.unit
+def test_printed_text_stays_in_order():
+    """Test that text printed before a flush is written before the vibes"""
+    stream = BinaryStream()
+    writer = VibeWriter(stream, flush_policy="size")
+
+    stream.write("header\n")
+    writer.write_vibe("art", "msg")
+    writer.flush()
+
+    assert stream.value().startswith("header\nart")
+
+
+@pytest.mark.unit
+def test_write_encoded_vibe():
+    """Test buffering pre-encoded vibes, including to non-UTF-8 streams"""
+    stream = BinaryStream()
+    with VibeWriter(stream, flush_policy="batch", batch_size=2) as writer:
+        writer.write_encoded_vibe("╔═╗".encode(), "✨ vibes ✨".encode())
+        assert stream.binary_writes == 0
+        writer.write_encoded_vibe(b"art", b"msg", separator=False)
+        assert stream.binary_writes == 1
+
+    assert writer.vibes_written == 2
+    assert stream.value() == format_vibe("╔═╗", "✨ vibes ✨") + "art\n\nmsg\n\n"
+
+    latin = io.TextIOWrapper(io.BytesIO(), encoding="latin-1")
+    with VibeWriter(latin) as writer:
+        writer.write_encoded_vibe("é".encode(), b"msg", separator=False)
+    latin.flush()
+    assert latin.buffer.getvalue() == "é\n\nmsg\n\n".encode("latin-1")  # type: ignore[attr-defined]
+
+
+@pytest.mark.unit
+def test_write_record():
+    """Test that records are written as they are, whatever the stream's encoding"""
+    stream = io.TextIOWrapper(io.BytesIO(), encoding="ascii")
+    with VibeWriter(stream, flush_policy="batch", batch_size=2) as writer:
+        writer.write_record(b"\x01\xff")
+        writer.write_record("✨\n".encode())
+
+    assert stream.buffer.getvalue() == b"\x01\xff" + "✨\n".encode()  # type: ignore[attr-defined]
+    assert writer.vibes_written == 0
+
+
+@pytest.mark.unit
+def test_text_only_stream():
+    """Test writing to a stream without a binary layer"""
+    stream = io.StringIO()
+    with VibeWriter(stream) as writer:
+        writer.write("\x1b[1;1H╬")
+
+    assert stream.getvalue() == "\x1b[1;1H╬"
+
+
+@pytest.mark.unit
+def test_binary_needs_binary_layer():
+    """Test that binary output is refused on a stream without a binary layer"""
+    with pytest.raises(ValueError):
+        VibeWriter(io.StringIO(), binary=True)
+
+    stream = BinaryStream()
+    with VibeWriter(stream, binary=True) as writer:
+        writer.write_record(b"\x01\xff")
+    assert stream.buffer.getvalue() == b"\x01\xff"  # type: ignore[attr-defined]
+
+
+@pytest.mark.unit
+def test_invalid_flush_policy():
+    """Test that an unknown flush policy is rejected"""
+    with pytest.raises(ValueError):
+        VibeWriter(io.StringIO(), flush_policy="never")
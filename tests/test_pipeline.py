@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Test bsidespgh25/pipeline.py
+"""
+
+import threading
+import time
+from itertools import count
+
+import pytest
+
+from bsidespgh25.pipeline import FramePipeline, FrameQueue
+from bsidespgh25.scheduler import FrameScheduler
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("drop_policy", "expected"),
+    [("drop-oldest", [2, 3]), ("drop-newest", [1, 2])],
+)
+def test_queue_drop_policies(drop_policy, expected):
+    """Test what full queues drop"""
+    queue = FrameQueue(depth=2, drop_policy=drop_policy)
+
+    for frame in (1, 2, 3):
+        queue.put(frame)
+    queue.close()
+
+    assert [queue.get(), queue.get(), queue.get()] == [*expected, None]
+    assert queue.get_stats() == {
+        "queue_depth": 2,
+        "queue_peak": 2,
+        "queue_mean_occupancy": 1.0,
+        "frames_dropped": 1,
+    }
+
+
+@pytest.mark.unit
+def test_queue_blocks_until_room():
+    """Test that the block policy waits for the writer"""
+    queue = FrameQueue(depth=1)
+    queue.put(1)
+    queued = []
+    producer = threading.Thread(target=lambda: queued.append(queue.put(2)))
+    producer.start()
+
+    producer.join(0.05)
+    assert producer.is_alive()
+    assert queue.get() == 1
+    producer.join(5)
+    assert queued == [True]
+    assert queue.get() == 2
+
+    # Closing wakes a blocked producer without queueing its frame
+    queue.put(3)
+    producer = threading.Thread(target=lambda: queued.append(queue.put(4)))
+    producer.start()
+    queue.close(discard=True)
+    producer.join(5)
+    assert queued == [True, False]
+    assert queue.get() is None
+
+
+@pytest.mark.unit
+def test_queue_invalid():
+    """Test that invalid queue settings are rejected"""
+    with pytest.raises(ValueError):
+        FrameQueue(depth=0)
+    with pytest.raises(ValueError):
+        FrameQueue(drop_policy="drop-everything")
+
+
+@pytest.mark.unit
+def test_pipeline_writes_in_order():
+    """Test that every rendered frame is written, in order"""
+    frames = count()
+    written = []
+    pipeline = FramePipeline(
+        lambda: next(frames), written.append, FrameScheduler(0), count=20, depth=4
+    )
+
+    pipeline.run()
+
+    assert written == list(range(20))
+    stats = pipeline.get_stats()
+    assert stats["frames_produced"] == 20
+    assert stats["frames_written"] == 20
+    assert stats["frames_dropped"] == 0
+
+
+@pytest.mark.unit
+def test_pipeline_slow_writer():
+    """Test that a stalled writer doesn't hold up generation"""
+    frames = count()
+    written = []
+    pipeline = None
+
+    def write(frame):
+        # Stall until every frame has been rendered
+        deadline = time.monotonic() + 5
+        while pipeline.produced < 10 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        written.append(frame)
+
+    pipeline = FramePipeline(
+        lambda: next(frames),
+        write,
+        FrameScheduler(0),
+        count=10,
+        depth=2,
+        drop_policy="drop-oldest",
+    )
+    pipeline.run()
+
+    stats = pipeline.get_stats()
+    assert stats["frames_produced"] == 10
+    assert stats["frames_dropped"] > 0
+    assert len(written) + stats["frames_dropped"] == 10
+    assert written[-1] == 9
+
+
+@pytest.mark.unit
+def test_pipeline_render_error():
+    """Test that errors on the generator thread are raised by run()"""
+    frames = iter([b"first"])
+    written = []
+    pipeline = FramePipeline(
+        lambda: next(frames), written.append, FrameScheduler(0), count=5
+    )
+
+    with pytest.raises(StopIteration):
+        pipeline.run()
+    assert written == [b"first"]
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Test bsidespgh25/records.py
+"""
+
+import json
+import struct
+
+import pytest
+
+from bsidespgh25.records import RecordEncoder, iter_binary_records
+
+VIBES = [
+    ("word", '\n    ┌──┐\n    │ "x" │\n    └──┘\n', "✨ Vibing with security! ✨"),
+    ("matrix", "01╬\n═║\\", "⚡ Electric security vibes ⚡"),
+]
+STATS = {"vibes_generated": 2, "bytes_per_vibe": 12.5}
+
+
+@pytest.mark.unit
+def test_jsonl():
+    """Test that JSON lines records are valid JSON, one per line"""
+    encoder = RecordEncoder("jsonl")
+    data = b"".join(encoder.encode_vibe(*vibe, timestamp=1.5) for vibe in VIBES)
+    data += encoder.encode_stats(STATS, timestamp=2.5)
+
+    lines = data.decode("utf-8").splitlines()
+    assert len(lines) == 3
+    records = [json.loads(line) for line in lines]
+    assert records[1] == {
+        "record": "vibe",
+        "seq": 1,
+        "type": "matrix",
+        "art": "01╬\n═║\\",
+        "message": "⚡ Electric security vibes ⚡",
+        "timestamp": 1.5,
+    }
+    assert records[0]["art"] == VIBES[0][1]
+    assert records[2] == {"record": "stats", "timestamp": 2.5, "stats": STATS}
+
+
+@pytest.mark.unit
+def test_binary():
+    """Test that binary records decode to the same records as JSON lines"""
+    records = []
+    for record_format in ("jsonl", "binary"):
+        encoder = RecordEncoder(record_format)
+        data = b"".join(encoder.encode_vibe(*vibe, timestamp=1.5) for vibe in VIBES)
+        data += encoder.encode_stats(STATS, timestamp=2.5)
+        if record_format == "jsonl":
+            records.append([json.loads(line) for line in data.splitlines()])
+        else:
+            records.append(list(iter_binary_records(data)))
+
+    assert records[0] == records[1]
+    assert isinstance(records[1][2]["stats"]["vibes_generated"], int)
+
+    with pytest.raises(ValueError):
+        list(iter_binary_records(data[:-1]))
+
+
+@pytest.mark.unit
+def test_invalid():
+    """Test that unknown formats and non-numeric statistics are rejected"""
+    with pytest.raises(ValueError):
+        RecordEncoder("xml")
+    with pytest.raises(TypeError):
+        RecordEncoder("binary").encode_stats({"name": "vibes"})
+    with pytest.raises(ValueError):
+        list(iter_binary_records(b"\x09\x00\x00\x00\x00"))
+    # Frames too short for the vibe or stats headers, or a stat entry
+    for kind in (1, 2):
+        with pytest.raises(ValueError):
+            list(iter_binary_records(struct.pack("<BI", kind, 3) + b"abc"))
+    stats = RecordEncoder("binary").encode_stats({"vibes": 1})
+    truncated = struct.pack("<BI", 2, len(stats) - 7) + stats[5:-2]
+    with pytest.raises(ValueError):
+        list(iter_binary_records(truncated))
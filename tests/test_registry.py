@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Test bsidespgh25/registry.py
+"""
+
+import pickle
+import random
+from collections import Counter
+
+import pytest
+
+from bsidespgh25.registry import ART_REGISTRY, ArtRegistry, default_registry
+from bsidespgh25.vibe_generator import VibeGenerator
+
+
+def render_glider(vibe_gen: VibeGenerator) -> str:
+    """A test art source"""
+    return ".#.\n..#\n###"
+
+
+@pytest.mark.unit
+def test_default_registry():
+    """Test that the built-in art sources are registered"""
+    assert ART_REGISTRY.names == (*VibeGenerator.ART_TYPES, "banner")
+    assert all(ART_REGISTRY.is_builtin(name) for name in ART_REGISTRY.names)
+    # Banners are only drawn when asked for
+    assert ART_REGISTRY.weight("banner") == 0
+
+
+@pytest.mark.unit
+def test_register_invalid():
+    """Test that duplicate, reserved and negatively weighted sources are rejected"""
+    registry = default_registry()
+
+    for name, weight in [("pattern", 1.0), ("random", 1.0), ("glider", -1.0)]:
+        with pytest.raises(ValueError):
+            registry.register(name, render_glider, weight)
+
+
+@pytest.mark.unit
+def test_choose_follows_weights():
+    """Test that random selection follows the weights"""
+    registry = default_registry()
+    registry.set_weight("pattern", 0)
+    registry.set_weight("word", 3)
+    rng = random.Random(1)
+
+    counts = Counter(registry.choose(rng) for _ in range(4000))
+    counts.update(registry.choose_many(rng, 4000))
+
+    assert counts["pattern"] == 0
+    assert 2.5 < counts["word"] / counts["matrix"] < 3.5
+
+
+@pytest.mark.unit
+def test_choose_without_weights():
+    """Test that choosing from a registry without positive weights fails"""
+    registry = ArtRegistry()
+    with pytest.raises(ValueError):
+        registry.choose(random.Random())
+
+    registry.register("glider", render_glider, weight=0)
+    with pytest.raises(ValueError):
+        registry.choose_many(random.Random(), 1)
+
+
+@pytest.mark.unit
+def test_copy_is_independent():
+    """Test that a copied registry can be changed on its own"""
+    registry = ART_REGISTRY.copy()
+    registry.unregister("word")
+
+    assert "word" not in registry
+    assert "word" in ART_REGISTRY
+
+
+@pytest.mark.unit
+def test_custom_source():
+    """Test that generators draw from and count custom art sources"""
+    registry = default_registry()
+    registry.register("glider", render_glider, weight=1000)
+    vibe_gen = VibeGenerator(seed=1, registry=registry)
+
+    assert vibe_gen.generate_art("glider") == render_glider(vibe_gen)
+    vibes = list(vibe_gen.iter_vibes(10, vibe_type="glider"))
+    assert {art for art, _ in vibes} == {render_glider(vibe_gen)}
+
+    stats = vibe_gen.get_stats()
+    assert stats["glider_vibes"] == 11
+    assert stats["vibes_generated"] == 11
+
+    # Copies made for worker processes keep the custom source
+    assert "glider" in pickle.loads(pickle.dumps(registry))
+
+
+@pytest.mark.unit
+def test_generate_art_unknown_type():
+    """Test that unknown art types are rejected"""
+    with pytest.raises(ValueError):
+        VibeGenerator().generate_art("glider")
+
+
+@pytest.mark.unit
+def test_load_entry_points(mocker):
+    """Test loading art sources from entry points"""
+    glider = mocker.Mock()
+    glider.name = "glider"
+    glider.load.return_value = render_glider
+    broken = mocker.Mock()
+    broken.name = "broken"
+    broken.load.side_effect = ImportError("missing")
+    duplicate = mocker.Mock()
+    duplicate.name = "word"
+    entry_points = mocker.patch(
+        "importlib.metadata.entry_points", return_value=[glider, broken, duplicate]
+    )
+    registry = default_registry()
+
+    assert registry.load_entry_points() == ["glider"]
+    entry_points.assert_called_once_with(group="bsidespgh25.art")
+    assert "broken" not in registry
+    duplicate.load.assert_not_called()
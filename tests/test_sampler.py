@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Test bsidespgh25/sampler.py
+"""
+
+import random
+from collections import Counter
+
+import pytest
+
+from bsidespgh25.sampler import Sampler
+
+
+@pytest.mark.unit
+def test_draw_follows_weights():
+    """Test that draws follow the weights"""
+    sampler = Sampler("abcd", [1, 2, 0, 5])
+    rng = random.Random(1)
+
+    counts = Counter(sampler.draw(rng) for _ in range(8000))
+    counts.update(sampler.draw_many(rng, 8000))
+
+    assert counts["c"] == 0
+    for item, weight in [("a", 1), ("b", 2), ("d", 5)]:
+        assert counts[item] / 16000 == pytest.approx(weight / 8, abs=0.02)
+
+
+@pytest.mark.unit
+def test_no_repeat_window():
+    """Test that items don't repeat within the window, even across batches"""
+    sampler = Sampler("abcde", no_repeat=2)
+    rng = random.Random(2)
+
+    drawn = [sampler.draw(rng) for _ in range(100)] + sampler.draw_many(rng, 100)
+
+    for start in range(len(drawn) - 2):
+        assert len(set(drawn[start : start + 3])) == 3
+
+
+@pytest.mark.unit
+def test_no_repeat_with_skewed_weights():
+    """Test that a dominant item still can't repeat within the window"""
+    sampler = Sampler("ab", [10_000, 1], no_repeat=1)
+
+    drawn = sampler.draw_many(random.Random(3), 100)
+
+    assert drawn == ["a", "b"] * 50 or drawn == ["b", "a"] * 50
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("items", "weights", "no_repeat"),
+    [
+        ([], None, 0),
+        ("ab", [1], 0),
+        ("ab", [1, -1], 0),
+        ("ab", [0, 0], 0),
+        ("ab", [1, 0], 1),
+        ("ab", None, 2),
+    ],
+)
+def test_invalid_sampler(items, weights, no_repeat):
+    """Test that invalid samplers are rejected"""
+    with pytest.raises(ValueError):
+        Sampler(items, weights, no_repeat)
+
+
+@pytest.mark.unit
+def test_follows_item_changes():
+    """Test that items added or removed after building the sampler are followed"""
+    items = ["a", "b"]
+    sampler = Sampler(items, [1, 0], no_repeat=0)
+    rng = random.Random(2)
+
+    items.append("c")
+    assert set(sampler.draw_many(rng, 200)) == {"a", "c"}
+    del items[1:]
+    assert {sampler.draw(rng) for _ in range(20)} == {"a"}
+    items.clear()
+    with pytest.raises(ValueError):
+        sampler.draw(rng)
+
+
+@pytest.mark.unit
+def test_from_config():
+    """Test building a sampler from configured weights"""
+    sampler = Sampler.from_config(["a", "b", "c"], {"b": 0}, no_repeat=5)
+
+    assert sampler.weights == [1.0, 0.0, 1.0]
+    assert sampler.no_repeat == 1
+
+    with pytest.raises(ValueError):
+        Sampler.from_config(["a"], {"z": 1})
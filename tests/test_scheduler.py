@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Test bsidespgh25/scheduler.py
+"""
+
+import pytest
+
+from bsidespgh25.scheduler import FrameScheduler
+
+
+class FakeClock:
+    """A clock that only moves when slept on or told to"""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_scheduler(period: float) -> tuple[FrameScheduler, FakeClock]:
+    """Create a scheduler on a fake clock"""
+    clock = FakeClock()
+    scheduler = FrameScheduler(period, clock=clock, sleep=clock.sleep)
+    scheduler.start()
+    return scheduler, clock
+
+
+@pytest.mark.unit
+def test_deadlines_absorb_work():
+    """Test that the time spent producing a frame doesn't add to the period"""
+    scheduler, clock = make_scheduler(0.5)
+
+    for work in (0.1, 0.3, 0.0):
+        clock.now += work
+        scheduler.wait()
+
+    assert clock.sleeps == pytest.approx([0.4, 0.2, 0.5])
+    assert clock.now == pytest.approx(101.5)
+    assert scheduler.missed == 0
+
+
+@pytest.mark.unit
+def test_missed_deadlines():
+    """Test that late frames are counted and whole missed periods skipped"""
+    scheduler, clock = make_scheduler(0.5)
+
+    # Ready 0.2s late for the first deadline
+    clock.now += 0.7
+    scheduler.wait()
+    assert scheduler.missed == 1
+    assert scheduler.deadline == pytest.approx(100.5)
+
+    # Ready 0.9s late, skipping a slot instead of bursting to catch up
+    clock.now += 1.2
+    scheduler.wait()
+    assert scheduler.missed == 3
+    assert scheduler.deadline == pytest.approx(101.5)
+
+    scheduler.wait()
+    assert clock.now == pytest.approx(102.0)
+
+
+@pytest.mark.unit
+def test_lateness_before_skipping():
+    """Test that a frame late by whole periods records its full lateness"""
+    scheduler, clock = make_scheduler(1.0)
+
+    clock.now += 3.5
+    scheduler.wait()
+    assert scheduler.missed == 3
+    assert scheduler.get_stats()["jitter_max_ms"] == pytest.approx(2500.0)
+
+
+@pytest.mark.unit
+def test_stats():
+    """Test the pacing statistics"""
+    scheduler, clock = make_scheduler(1.0)
+    assert scheduler.get_stats() == {
+        "frames_scheduled": 0,
+        "missed_deadlines": 0,
+        "jitter_p50_ms": 0.0,
+        "jitter_p95_ms": 0.0,
+        "jitter_p99_ms": 0.0,
+        "jitter_max_ms": 0.0,
+    }
+
+    # Every late frame follows one that was on time
+    for work in [0.5, 1.01] * 9 + [0.5, 1.25] + [0.5] * 80:
+        clock.now += work
+        scheduler.wait()
+
+    stats = scheduler.get_stats()
+    assert stats["frames_scheduled"] == 100
+    assert stats["missed_deadlines"] == 10
+    assert stats["jitter_p50_ms"] == 0.0
+    assert stats["jitter_p95_ms"] == pytest.approx(10.0)
+    assert stats["jitter_max_ms"] == pytest.approx(250.0)
+
+
+@pytest.mark.unit
+def test_zero_period():
+    """Test that a zero period never waits"""
+    scheduler, clock = make_scheduler(0)
+    scheduler.wait()
+
+    assert clock.sleeps == []
+    assert scheduler.get_stats()["missed_deadlines"] == 0
+
+    with pytest.raises(ValueError):
+        FrameScheduler(-1)
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Test bsidespgh25/server.py
+"""
+
+import asyncio
+
+import pytest
+
+from bsidespgh25.output import SEPARATOR
+from bsidespgh25.server import ServerFrame, Subscriber, VibeServer, parse_address
+from bsidespgh25.vibe_generator import VibeGenerator
+
+FRAME_END = f"{SEPARATOR}\n".encode()
+
+
+async def run_client(server: VibeServer, request: bytes, until: bytes) -> bytes:
+    """Connect to the server, optionally send a request, and read until a marker."""
+    reader, writer = await asyncio.open_connection(*server.address)
+    if request:
+        writer.write(request)
+        await writer.drain()
+    data = await asyncio.wait_for(reader.readuntil(until), timeout=5)
+    writer.close()
+    await writer.wait_closed()
+    return data
+
+
+async def with_server(client, **kwargs):
+    """Run a client coroutine against a loopback server."""
+    server = VibeServer(VibeGenerator(seed=1), delay=0.01, **kwargs)
+    await server.start()
+    try:
+        return await client(server), server
+    finally:
+        await server.stop()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("address", "expected"),
+    [("127.0.0.1:8080", ("127.0.0.1", 8080)), (":9000", ("0.0.0.0", 9000))],
+)
+def test_parse_address(address, expected):
+    """Test parse_address() with valid addresses"""
+    assert parse_address(address) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("address", ["localhost", "localhost:http"])
+def test_parse_address_invalid(address):
+    """Test parse_address() rejects invalid addresses"""
+    with pytest.raises(ValueError):
+        parse_address(address)
+
+
+@pytest.mark.unit
+def test_server_frame_encodings():
+    """Test that a frame is encoded for every protocol"""
+    frame = ServerFrame(3, "╔═╗", "✨")
+
+    assert frame.raw.decode("utf-8").startswith("╔═╗")
+    assert frame.http.endswith(frame.raw + b"\r\n")
+    assert b"id: 3\nevent: vibe\ndata: \xe2\x95\x94" in frame.sse
+
+
+@pytest.mark.unit
+def test_subscriber_drops_oldest():
+    """Test that a full subscriber queue drops its oldest frame"""
+
+    async def fill():
+        subscriber = Subscriber(queue_size=2)
+        frames = [ServerFrame(sequence, "art", "msg") for sequence in range(1, 5)]
+        for frame in frames:
+            subscriber.offer(frame)
+        queued = [subscriber.queue.get_nowait().sequence for _ in range(2)]
+        return subscriber.dropped, queued
+
+    assert asyncio.run(fill()) == (2, [3, 4])
+
+
+@pytest.mark.unit
+def test_tcp_client():
+    """Test streaming to a raw TCP client"""
+    data, server = asyncio.run(
+        with_server(lambda server: run_client(server, b"", FRAME_END))
+    )
+
+    assert data.decode("utf-8").endswith(f"{SEPARATOR}\n")
+    assert server.get_stats()["clients_served"] == 1
+
+
+@pytest.mark.unit
+def test_http_client():
+    """Test streaming to a chunked HTTP client"""
+    data, _ = asyncio.run(
+        with_server(
+            lambda server: run_client(server, b"GET / HTTP/1.1\r\n\r\n", FRAME_END)
+        )
+    )
+
+    assert data.startswith(b"HTTP/1.1 200 OK\r\n")
+    assert b"Transfer-Encoding: chunked" in data
+
+
+@pytest.mark.unit
+def test_sse_client():
+    """Test streaming server-sent events"""
+    data, _ = asyncio.run(
+        with_server(
+            lambda server: run_client(
+                server,
+                b"GET /events HTTP/1.1\r\nAccept: text/event-stream\r\n\r\n",
+                b"\n\n\r\n",
+            )
+        )
+    )
+
+    assert b"Content-Type: text/event-stream" in data
+    assert b"event: vibe\ndata: " in data
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "request_line", [b"GET /nope HTTP/1.1\r\n", b"GET \r\n", b"GET  \r\n"]
+)
+def test_unknown_http_path(request_line):
+    """Test that unknown or missing HTTP paths get a 404 and the connection closed"""
+
+    async def client(server: VibeServer) -> bytes:
+        reader, writer = await asyncio.open_connection(*server.address)
+        writer.write(request_line + b"\r\n")
+        await writer.drain()
+        # Reading to the end only returns once the server closes the connection
+        data = await asyncio.wait_for(reader.read(), timeout=5)
+        writer.close()
+        await writer.wait_closed()
+        return data
+
+    data, _ = asyncio.run(with_server(client))
+
+    assert data.startswith(b"HTTP/1.1 404")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "request_head",
+    [
+        b"GET / HTTP/1.1\r\nX-Long: " + b"a" * 100_000 + b"\r\n\r\n",
+        b"GET / HTTP/1.1\r\n" + b"X-Many: 1\r\n" * 1000 + b"\r\n",
+        b"GET / HTTP/1.1\r\nHost: slow\r\n",
+    ],
+    ids=["long", "many", "slow"],
+)
+def test_bad_http_request(monkeypatch, request_head):
+    """Test that overlong, endless or slow headers get a 400 and the connection closed"""
+    monkeypatch.setattr("bsidespgh25.server.HEADER_TIMEOUT", 0.1)
+
+    async def client(server: VibeServer) -> bytes:
+        reader, writer = await asyncio.open_connection(*server.address)
+        writer.write(request_head)
+        await writer.drain()
+        data = await asyncio.wait_for(reader.read(), timeout=5)
+        writer.close()
+        await writer.wait_closed()
+        return data
+
+    data, server = asyncio.run(with_server(client))
+
+    assert data.startswith(b"HTTP/1.1 400")
+    assert server.clients_served == 0
+
+
+@pytest.mark.unit
+def test_frames_are_shared_between_clients():
+    """Test that one published frame reaches every client byte for byte"""
+
+    async def broadcast():
+        server = VibeServer(VibeGenerator(seed=1))
+        await server.start(produce=False)
+        try:
+            clients = [
+                asyncio.create_task(run_client(server, b"", FRAME_END))
+                for _ in range(5)
+            ]
+            while len(server.subscribers) < 5:
+                await asyncio.sleep(0.01)
+            frame = server.publish("╬═╬", "✨ shared ✨")
+            return frame, await asyncio.gather(*clients), server.get_stats()
+        finally:
+            await server.stop()
+
+    frame, received, stats = asyncio.run(broadcast())
+
+    assert received == [frame.raw] * 5
+    assert stats["frames_published"] == 1
+    assert stats["clients_served"] == 5
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test bsidespgh25/stats.py
+"""
+
+import threading
+
+import pytest
+
+from bsidespgh25.stats import VibeStats
+
+
+@pytest.mark.unit
+def test_record_and_snapshot():
+    """Test recording vibes and bytes and reading them back"""
+    stats = VibeStats()
+    stats.record_vibe("matrix", 3)
+    stats.record_vibe("word")
+    stats.record_bytes(100)
+
+    snapshot = stats.snapshot()
+    assert snapshot["vibes"] == 4
+    assert snapshot["by_type"] == {"matrix": 3, "word": 1}
+    assert snapshot["bytes_emitted"] == 100
+    assert snapshot["vibes_per_second"] > 0
+    assert snapshot["bytes_per_second"] > 0
+
+
+@pytest.mark.unit
+def test_counters_are_per_thread():
+    """Test that each thread gets its own counter and reads merge them"""
+    stats = VibeStats()
+    barrier = threading.Barrier(4)
+
+    def record():
+        barrier.wait()
+        for _ in range(1000):
+            stats.record_vibe("pattern")
+
+    threads = [threading.Thread(target=record) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Finished threads' counters are folded into the shared totals
+    assert len(stats._counters) == 0
+    assert stats.total_vibes() == 4000
+
+
+@pytest.mark.unit
+def test_short_lived_threads():
+    """Test that short-lived threads don't leave counters behind"""
+    stats = VibeStats()
+    stats.record_vibe("word")
+    live = threading.Event()
+    done = threading.Event()
+
+    def record():
+        stats.record_vibe("pattern", 2)
+        live.set()
+        done.wait()
+
+    for _ in range(50):
+        thread = threading.Thread(target=record)
+        thread.start()
+        thread.join()
+    # A running thread's counter is read while it is still counting
+    live.clear()
+    running = threading.Thread(target=record)
+    running.start()
+    live.wait()
+
+    assert len(stats._counters) == 2
+    assert stats.vibes_by_type() == {"word": 1, "pattern": 102}
+    done.set()
+    running.join()
+    assert stats.vibes_by_type() == {"word": 1, "pattern": 102}
+
+
+@pytest.mark.unit
+def test_merge():
+    """Test merging counters gathered elsewhere"""
+    stats = VibeStats()
+    stats.record_vibe("word")
+
+    other = VibeStats()
+    other.record_vibe("word", 2)
+    other.increment("word_art_cache_hits", 5)
+    stats.merge(other.counts())
+
+    assert stats.counts() == {"vibes.word": 3, "word_art_cache_hits": 5}
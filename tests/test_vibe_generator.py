@@ -2,8 +2,12 @@
 Tests for the vibe generator module.
 """
 
+import random
+import threading
+
 import pytest
 
+from bsidespgh25.frame import Frame
 from bsidespgh25.vibe_generator import VibeGenerator
 
 
@@ -40,6 +44,78 @@ class TestVibeGenerator:
         assert len(lines) == 5
         assert all(len(line) == 20 for line in lines)
 
+    def test_generate_cyber_matrix_batch(self):
+        """Test batched cyber matrix generation."""
+        vibe_gen = VibeGenerator()
+
+        frames = vibe_gen.generate_cyber_matrix_batch(3, width=15, height=4)
+        assert len(frames) == 3
+        for frame in frames:
+            lines = frame.split("\n")
+            assert len(lines) == 4
+            assert all(len(line) == 15 for line in lines)
+            assert set(frame) <= set(vibe_gen.MATRIX_CHARS) | {"\n"}
+
+        assert vibe_gen.generate_cyber_matrix_batch(0, width=15, height=4) == []
+
+    def test_generate_cyber_matrix_distribution(self):
+        """Test that every matrix glyph can be drawn."""
+        vibe_gen = VibeGenerator()
+        frame = vibe_gen.generate_cyber_matrix_batch(1, width=100, height=20)[0]
+
+        assert set(frame.replace("\n", "")) == set(vibe_gen.MATRIX_CHARS)
+
+    def test_resize_matrix(self):
+        """Test changing the default matrix size."""
+        vibe_gen = VibeGenerator(matrix_size=(12, 3))
+        lines = vibe_gen.generate_cyber_matrix().split("\n")
+        assert [len(line) for line in lines] == [12] * 3
+
+        vibe_gen.resize_matrix(5, 2)
+        lines = vibe_gen.generate_cyber_matrix().split("\n")
+        assert [len(line) for line in lines] == [5] * 2
+        # Explicit sizes still win
+        assert len(vibe_gen.generate_cyber_matrix(width=3, height=1)) == 3
+
+        with pytest.raises(ValueError):
+            vibe_gen.resize_matrix(-1, 2)
+
+    def test_matrix_frames(self):
+        """Test bulk and streaming matrix frames."""
+        vibe_gen = VibeGenerator(seed=3, matrix_size=(6, 2))
+
+        frames = vibe_gen.generate_matrix_frames(3)
+        assert len(frames) == 3
+        assert all(len(line) == 6 for line in str(frames[0]).split("\n"))
+        assert bytes(frames[1]) == str(frames[1]).encode()
+        assert vibe_gen.generate_matrix_frames(0) == []
+
+        stream = vibe_gen.iter_matrix_frames(width=4, height=4)
+        assert [
+            (frame.width, frame.height) for frame in (next(stream), next(stream))
+        ] == [
+            (4, 4),
+            (4, 4),
+        ]
+        assert vibe_gen.get_stats()["matrix_vibes"] == 5
+
+        # Frames draw the same random stream as text matrices
+        text = VibeGenerator(seed=3).generate_cyber_matrix(5, 5)
+        assert str(VibeGenerator(seed=3).generate_matrix_frames(1, 5, 5)[0]) == text
+
+    def test_generate_banner(self):
+        """Test big-letter banner generation."""
+        vibe_gen = VibeGenerator(seed=1)
+
+        banner = vibe_gen.generate_banner("hack")
+        assert banner.count("\n") == 6
+        assert "█" in banner
+        assert vibe_gen.generate_art("banner") != banner
+
+        vibe_gen = VibeGenerator(banner_text="hack")
+        assert vibe_gen.generate_art("banner") == banner
+        assert vibe_gen.get_stats()["banner_vibes"] == 1
+
     def test_generate_word_art(self):
         """Test word art generation."""
         vibe_gen = VibeGenerator()
@@ -55,6 +131,55 @@ class TestVibeGenerator:
         contains_word = any(word in word_art for word in vibe_gen.CYBER_WORDS)
         assert contains_word
 
+    def test_cyber_words_extended_at_runtime(self, monkeypatch):
+        """Test that words appended to CYBER_WORDS are drawn without errors."""
+        words = list(VibeGenerator.CYBER_WORDS)
+        monkeypatch.setattr(VibeGenerator, "CYBER_WORDS", words)
+        vibe_gen = VibeGenerator(seed=1)
+
+        words.append("ZEROTRUST")
+        arts = [vibe_gen.generate_word_art() for _ in range(200)]
+        assert any("ZEROTRUST" in art for art in arts)
+        assert any("ZEROTRUST" in art for art, _ in vibe_gen.iter_vibes(200, "word"))
+
+    def test_cyber_words_replaced_at_runtime(self, monkeypatch):
+        """Test that a CYBER_WORDS list assigned on the class is drawn from."""
+        vibe_gen = VibeGenerator(seed=1)
+
+        monkeypatch.setattr(VibeGenerator, "CYBER_WORDS", ["ZEROTRUST"])
+        assert "ZEROTRUST" in vibe_gen.generate_word_art()
+        assert vibe_gen.get_stats()["cyber_words_available"] == 1
+
+    def test_generate_word_art_cache(self):
+        """Test that word art is rendered once per word and then cached."""
+        vibe_gen = VibeGenerator()
+        vibe_gen.CYBER_WORDS = ["HACK"]
+
+        first = vibe_gen.generate_word_art()
+        second = vibe_gen.generate_word_art()
+
+        assert first is second
+        assert first == VibeGenerator.render_word_art("HACK")
+        stats = vibe_gen.get_stats()
+        assert stats["word_art_cache_misses"] == 1
+        assert stats["word_art_cache_hits"] == 1
+
+        # Extending the word list renders the new word rather than serving stale art
+        vibe_gen.CYBER_WORDS = ["PATCH"]
+        assert "PATCH" in vibe_gen.generate_word_art()
+        assert vibe_gen.get_stats()["word_art_cache_misses"] == 2
+
+    def test_generate_word_art_cache_is_bounded(self):
+        """Test that the word art cache evicts the oldest entries."""
+        vibe_gen = VibeGenerator()
+        vibe_gen.WORD_ART_CACHE_SIZE = 2
+
+        for word in ["HACK", "PATCH", "AUDIT"]:
+            vibe_gen.CYBER_WORDS = [word]
+            vibe_gen.generate_word_art()
+
+        assert list(vibe_gen._word_art_cache) == ["PATCH", "AUDIT"]
+
     def test_get_vibe_message(self):
         """Test vibe message retrieval."""
         vibe_gen = VibeGenerator()
@@ -87,6 +212,135 @@ class TestVibeGenerator:
             vibe_gen.generate_full_vibe()
             assert vibe_gen.vibe_count == i + 1
 
+    def test_iter_vibes(self):
+        """Test lazily generating a fixed number of vibes."""
+        vibe_gen = VibeGenerator()
+
+        vibes = list(vibe_gen.iter_vibes(count=25, batch_size=10))
+
+        assert len(vibes) == 25
+        assert vibe_gen.vibe_count == 25
+        for art, message in vibes:
+            assert isinstance(art, str)
+            assert message in vibe_gen.VIBE_MESSAGES
+
+    @pytest.mark.parametrize("vibe_type", ["pattern", "matrix", "word"])
+    def test_iter_vibes_by_type(self, vibe_type):
+        """Test that iter_vibes honors the requested vibe type."""
+        vibe_gen = VibeGenerator()
+
+        for art, _ in vibe_gen.iter_vibes(count=5, vibe_type=vibe_type):
+            if vibe_type == "pattern":
+                assert art in vibe_gen.ASCII_PATTERNS
+            elif vibe_type == "matrix":
+                assert len(art.split("\n")) == 10
+            else:
+                assert "┌" in art
+
+    def test_iter_vibes_frames(self):
+        """Test that iter_vibes can yield matrices as frames."""
+        vibes = list(VibeGenerator(seed=4).iter_vibes(count=40, batch_size=8))
+        framed = list(
+            VibeGenerator(seed=4).iter_vibes(count=40, batch_size=8, frames=True)
+        )
+
+        assert any(isinstance(art, Frame) for art, _ in framed)
+        assert all(isinstance(art, (str, Frame)) for art, _ in framed)
+        assert [(str(art), message) for art, message in framed] == vibes
+
+    def test_iter_vibes_unbounded(self):
+        """Test that iter_vibes without a count keeps generating."""
+        vibe_gen = VibeGenerator()
+        vibes = vibe_gen.iter_vibes(batch_size=2)
+
+        assert len([next(vibes) for _ in range(7)]) == 7
+
+    def test_iter_vibes_invalid_arguments(self):
+        """Test that iter_vibes rejects invalid arguments."""
+        vibe_gen = VibeGenerator()
+
+        with pytest.raises(ValueError):
+            next(vibe_gen.iter_vibes(vibe_type="invalid"))
+        with pytest.raises(ValueError):
+            next(vibe_gen.iter_vibes(batch_size=0))
+
+    def test_iter_encoded_vibes(self):
+        """Test that encoded vibes are the same vibes as text ones, as UTF-8."""
+        vibes = list(VibeGenerator(seed=7).iter_vibes(count=50, batch_size=8))
+        vibe_gen = VibeGenerator(seed=7)
+
+        encoded = list(vibe_gen.iter_encoded_vibes(count=50, batch_size=8))
+        assert encoded == [(art.encode(), message.encode()) for art, message in vibes]
+        assert vibe_gen.vibe_count == 50
+        with pytest.raises(ValueError):
+            next(vibe_gen.iter_encoded_vibes(vibe_type="invalid"))
+
+    def test_iter_typed_vibes(self):
+        """Test that typed vibes are the same vibes along with their art types."""
+        vibes = list(VibeGenerator(seed=7).iter_vibes(count=30, batch_size=8))
+
+        typed = list(VibeGenerator(seed=7).iter_typed_vibes(count=30, batch_size=8))
+        assert [(art, message) for _, art, message in typed] == vibes
+        for art_type, art, _ in typed:
+            if art_type == "word":
+                assert "┌" in art
+        assert {art_type for art_type, _, _ in typed} <= set(VibeGenerator.ART_TYPES)
+
+    @pytest.mark.parametrize("vibe_type", ["random", "pattern", "matrix", "word"])
+    def test_generate_encoded_vibe(self, vibe_type):
+        """Test generating a single vibe encoded as UTF-8."""
+        vibe_gen = VibeGenerator(seed=5)
+
+        art, message = vibe_gen.generate_encoded_vibe(vibe_type)
+        assert message.decode() in vibe_gen.VIBE_MESSAGES
+        if vibe_type == "matrix":
+            assert len(art.decode().split("\n")) == 10
+        assert vibe_gen.vibe_count == 1
+        with pytest.raises(ValueError):
+            vibe_gen.generate_encoded_vibe("invalid")
+
+    def test_encode_static(self):
+        """Test that static text is encoded once and the cache stays bounded."""
+        vibe_gen = VibeGenerator()
+        vibe_gen.ENCODED_CACHE_SIZE = 2
+
+        encoded = vibe_gen.encode_static("✨ vibes ✨")
+        assert encoded == "✨ vibes ✨".encode()
+        assert vibe_gen.encode_static("✨ vibes ✨") is encoded
+        vibe_gen.encode_static("a")
+        vibe_gen.encode_static("b")
+        assert list(vibe_gen._encoded_cache) == ["a", "b"]
+
+    def test_seeded_generators_are_reproducible(self):
+        """Test that the same seed replays the same vibes."""
+        first = VibeGenerator(seed=42)
+        second = VibeGenerator(seed=42)
+
+        assert list(first.iter_vibes(count=20)) == list(second.iter_vibes(count=20))
+        assert first.generate_full_vibe() == second.generate_full_vibe()
+
+    def test_generators_have_independent_streams(self):
+        """Test that each generator owns its random stream."""
+        vibe_gen = VibeGenerator(seed=42)
+        expected = VibeGenerator(seed=42).generate_cyber_matrix()
+
+        # Drawing from the global or another generator's stream has no effect
+        VibeGenerator(seed=42).generate_cyber_matrix()
+        random.random()
+
+        assert vibe_gen.generate_cyber_matrix() == expected
+
+    def test_spawn(self):
+        """Test spawning independent, reproducible sub-streams."""
+        children = VibeGenerator(seed=7).spawn(3)
+
+        assert len({child.seed for child in children}) == 3
+        assert [child.seed for child in children] == [
+            child.seed for child in VibeGenerator(seed=7).spawn(3)
+        ]
+        matrices = {child.generate_cyber_matrix() for child in children}
+        assert len(matrices) == 3
+
     def test_get_stats(self):
         """Test statistics retrieval."""
         vibe_gen = VibeGenerator()
@@ -105,6 +359,40 @@ class TestVibeGenerator:
         stats = vibe_gen.get_stats()
         assert stats["vibes_generated"] == 2
 
+    def test_get_stats_counts_every_vibe_type(self):
+        """Test that every generation method is counted by type."""
+        vibe_gen = VibeGenerator()
+
+        vibe_gen.generate_random_pattern()
+        vibe_gen.generate_cyber_matrix()
+        vibe_gen.generate_cyber_matrix_batch(3)
+        vibe_gen.generate_word_art()
+        list(vibe_gen.iter_vibes(count=4, vibe_type="pattern"))
+
+        stats = vibe_gen.get_stats()
+        assert stats["vibes_generated"] == 10
+        assert stats["pattern_vibes"] == 5
+        assert stats["matrix_vibes"] == 4
+        assert stats["word_vibes"] == 1
+        assert stats["vibes_per_second"] > 0
+
+    def test_get_stats_across_threads(self):
+        """Test that vibes generated on several threads are all counted."""
+        vibe_gen = VibeGenerator()
+
+        def generate():
+            for _ in range(200):
+                vibe_gen.generate_word_art()
+
+        threads = [threading.Thread(target=generate) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert vibe_gen.get_stats()["word_vibes"] == 800
+        assert vibe_gen.vibe_count == 800
+
     def test_ascii_patterns_are_valid(self):
         """Test that all ASCII patterns are valid strings."""
         vibe_gen = VibeGenerator()
@@ -144,3 +432,41 @@ class TestVibeGenerator:
         # At least some should be different
         unique_vibes = set(vibes)
         assert len(unique_vibes) > 1
+
+    def test_no_repeat(self):
+        """Test that no_repeat keeps recent messages and words from repeating."""
+        vibe_gen = VibeGenerator(seed=4, no_repeat=3)
+
+        messages = [vibe_gen.get_vibe_message() for _ in range(200)]
+        messages += [message for _, message in vibe_gen.iter_vibes(200)]
+        for start in range(len(messages) - 3):
+            assert len(set(messages[start : start + 4])) == 4
+
+        # Only three patterns exist, so the window shrinks to fit
+        assert vibe_gen.pattern_sampler.no_repeat == 2
+
+    def test_weights(self):
+        """Test that configured weights steer every selection."""
+        weights = {
+            "art_types": {"pattern": 0, "matrix": 0},
+            "words": {"HACK": 1000},
+            "messages": [1, 0, 0, 0, 0, 0, 0, 0],
+        }
+        vibe_gen = VibeGenerator(seed=4, weights=weights)
+
+        vibes = list(vibe_gen.iter_vibes(50))
+
+        assert {message for _, message in vibes} == {VibeGenerator.VIBE_MESSAGES[0]}
+        assert vibe_gen.get_stats()["word_vibes"] == 50
+        assert sum("HACK" in art for art, _ in vibes) > 40
+        # The shared registry is left alone
+        assert VibeGenerator().registry.weight("pattern") == 1
+
+    @pytest.mark.parametrize(
+        "weights",
+        [{"art_types": {"glider": 1}}, {"words": {"NOPE": 1}}, {"messages": [1, 2]}],
+    )
+    def test_invalid_weights(self, weights):
+        """Test that weights for unknown items are rejected."""
+        with pytest.raises(ValueError):
+            VibeGenerator(weights=weights)
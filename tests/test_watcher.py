@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test bsidespgh25/watcher.py
+"""
+
+import sys
+import threading
+
+import pytest
+
+from bsidespgh25.content import load_content_pack
+from bsidespgh25.vibe_generator import VibeGenerator
+from bsidespgh25.watcher import ContentWatcher, watch_content, watch_paths
+
+
+@pytest.fixture
+def pack(tmp_path, monkeypatch):
+    """A content pack file, with its cache kept in the test directory"""
+    monkeypatch.setenv("BSIDESPGH25_CACHE_DIR", str(tmp_path / "cache"))
+    path = tmp_path / "pack.json"
+    path.write_text('{"messages": ["Morning vibes"]}')
+    return path
+
+
+@pytest.mark.unit
+def test_watch_paths(tmp_path, pack):
+    """Test that pack files are watched through their directory"""
+    (tmp_path / "patterns").mkdir()
+
+    assert watch_paths(pack) == [tmp_path]
+    assert watch_paths(tmp_path) == [tmp_path, tmp_path / "patterns"]
+
+
+@pytest.mark.unit
+def test_check_only_calls_back_on_change(pack):
+    """Test that the callback only runs when the pack changes"""
+    changes = []
+    watcher = ContentWatcher(pack, lambda: changes.append(pack.read_text()))
+
+    assert not watcher.check()
+    pack.write_text('{"messages": ["Afternoon vibes"]}')
+    assert watcher.check()
+    assert not watcher.check()
+
+    assert changes == ['{"messages": ["Afternoon vibes"]}']
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "use_inotify",
+    [
+        pytest.param(
+            True,
+            marks=pytest.mark.skipif(
+                not sys.platform.startswith("linux"), reason="inotify is Linux only"
+            ),
+        ),
+        False,
+    ],
+)
+def test_watcher_thread(pack, use_inotify):
+    """Test that the watcher thread notices changes"""
+    changed = threading.Event()
+    watcher = ContentWatcher(
+        pack, changed.set, poll_interval=0.01, settle=0.01, use_inotify=use_inotify
+    )
+
+    with watcher:
+        assert watcher.backend == ("inotify" if use_inotify else "polling")
+        pack.write_text('{"messages": ["Afternoon vibes"]}')
+        assert changed.wait(5)
+
+
+@pytest.mark.unit
+def test_watch_content_swaps_between_vibes(pack):
+    """Test that reloaded content is only used once swapped in"""
+    vibe_gen = VibeGenerator(seed=1, content=load_content_pack(pack))
+    watcher = watch_content(vibe_gen, pack)
+
+    pack.write_text('{"messages": ["Afternoon vibes"]}')
+    assert watcher.check()
+    assert vibe_gen.get_vibe_message() == "Morning vibes"
+
+    assert vibe_gen.swap_content()
+    assert not vibe_gen.swap_content()
+    assert vibe_gen.get_vibe_message() == "Afternoon vibes"
+    assert vibe_gen.get_stats()["content_reloads"] == 1
+
+
+@pytest.mark.unit
+def test_watch_content_keeps_content_on_error(pack):
+    """Test that a broken edit keeps the current content"""
+    vibe_gen = VibeGenerator(seed=1, content=load_content_pack(pack))
+    watcher = watch_content(vibe_gen, pack)
+
+    pack.write_text('{"messages": []}')
+    assert watcher.check()
+
+    assert not vibe_gen.swap_content()
+    assert vibe_gen.get_vibe_message() == "Morning vibes"